@@ -36,6 +36,9 @@ async function initDatabase() {
         
         await pool.query(`CREATE INDEX IF NOT EXISTS idx_questions_category ON questions(category)`);
         await pool.query(`CREATE UNIQUE INDEX IF NOT EXISTS idx_questions_text_category ON questions(md5(question_text), category)`);
+        // Kanonik YDS kategorisi (alias'lar ingest sırasında çözülür: scripts/migration/add_yds_category.py)
+        await pool.query(`ALTER TABLE questions ADD COLUMN IF NOT EXISTS yds_category VARCHAR(100)`);
+        await pool.query(`CREATE INDEX IF NOT EXISTS idx_questions_yds_category ON questions(yds_category)`);
         
         // ==================== USERS ====================
         await pool.query(`
@@ -15,16 +15,18 @@ Gerçek YDS Sınav Dağılımı (80 soru):
 - Yakın Anlam (Eş Anlam): 5 soru
 """
 
-import json
+import argparse
 import os
 import sys
+import time
 from datetime import datetime
-import random
 
 sys.stdout.reconfigure(line_buffering=True)
 
-from scripts.db_utils import get_db_connection, execute_query
-from scripts.constants import YDS_FULL_DISTRIBUTION, CATEGORY_ALIASES
+from scripts import jsonio
+from scripts.db_utils import get_category_stats
+from scripts.constants import YDS_FULL_DISTRIBUTION, CATEGORY_ALIASES, CATEGORY_TO_YDS
+from scripts.analysis.question_sampler import QuestionSampler
 
 
 def analyze_database():
@@ -33,62 +35,42 @@ def analyze_database():
     print("📊 Database Soru Analizi")
     print("="*60)
     
-    with get_db_connection(use_dict_cursor=True) as conn:
-        cur = conn.cursor()
-        
-        cur.execute("""
-            SELECT category, COUNT(*) as count
-            FROM questions
-            GROUP BY category
-            ORDER BY count DESC
-        """)
-        
-        categories = cur.fetchall()
-        total = sum(c['count'] for c in categories)
-        
-        print(f"\n📦 Toplam Soru: {total}")
-        print("\n📂 Kategoriler:")
-        print("-"*50)
-        
-        category_map = {}
-        for cat in categories:
-            print(f"   {cat['category']}: {cat['count']} soru")
-            category_map[cat['category']] = cat['count']
-        
-        cur.execute("""
-            SELECT category, COUNT(*) as count
-            FROM questions
-            WHERE correct_answer IS NULL OR correct_answer = ''
-            GROUP BY category
-        """)
-        
-        missing_answers = cur.fetchall()
-        if missing_answers:
-            print("\n⚠️ Doğru Cevabı Olmayan Sorular:")
-            for ma in missing_answers:
-                print(f"   {ma['category']}: {ma['count']} soru")
-        
-        cur.close()
+    # Sayımlar question_category_stats tablosundan (tam tarama yok)
+    categories = get_category_stats()
+    total = sum(c['count'] for c in categories)
+    
+    print(f"\n📦 Toplam Soru: {total}")
+    print("\n📂 Kategoriler:")
+    print("-"*50)
+    
+    category_map = {}
+    for cat in categories:
+        print(f"   {cat['category']}: {cat['count']} soru")
+        category_map[cat['category']] = cat['count']
+    
+    missing_answers = [c for c in categories if c['count'] > c['with_answer']]
+    if missing_answers:
+        print("\n⚠️ Doğru Cevabı Olmayan Sorular:")
+        for ma in missing_answers:
+            print(f"   {ma['category']}: {ma['count'] - ma['with_answer']} soru")
     
     return category_map
 
 
 def map_categories_to_yds(db_categories):
     """Database kategorilerini YDS dağılımına eşle"""
-    mapped = {}
-    
-    for yds_cat, aliases in CATEGORY_ALIASES.items():
-        mapped[yds_cat] = []
-        for alias in aliases:
-            if alias in db_categories:
-                mapped[yds_cat].append(alias)
+    mapped = {yds_cat: [] for yds_cat in CATEGORY_ALIASES}
+    unmapped = set()
+    
+    # Ters alias haritasıyla tek geçişte eşle
+    for db_cat in db_categories:
+        yds_cat = CATEGORY_TO_YDS.get(db_cat)
+        if yds_cat:
+            mapped[yds_cat].append(db_cat)
+        else:
+            unmapped.add(db_cat)
     
     # Eşlenemeyen kategorileri göster
-    all_mapped = set()
-    for cats in mapped.values():
-        all_mapped.update(cats)
-    
-    unmapped = set(db_categories.keys()) - all_mapped
     if unmapped:
         print("\n⚠️ Eşlenemeyen Kategoriler:")
         for cat in unmapped:
@@ -97,23 +79,19 @@ def map_categories_to_yds(db_categories):
     return mapped
 
 
-def create_quiz_preset(size: str, conn) -> dict:
+PRESET_SIZES = {
+    'mini': (20, 0.25),
+    'medium': (40, 0.5),
+    'full': (80, 1.0),
+}
+
+
+def preset_distribution(size: str) -> tuple:
     """
-    Belirtilen boyutta quiz preset oluştur
+    Boyuta göre hedef soru sayısı ve YDS kategori dağılımı
     size: 'mini' (20), 'medium' (40), 'full' (80)
     """
-    cur = conn.cursor()
-    
-    # Boyuta göre soru sayısı
-    if size == 'mini':
-        total_questions = 20
-        multiplier = 0.25
-    elif size == 'medium':
-        total_questions = 40
-        multiplier = 0.5
-    else:  # full
-        total_questions = 80
-        multiplier = 1.0
+    total_questions, multiplier = PRESET_SIZES.get(size, PRESET_SIZES['full'])
     
     # YDS dağılımını uygula
     distribution = {}
@@ -128,112 +106,82 @@ def create_quiz_preset(size: str, conn) -> dict:
         max_cat = max(distribution, key=distribution.get)
         distribution[max_cat] += diff
     
-    questions = []
+    return total_questions, distribution
+
+
+def create_quiz_preset(size: str, sampler: QuestionSampler) -> dict:
+    """
+    Belirtilen boyutta quiz preset oluştur (bellek içi örnekleme)
+    size: 'mini' (20), 'medium' (40), 'full' (80)
+    """
+    total_questions, distribution = preset_distribution(size)
+    
+    question_ids = []
     actual_distribution = {}
     
     # Her kategori için soruları al
     for yds_cat, needed in distribution.items():
-        aliases = CATEGORY_ALIASES.get(yds_cat, [yds_cat])
-        
-        # Tüm alias'lardan soruları al
-        placeholders = ','.join(['%s'] * len(aliases))
-        cur.execute(f"""
-            SELECT id, question_text, options, correct_answer, category
-            FROM questions
-            WHERE category IN ({placeholders})
-            AND correct_answer IS NOT NULL 
-            AND correct_answer != ''
-            ORDER BY RANDOM()
-            LIMIT %s
-        """, aliases + [needed])
-        
-        cat_questions = cur.fetchall()
-        
-        if cat_questions:
-            questions.extend(cat_questions)
-            actual_distribution[yds_cat] = len(cat_questions)
-        else:
-            actual_distribution[yds_cat] = 0
+        picked = sampler.sample(yds_cat, needed)
+        question_ids.extend(picked.tolist())
+        actual_distribution[yds_cat] = len(picked)
     
     # Eksik soruları diğer kategorilerden tamamla
-    if len(questions) < total_questions:
-        needed = total_questions - len(questions)
-        existing_ids = [q['id'] for q in questions]
-        
-        if existing_ids:
-            placeholders = ','.join(['%s'] * len(existing_ids))
-            cur.execute(f"""
-                SELECT id, question_text, options, correct_answer, category
-                FROM questions
-                WHERE id NOT IN ({placeholders})
-                AND correct_answer IS NOT NULL 
-                AND correct_answer != ''
-                ORDER BY RANDOM()
-                LIMIT %s
-            """, existing_ids + [needed])
-        else:
-            cur.execute("""
-                SELECT id, question_text, options, correct_answer, category
-                FROM questions
-                WHERE correct_answer IS NOT NULL 
-                AND correct_answer != ''
-                ORDER BY RANDOM()
-                LIMIT %s
-            """, [needed])
-        
-        extra = cur.fetchall()
-        questions.extend(extra)
-    
-    cur.close()
+    if len(question_ids) < total_questions:
+        needed = total_questions - len(question_ids)
+        extra = sampler.sample_any(needed, exclude=question_ids)
+        question_ids.extend(extra.tolist())
     
     # Soruları karıştır
-    random.shuffle(questions)
+    question_ids = sampler.shuffle(question_ids)
     
     return {
         'size': size,
-        'total_questions': len(questions),
+        'total_questions': len(question_ids),
         'target_questions': total_questions,
         'distribution': actual_distribution,
-        'questions': questions
+        'question_ids': question_ids
     }
 
 
-def generate_quiz_presets_json():
+def generate_quiz_presets_json(seed: int = None):
     """Quiz presetlerini JSON dosyasına kaydet"""
     print("\n" + "="*60)
     print("🎯 Quiz Presetleri Oluşturuluyor")
     print("="*60)
     
-    with get_db_connection(use_dict_cursor=True) as conn:
-        presets = {}
+    # Soru havuzları tek sorguyla yüklenir, örnekleme bellekte yapılır
+    start = time.time()
+    sampler = QuestionSampler.from_database(seed=seed)
+    print(f"\n📥 {sampler.eligible_ids.size} uygun soru yüklendi ({time.time() - start:.2f}sn)")
+    
+    presets = {}
+    
+    for size, name in [('mini', 'Mini Quiz (20)'), ('medium', 'Orta Quiz (40)'), ('full', 'Tam YDS (80)')]:
+        print(f"\n📝 {name} oluşturuluyor...")
+        preset = create_quiz_preset(size, sampler)
         
-        for size, name in [('mini', 'Mini Quiz (20)'), ('medium', 'Orta Quiz (40)'), ('full', 'Tam YDS (80)')]:
-            print(f"\n📝 {name} oluşturuluyor...")
-            preset = create_quiz_preset(size, conn)
-            
-            print(f"   Hedef: {preset['target_questions']}, Elde edilen: {preset['total_questions']}")
-            print("   Dağılım:")
-            for cat, count in preset['distribution'].items():
-                if count > 0:
-                    print(f"      - {cat}: {count}")
-            
-            presets[size] = {
-                'name': name,
-                'question_ids': [q['id'] for q in preset['questions']],
-                'distribution': preset['distribution']
-            }
+        print(f"   Hedef: {preset['target_questions']}, Elde edilen: {preset['total_questions']}")
+        print("   Dağılım:")
+        for cat, count in preset['distribution'].items():
+            if count > 0:
+                print(f"      - {cat}: {count}")
+        
+        presets[size] = {
+            'name': name,
+            'question_ids': preset['question_ids'],
+            'distribution': preset['distribution']
+        }
     
     # JSON dosyasına kaydet
     output_path = 'quiz_presets.json'
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(presets, f, ensure_ascii=False, indent=2)
+    jsonio.dump(presets, output_path)
     
     print(f"\n✅ Presetler kaydedildi: {output_path}")
     
     return presets
 
 
-def main():
+def main(seed: int = None):
     print("="*60)
     print("🚀 YDS Quiz Preset Oluşturucu")
     print(f"   Tarih: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
@@ -252,7 +200,7 @@ def main():
             print(f"   {yds_cat} ← {', '.join(db_cats)}")
     
     # 3. Quiz presetleri oluştur
-    presets = generate_quiz_presets_json()
+    presets = generate_quiz_presets_json(seed=seed)
     
     print("\n" + "="*60)
     print("✅ İŞLEM TAMAMLANDI")
@@ -262,4 +210,8 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="YDS quiz preset oluşturucu")
+    parser.add_argument("--seed", type=int, default=None, help="Tekrarlanabilir örnekleme için seed")
+    
+    args = parser.parse_args()
+    main(seed=args.seed)
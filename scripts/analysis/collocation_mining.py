@@ -0,0 +1,335 @@
+"""
+Collocation Madenciliği (PMI / Log-Likelihood)
+
+english_phrases.py elle derlenmiş bir sözlük; içinde olmayan ifadeler frekans
+analizinde ayrı unigram'lar olarak sayılır. Bu script tüm korpustan bigram ve
+trigram sayım matrislerini (SciPy sparse) kurar, adayları PMI ve Dunning
+log-likelihood (G²) ile vektörel olarak puanlar ve sözlükte OLMAYAN adayları
+sıralı olarak yazar.
+
+Trigram'lar (w1 w2) + w3 ilişkisi olarak puanlanır: satırlar bigram çiftleri,
+sütunlar üçüncü kelimedir.
+
+Kullanım:
+    python -m scripts.analysis.collocation_mining
+    python -m scripts.analysis.collocation_mining --category "YDS Gramer"
+    python -m scripts.analysis.collocation_mining --min-count 10 --top 300 --sort pmi
+
+Çıktı:
+    collocation_candidates.json
+"""
+
+import argparse
+import time
+from datetime import datetime
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+from scipy import sparse
+
+from scripts import jsonio
+from scripts.analysis.word_frequency_analysis import clean_text, fetch_questions, question_texts
+from scripts.english_phrases import get_all_phrases, get_stop_words
+
+# Aday ifadenin başında/sonunda anlamsız kalan kelimeler.
+# Edatlar bilerek yok: "account for", "in spite of" gibi ifadeler bulunabilsin.
+EDGE_BLOCKLIST = frozenset({
+    "a", "an", "the", "this", "that", "these", "those",
+    "my", "your", "his", "her", "its", "our", "their",
+    "i", "me", "we", "us", "you", "he", "him", "she", "it", "they", "them",
+    "am", "is", "are", "was", "were", "be", "been", "being",
+    "and", "or", "but", "s", "t",
+})
+
+
+# ============================================================
+# KORPUS → TOKEN ID DİZİSİ
+# ============================================================
+
+def encode_corpus(texts: Iterable[str]) -> Tuple[np.ndarray, List[str]]:
+    """
+    Metinleri tek bir token ID dizisine çevir.
+    Metin sınırları -1 ile ayrılır; n-gram'lar sınırı aşamaz.
+    """
+    vocab: Dict[str, int] = {}
+    ids: List[int] = []
+    for text in texts:
+        cleaned = clean_text(text)
+        if not cleaned:
+            continue
+        for token in cleaned.split():
+            token = token.strip("'")
+            if not token:
+                continue
+            token_id = vocab.get(token)
+            if token_id is None:
+                token_id = vocab[token] = len(vocab)
+            ids.append(token_id)
+        ids.append(-1)
+
+    words = [None] * len(vocab)
+    for token, token_id in vocab.items():
+        words[token_id] = token
+    return np.asarray(ids, dtype=np.int64), words
+
+
+# ============================================================
+# SAYIM MATRİSLERİ
+# ============================================================
+
+def ngram_matrices(ids: np.ndarray, vocab_size: int):
+    """
+    Bigram ve trigram sayım matrislerini kur
+
+    Returns:
+        bigrams: (V x V) CSR — [w1, w2] sayısı
+        trigrams: (P x V) CSR — [bigram çifti, w3] sayısı
+        pair_keys: her trigram satırının w1 * V + w2 anahtarı
+    """
+    w1, w2 = ids[:-1], ids[1:]
+    valid = (w1 >= 0) & (w2 >= 0)
+    bigrams = sparse.coo_matrix(
+        (np.ones(int(valid.sum()), dtype=np.int64), (w1[valid], w2[valid])),
+        shape=(vocab_size, vocab_size),
+    ).tocsr()
+
+    t1, t2, t3 = ids[:-2], ids[1:-1], ids[2:]
+    valid = (t1 >= 0) & (t2 >= 0) & (t3 >= 0)
+    pair_keys, pair_rows = np.unique(t1[valid] * vocab_size + t2[valid], return_inverse=True)
+    trigrams = sparse.coo_matrix(
+        (np.ones(pair_rows.size, dtype=np.int64), (pair_rows.ravel(), t3[valid])),
+        shape=(pair_keys.size, vocab_size),
+    ).tocsr()
+
+    return bigrams, trigrams, pair_keys
+
+
+# ============================================================
+# PUANLAMA
+# ============================================================
+
+def _xlogx_over_expected(observed: np.ndarray, expected: np.ndarray) -> np.ndarray:
+    """k * ln(k / E); k = 0 için 0"""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(observed > 0, observed * np.log(observed / expected), 0.0)
+
+
+def association_scores(matrix: sparse.csr_matrix, min_count: int):
+    """
+    Sayım matrisinin sıfır olmayan hücreleri için PMI ve G² hesapla
+
+    Returns:
+        rows, cols, counts, pmi, llr (min_count altındakiler elenmiş)
+    """
+    coo = matrix.tocoo()
+    keep = coo.data >= min_count
+    rows, cols = coo.row[keep], coo.col[keep]
+    k11 = coo.data[keep].astype(np.float64)
+
+    total = float(matrix.sum())
+    row_totals = np.asarray(matrix.sum(axis=1)).ravel().astype(np.float64)
+    col_totals = np.asarray(matrix.sum(axis=0)).ravel().astype(np.float64)
+    c1, c2 = row_totals[rows], col_totals[cols]
+
+    pmi = np.log2(k11 * total / (c1 * c2))
+
+    # Dunning log-likelihood: 2x2 olasılık tablosu
+    k12 = c1 - k11
+    k21 = c2 - k11
+    k22 = total - c1 - c2 + k11
+    e11 = c1 * c2 / total
+    e12 = c1 * (total - c2) / total
+    e21 = (total - c1) * c2 / total
+    e22 = (total - c1) * (total - c2) / total
+    llr = 2.0 * (
+        _xlogx_over_expected(k11, e11) + _xlogx_over_expected(k12, e12)
+        + _xlogx_over_expected(k21, e21) + _xlogx_over_expected(k22, e22)
+    )
+    # Negatif ilişkiler (beklenenden az birliktelik) aday değil
+    llr = np.where(k11 >= e11, llr, 0.0)
+
+    return rows, cols, k11.astype(np.int64), pmi, llr
+
+
+# ============================================================
+# ADAY SEÇİMİ
+# ============================================================
+
+def _is_candidate(tokens: List[str], stop_words: set) -> bool:
+    if tokens[0] in EDGE_BLOCKLIST or tokens[-1] in EDGE_BLOCKLIST:
+        return False
+    if all(t in stop_words for t in tokens):
+        return False
+    # Türkçe şık/çeviri sızıntılarını ele (ç, ş, ğ, ü, ö, ı)
+    return all(t.isascii() and t.isalpha() and (len(t) > 1 or t in ("a", "i")) for t in tokens)
+
+
+def _sub_spans(tokens: List[str]) -> List[str]:
+    """İki ve daha uzun tüm ardışık alt dizeler"""
+    n = len(tokens)
+    return [
+        " ".join(tokens[i:i + length])
+        for length in range(2, n + 1)
+        for i in range(n - length + 1)
+    ]
+
+
+def known_spans(known: set) -> set:
+    """Sözlükteki ifadelerin tüm alt dizeleri ("in spite of" → "in spite", "spite of")"""
+    spans = set()
+    for phrase in known:
+        spans.update(_sub_spans(phrase.split()))
+    return spans
+
+
+def _overlaps_known_phrase(tokens: List[str], known: set, spans: set) -> bool:
+    """Aday sözlükteki bir ifadeyi içeriyor ya da onun parçasıysa True"""
+    if " ".join(tokens) in spans:
+        return True
+    return any(span in known for span in _sub_spans(tokens))
+
+
+def rank_candidates(token_ids: np.ndarray, counts: np.ndarray, pmi: np.ndarray, llr: np.ndarray,
+                    words: List[str], known: set, spans: set, stop_words: set,
+                    sort_by: str, top_n: int) -> List[dict]:
+    """
+    Puanlanmış n-gram'ları sırala ve filtrele.
+    Sıralama vektörel; token'lar yalnızca listeye girebilecek adaylar için çözülür.
+    """
+    scores = llr if sort_by == "llr" else pmi
+    order = np.argsort(-scores, kind="stable")
+
+    results = []
+    for idx in order:
+        tokens = [words[i] for i in token_ids[idx]]
+        if not _is_candidate(tokens, stop_words):
+            continue
+        if _overlaps_known_phrase(tokens, known, spans):
+            continue
+        results.append({
+            "expression": " ".join(tokens),
+            "count": int(counts[idx]),
+            "pmi": round(float(pmi[idx]), 3),
+            "llr": round(float(llr[idx]), 2),
+        })
+        if len(results) >= top_n:
+            break
+    return results
+
+
+def mine_collocations(texts: Iterable[str], min_count: int = 5, top_n: int = 200,
+                      sort_by: str = "llr") -> dict:
+    """Korpustaki bigram/trigram collocation adaylarını bul"""
+    timings = {}
+
+    start = time.perf_counter()
+    ids, words = encode_corpus(texts)
+    timings["tokenize"] = time.perf_counter() - start
+    vocab_size = len(words)
+
+    start = time.perf_counter()
+    bigrams, trigrams, pair_keys = ngram_matrices(ids, vocab_size)
+    timings["count"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    b_rows, b_cols, b_counts, b_pmi, b_llr = association_scores(bigrams, min_count)
+    t_rows, t_cols, t_counts, t_pmi, t_llr = association_scores(trigrams, min_count)
+    timings["score"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    known = get_all_phrases()
+    spans = known_spans(known)
+    stop_words = get_stop_words()
+
+    bigram_ids = np.column_stack([b_rows, b_cols])
+    pair_w1, pair_w2 = np.divmod(pair_keys[t_rows], vocab_size)
+    trigram_ids = np.column_stack([pair_w1, pair_w2, t_cols])
+
+    results = {
+        "bigrams": rank_candidates(bigram_ids, b_counts, b_pmi, b_llr, words,
+                                   known, spans, stop_words, sort_by, top_n),
+        "trigrams": rank_candidates(trigram_ids, t_counts, t_pmi, t_llr, words,
+                                    known, spans, stop_words, sort_by, top_n),
+    }
+    timings["rank"] = time.perf_counter() - start
+
+    results["stats"] = {
+        "total_tokens": int((ids >= 0).sum()),
+        "vocabulary_size": vocab_size,
+        "unique_bigrams": int(bigrams.nnz),
+        "unique_trigrams": int(trigrams.nnz),
+        "scored_bigrams": int(b_counts.size),
+        "scored_trigrams": int(t_counts.size),
+        "phrase_dictionary_size": len(known),
+        "timings_seconds": {k: round(v, 3) for k, v in timings.items()},
+    }
+    return results
+
+
+# ============================================================
+# ANA FONKSİYON
+# ============================================================
+
+def run_mining(category: str = None, min_count: int = 5, top_n: int = 200, sort_by: str = "llr"):
+    """Veritabanındaki sorular üzerinde collocation madenciliği"""
+    print("=" * 70)
+    print("🔗 Collocation Madenciliği (PMI / Log-Likelihood)")
+    print("=" * 70)
+
+    print(f"\n📥 Sorular yükleniyor...")
+    start = time.time()
+    questions = fetch_questions(category)
+    print(f"   {len(questions)} soru yüklendi ({time.time() - start:.1f}sn)")
+
+    if not questions:
+        print("❌ Soru bulunamadı!")
+        return
+
+    texts = (text for q in questions for text in question_texts(q))
+
+    print(f"\n🔍 Aday ifadeler hesaplanıyor...")
+    start = time.time()
+    results = mine_collocations(texts, min_count=min_count, top_n=top_n, sort_by=sort_by)
+    print(f"   ✅ Tamamlandı ({time.time() - start:.2f}sn)")
+
+    stats = results["stats"]
+    print(f"\n📈 İstatistikler:")
+    print(f"   Token: {stats['total_tokens']}, Kelime dağarcığı: {stats['vocabulary_size']}")
+    print(f"   Benzersiz bigram: {stats['unique_bigrams']}, trigram: {stats['unique_trigrams']}")
+    print(f"   Süreler: {stats['timings_seconds']}")
+
+    for label, key in [("Bigram", "bigrams"), ("Trigram", "trigrams")]:
+        print(f"\n🆕 Sözlükte olmayan en iyi 25 {label} ({sort_by.upper()}):")
+        print(f"   {'#':<4} {'İfade':<35} {'Sayı':<7} {'PMI':<8} {'LLR':<10}")
+        print(f"   {'-'*65}")
+        for i, item in enumerate(results[key][:25], 1):
+            print(f"   {i:<4} {item['expression']:<35} {item['count']:<7} {item['pmi']:<8} {item['llr']:<10}")
+
+    output = {
+        "generated_at": datetime.now().isoformat(),
+        "parameters": {
+            "category": category or "ALL",
+            "min_count": min_count,
+            "top_n": top_n,
+            "sort_by": sort_by,
+            "total_questions": len(questions),
+        },
+        **results,
+    }
+
+    output_file = "collocation_candidates.json"
+    jsonio.dump(output, output_file)
+
+    print(f"\n💾 Sonuçlar kaydedildi: {output_file}")
+    print(f"{'=' * 70}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Collocation madenciliği (PMI / log-likelihood)")
+    parser.add_argument("--category", type=str, default=None, help="Belirli bir kategori filtresi")
+    parser.add_argument("--min-count", type=int, default=5, help="Minimum n-gram sayısı (varsayılan: 5)")
+    parser.add_argument("--top", type=int, default=200, help="Her n-gram türü için aday sayısı (varsayılan: 200)")
+    parser.add_argument("--sort", choices=["llr", "pmi"], default="llr", help="Sıralama ölçütü (varsayılan: llr)")
+
+    args = parser.parse_args()
+    run_mining(category=args.category, min_count=args.min_count, top_n=args.top, sort_by=args.sort)
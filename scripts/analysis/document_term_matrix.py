@@ -0,0 +1,124 @@
+"""
+Soru × İfade Doküman-Terim Matrisi
+
+HybridFrequencyAnalyzer'ın soru bazlı sayaçlarını SciPy CSR matrisine çevirir
+(satırlar = soru ID'leri, sütunlar = ifade/kelime sözlüğü) ve sözlük + satır
+indeksiyle birlikte tek bir .npz dosyasına yazar. Kategori profilleri, TF-IDF,
+benzer soru ve kelime zorluğu gibi analizler tekrar tokenize etmeden bu matris
+üzerinde vektörel çalışabilir.
+
+Kullanım:
+    from scripts.analysis.document_term_matrix import load_document_term_matrix
+
+    dtm = load_document_term_matrix("word_frequency_matrix.npz")
+    dtm.matrix                       # scipy.sparse.csr_matrix (soru x ifade)
+    dtm.row_of(12151)                # Soru ID → satır
+    dtm.column_of("account for")     # İfade → sütun
+    dtm.category_profile("YDS Gramer")
+"""
+
+from collections import Counter
+from typing import Dict, NamedTuple, Optional
+
+import numpy as np
+from scipy import sparse
+
+
+class DocumentTermMatrix(NamedTuple):
+    """CSR matris + satır/sütun etiketleri"""
+    matrix: sparse.csr_matrix      # (soru sayısı x sözlük boyutu), int32 sayımlar
+    doc_ids: np.ndarray            # Satır → soru ID
+    vocabulary: np.ndarray         # Sütun → ifade
+    is_phrase: np.ndarray          # Sütun çok kelimeli ifade mi
+    categories: np.ndarray         # Satır → kategori
+
+    def row_of(self, doc_id: int) -> Optional[int]:
+        """Soru ID'sinin satır numarası (doc_ids sıralıdır)"""
+        row = int(np.searchsorted(self.doc_ids, doc_id))
+        if row < self.doc_ids.size and self.doc_ids[row] == doc_id:
+            return row
+        return None
+
+    def column_of(self, expression: str) -> Optional[int]:
+        """İfadenin sütun numarası (sözlük sıralıdır)"""
+        expression = expression.lower().strip()
+        col = int(np.searchsorted(self.vocabulary, expression))
+        if col < self.vocabulary.size and self.vocabulary[col] == expression:
+            return col
+        return None
+
+    def category_profile(self, category: str) -> np.ndarray:
+        """Kategorideki soruların toplam ifade sayıları (sözlük boyutunda vektör)"""
+        mask = self.categories == category
+        return np.asarray(self.matrix[mask].sum(axis=0)).ravel()
+
+
+def build_document_term_matrix(document_terms: Dict[int, Counter],
+                               doc_categories: Dict[int, str],
+                               phrases: frozenset) -> DocumentTermMatrix:
+    """
+    Analizcinin soru bazlı sayaçlarından CSR matris kur
+
+    Args:
+        document_terms: {soru_id: Counter(ifade → sayı)}
+        doc_categories: {soru_id: kategori}
+        phrases: Sözlükteki ifadeler (sütun türü için)
+    """
+    doc_ids = np.array(sorted(document_terms), dtype=np.int64)
+    vocabulary = sorted({expr for terms in document_terms.values() for expr in terms})
+    column = {expr: i for i, expr in enumerate(vocabulary)}
+
+    indptr = np.zeros(doc_ids.size + 1, dtype=np.int64)
+    indices = []
+    data = []
+    for row, doc_id in enumerate(doc_ids):
+        terms = document_terms[int(doc_id)]
+        # CSR satır içi sütunlar sıralı olmalı
+        cols = sorted(column[expr] for expr in terms)
+        indices.extend(cols)
+        data.extend(terms[vocabulary[c]] for c in cols)
+        indptr[row + 1] = len(indices)
+
+    matrix = sparse.csr_matrix(
+        (np.asarray(data, dtype=np.int32), np.asarray(indices, dtype=np.int32), indptr),
+        shape=(doc_ids.size, len(vocabulary)),
+    )
+    return DocumentTermMatrix(
+        matrix=matrix,
+        doc_ids=doc_ids,
+        vocabulary=np.array(vocabulary, dtype=np.str_),
+        is_phrase=np.array([expr in phrases for expr in vocabulary], dtype=bool),
+        categories=np.array([doc_categories.get(int(d)) or "" for d in doc_ids], dtype=np.str_),
+    )
+
+
+def save_document_term_matrix(path: str, dtm: DocumentTermMatrix) -> None:
+    """Matrisi ve etiketlerini sıkıştırılmış .npz olarak kaydet (pickle gerektirmez)"""
+    matrix = dtm.matrix.tocsr()
+    np.savez_compressed(
+        path,
+        data=matrix.data,
+        indices=matrix.indices,
+        indptr=matrix.indptr,
+        shape=np.array(matrix.shape, dtype=np.int64),
+        doc_ids=dtm.doc_ids,
+        vocabulary=dtm.vocabulary,
+        is_phrase=dtm.is_phrase,
+        categories=dtm.categories,
+    )
+
+
+def load_document_term_matrix(path: str) -> DocumentTermMatrix:
+    """save_document_term_matrix ile yazılmış dosyayı yükle"""
+    with np.load(path, allow_pickle=False) as f:
+        matrix = sparse.csr_matrix(
+            (f["data"], f["indices"], f["indptr"]),
+            shape=tuple(f["shape"]),
+        )
+        return DocumentTermMatrix(
+            matrix=matrix,
+            doc_ids=f["doc_ids"],
+            vocabulary=f["vocabulary"],
+            is_phrase=f["is_phrase"],
+            categories=f["categories"],
+        )
@@ -0,0 +1,91 @@
+"""
+Sabit Bellekli Sık Öğe Sayımı (Space-Saving)
+
+Metwally vd. Space-Saving algoritması: en fazla `capacity` anahtar izlenir,
+kelime dağarcığı ne kadar büyürse büyüsün bellek sabit kalır.
+Her sayımın yanında hata sınırı raporlanır:
+
+    gerçek sayı ∈ [count - error, count]
+
+İzlenmeyen herhangi bir anahtarın gerçek sayısı en fazla `min_count` olabilir.
+Sayaçlar yalnızca birer birer artırılır; bu sayede en küçük sayım kovası
+O(1) güncellenir (stream-summary yapısı).
+"""
+
+from typing import Dict, Hashable, List, Set, Tuple
+
+
+class SpaceSaving:
+    """Space-Saving top-K sayacı (birim artışlı)"""
+
+    def __init__(self, capacity: int):
+        if capacity < 1:
+            raise ValueError("capacity en az 1 olmalı")
+        self.capacity = capacity
+        self._counts: Dict[Hashable, int] = {}
+        self._errors: Dict[Hashable, int] = {}
+        self._buckets: Dict[int, Set[Hashable]] = {}  # sayım → anahtarlar
+        self._min_count = 0
+        self.total = 0  # Akıştaki toplam öğe sayısı
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._counts
+
+    @property
+    def min_count(self) -> int:
+        """İzlenmeyen bir anahtarın gerçek sayısı için üst sınır"""
+        return self._min_count if len(self._counts) >= self.capacity else 0
+
+    def _move(self, key: Hashable, old: int, new: int):
+        bucket = self._buckets[old]
+        bucket.discard(key)
+        if not bucket:
+            del self._buckets[old]
+            if old == self._min_count:
+                self._min_count = new
+        self._buckets.setdefault(new, set()).add(key)
+
+    def add(self, key: Hashable):
+        """Anahtarı bir artır"""
+        self.total += 1
+        count = self._counts.get(key)
+
+        if count is not None:
+            self._counts[key] = count + 1
+            self._move(key, count, count + 1)
+            return
+
+        if len(self._counts) < self.capacity:
+            self._counts[key] = 1
+            self._errors[key] = 0
+            self._buckets.setdefault(1, set()).add(key)
+            self._min_count = 1
+            return
+
+        # Kapasite dolu: en küçük sayımlı anahtarın yerini al
+        min_count = self._min_count
+        victim = next(iter(self._buckets[min_count]))
+        del self._counts[victim]
+        del self._errors[victim]
+        self._buckets[min_count].discard(victim)
+        self._buckets[min_count].add(key)
+
+        self._counts[key] = min_count + 1
+        self._errors[key] = min_count
+        self._move(key, min_count, min_count + 1)
+
+    def count(self, key: Hashable) -> int:
+        """Tahmini sayım (üst sınır); izlenmiyorsa 0"""
+        return self._counts.get(key, 0)
+
+    def error(self, key: Hashable) -> int:
+        """Tahminin en fazla ne kadar fazla olabileceği"""
+        return self._errors.get(key, 0)
+
+    def most_common(self, n: int = None) -> List[Tuple[Hashable, int]]:
+        """Counter.most_common ile aynı biçimde (anahtar, tahmini sayım)"""
+        items = sorted(self._counts.items(), key=lambda kv: kv[1], reverse=True)
+        return items if n is None else items[:n]
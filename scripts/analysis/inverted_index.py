@@ -0,0 +1,257 @@
+"""
+İfade → Soru Ters İndeksi
+
+HybridFrequencyAnalyzer'ın soru bazlı sonuçlarından (ifade → sıralı soru ID'leri)
+ters indeks oluşturur. Posting listeleri delta + varint ile sıkıştırılıp tek bir
+binary dosyada saklanır; sorgular sadece istenen listeleri açar.
+
+Dosya formatı:
+    MAGIC (8 byte) | meta uzunluğu (uint32, little-endian) | meta (JSON) | posting blob
+
+Kullanım:
+    from scripts.analysis.inverted_index import InvertedIndex
+
+    index = InvertedIndex.load("word_frequency_index.bin")
+    index.query_and(["account for"])                      # Soru ID'leri
+    index.query_or(["however", "nevertheless"], category="YDS Gramer")
+    index.top_expressions("YDS Kelime Soruları", n=20)    # [(ifade, soru sayısı)]
+
+    python -m scripts.analysis.inverted_index "account for" "in spite of" --or
+"""
+
+import argparse
+import json
+import struct
+import time
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Tuple
+
+MAGIC = b"YDSIDX1\n"
+TOP_EXPRESSIONS_PER_CATEGORY = 200
+
+
+# ============================================================
+# DELTA + VARINT KODLAMA
+# ============================================================
+
+def encode_postings(doc_ids: Iterable[int]) -> bytes:
+    """Sıralı ID listesini delta + varint (LEB128) olarak kodla"""
+    out = bytearray()
+    previous = 0
+    for doc_id in doc_ids:
+        delta = doc_id - previous
+        previous = doc_id
+        while delta >= 0x80:
+            out.append((delta & 0x7F) | 0x80)
+            delta >>= 7
+        out.append(delta)
+    return bytes(out)
+
+
+def decode_postings(data: bytes) -> List[int]:
+    """encode_postings çıktısını tekrar sıralı ID listesine çevir"""
+    doc_ids = []
+    current = 0
+    value = 0
+    shift = 0
+    for byte in data:
+        value |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+            continue
+        current += value
+        doc_ids.append(current)
+        value = 0
+        shift = 0
+    return doc_ids
+
+
+# ============================================================
+# TERS İNDEKS
+# ============================================================
+
+class InvertedIndex:
+    """
+    Sıkıştırılmış posting listeli ters indeks.
+    Çözülen listeler bellekte tutulur; tekrar eden sorgular listeyi yeniden açmaz.
+    """
+
+    def __init__(self, terms: Dict[str, list], categories: Dict[str, list],
+                 top_by_category: Dict[str, list], blob: bytes):
+        self._terms = terms                    # ifade → [offset, uzunluk, soru sayısı]
+        self._categories = categories          # kategori → [offset, uzunluk, soru sayısı]
+        self._top_by_category = top_by_category
+        self._blob = memoryview(blob)
+        self._cache: Dict[Tuple[str, str], List[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._terms)
+
+    def __contains__(self, expression: str) -> bool:
+        return expression.lower().strip() in self._terms
+
+    @classmethod
+    def build(cls, document_terms: Dict[int, Counter], doc_categories: Dict[int, str]) -> "InvertedIndex":
+        """
+        Analizcinin soru bazlı sayaçlarından indeks oluştur
+
+        Args:
+            document_terms: {soru_id: Counter(ifade → sayı)}
+            doc_categories: {soru_id: kategori}
+        """
+        term_docs: Dict[str, List[int]] = {}
+        category_docs: Dict[str, List[int]] = {}
+        category_df: Dict[str, Counter] = {}
+
+        for doc_id in sorted(document_terms):
+            category = doc_categories.get(doc_id)
+            if category:
+                category_docs.setdefault(category, []).append(doc_id)
+                df = category_df.setdefault(category, Counter())
+            else:
+                df = None
+            for expr in document_terms[doc_id]:
+                term_docs.setdefault(expr, []).append(doc_id)
+                if df is not None:
+                    df[expr] += 1
+
+        blob = bytearray()
+
+        def append(doc_ids: List[int]) -> list:
+            encoded = encode_postings(doc_ids)
+            entry = [len(blob), len(encoded), len(doc_ids)]
+            blob.extend(encoded)
+            return entry
+
+        terms = {expr: append(doc_ids) for expr, doc_ids in sorted(term_docs.items())}
+        categories = {cat: append(doc_ids) for cat, doc_ids in sorted(category_docs.items())}
+        top_by_category = {
+            cat: df.most_common(TOP_EXPRESSIONS_PER_CATEGORY)
+            for cat, df in category_df.items()
+        }
+        return cls(terms, categories, top_by_category, bytes(blob))
+
+    def save(self, path: str) -> int:
+        """İndeksi binary dosyaya yaz, yazılan byte sayısını döndür"""
+        meta = json.dumps({
+            "terms": self._terms,
+            "categories": self._categories,
+            "top_by_category": self._top_by_category,
+        }, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+        with open(path, "wb") as f:
+            f.write(MAGIC)
+            f.write(struct.pack("<I", len(meta)))
+            f.write(meta)
+            f.write(self._blob)
+        return len(MAGIC) + 4 + len(meta) + len(self._blob)
+
+    @classmethod
+    def load(cls, path: str) -> "InvertedIndex":
+        """save() ile yazılmış indeksi yükle"""
+        with open(path, "rb") as f:
+            data = f.read()
+
+        if not data.startswith(MAGIC):
+            raise ValueError(f"Geçersiz indeks dosyası: {path}")
+
+        header_end = len(MAGIC) + 4
+        (meta_len,) = struct.unpack("<I", data[len(MAGIC):header_end])
+        meta = json.loads(data[header_end:header_end + meta_len].decode("utf-8"))
+        blob = data[header_end + meta_len:]
+        return cls(meta["terms"], meta["categories"], meta["top_by_category"], blob)
+
+    # --------------------------------------------------------
+    # Sorgular
+    # --------------------------------------------------------
+
+    def _decode(self, kind: str, key: str, table: Dict[str, list]) -> List[int]:
+        cached = self._cache.get((kind, key))
+        if cached is not None:
+            return cached
+        entry = table.get(key)
+        if entry is None:
+            return []
+        offset, length, _ = entry
+        doc_ids = decode_postings(self._blob[offset:offset + length])
+        self._cache[(kind, key)] = doc_ids
+        return doc_ids
+
+    def postings(self, expression: str) -> List[int]:
+        """İfadenin geçtiği soru ID'leri (sıralı)"""
+        return self._decode("term", expression.lower().strip(), self._terms)
+
+    def category_postings(self, category: str) -> List[int]:
+        """Kategorideki (indekslenmiş) soru ID'leri (sıralı)"""
+        return self._decode("category", category, self._categories)
+
+    def document_frequency(self, expression: str) -> int:
+        """İfadenin geçtiği soru sayısı (listeyi açmadan)"""
+        entry = self._terms.get(expression.lower().strip())
+        return entry[2] if entry else 0
+
+    def query_and(self, expressions: List[str], category: Optional[str] = None) -> List[int]:
+        """Tüm ifadeleri içeren sorular"""
+        lists = [self.postings(expr) for expr in expressions]
+        if category:
+            lists.append(self.category_postings(category))
+        if not lists:
+            return []
+
+        # En kısa listeden başla — kesişim en fazla onun kadar olabilir
+        lists.sort(key=len)
+        result = set(lists[0])
+        for doc_ids in lists[1:]:
+            if not result:
+                break
+            result.intersection_update(doc_ids)
+        return sorted(result)
+
+    def query_or(self, expressions: List[str], category: Optional[str] = None) -> List[int]:
+        """İfadelerden en az birini içeren sorular"""
+        result = set()
+        for expr in expressions:
+            result.update(self.postings(expr))
+        if category:
+            result.intersection_update(self.category_postings(category))
+        return sorted(result)
+
+    def top_expressions(self, category: str, n: int = 20) -> List[Tuple[str, int]]:
+        """Kategoride en çok soruda geçen ifadeler: [(ifade, soru sayısı)]"""
+        return [tuple(item) for item in self._top_by_category.get(category, [])[:n]]
+
+    def categories(self) -> List[str]:
+        """İndekslenmiş kategoriler"""
+        return list(self._categories)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Ters indeks sorgulama")
+    parser.add_argument("expressions", nargs="*", help="Aranacak ifadeler")
+    parser.add_argument("--index", type=str, default="word_frequency_index.bin", help="İndeks dosyası")
+    parser.add_argument("--or", dest="use_or", action="store_true", help="VEYA sorgusu (varsayılan: VE)")
+    parser.add_argument("--category", type=str, default=None, help="Kategori filtresi")
+    parser.add_argument("--top", type=int, default=20, help="Kategori için en sık N ifade")
+
+    args = parser.parse_args()
+    index = InvertedIndex.load(args.index)
+
+    if args.expressions:
+        start = time.perf_counter()
+        if args.use_or:
+            doc_ids = index.query_or(args.expressions, category=args.category)
+        else:
+            doc_ids = index.query_and(args.expressions, category=args.category)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        mode = "VEYA" if args.use_or else "VE"
+        print(f"🔍 {mode}: {', '.join(args.expressions)} → {len(doc_ids)} soru ({elapsed_ms:.3f}ms)")
+        print(f"   {doc_ids[:50]}{' ...' if len(doc_ids) > 50 else ''}")
+    elif args.category:
+        print(f"🏆 {args.category} — en sık {args.top} ifade:")
+        for expr, df in index.top_expressions(args.category, args.top):
+            print(f"   {expr:<35} {df}")
+    else:
+        print(f"🗂️  {len(index)} ifade, {len(index.categories())} kategori")
+        for cat in index.categories():
+            print(f"   - {cat}: {len(index.category_postings(cat))} soru")
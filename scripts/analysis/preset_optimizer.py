@@ -0,0 +1,333 @@
+"""
+Toplu Quiz Preset Optimizasyonu
+
+Challenge odaları ve günlük quizler için tek çalıştırmada N preset üretir:
+- Her preset YDS_FULL_DISTRIBUTION oranlarına uyar (mini/medium/full)
+- Her presetin zorluk karışımı hedef orana (easy/medium/hard) yakın tutulur
+- Soru tekrarları tüm set genelinde en aza indirilir
+
+Yöntem:
+1. Greedy: her preset için kategori × zorluk kotaları hesaplanır, kotalar o ana
+   kadar en az kullanılmış sorulardan (rastgele eşitlik bozma ile) doldurulur.
+2. Yerel arama: presetlerdeki sorular aynı kategorideki adaylarla takas edilir;
+   takas tekrar maliyetini ve/veya zorluk sapmasını düşürüyorsa kabul edilir.
+
+Tüm hesaplama QuestionSampler'ın NumPy dizileri üzerinde yapılır; DB'ye tek
+sorgu atılır.
+
+Kullanım:
+    python -m scripts.analysis.preset_optimizer --count 300 --size mini
+    python -m scripts.analysis.preset_optimizer --count 100 --size full --seed 7 --mix 0.3,0.4,0.3
+"""
+
+import argparse
+import sys
+import time
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import numpy as np
+from scipy import sparse
+
+sys.stdout.reconfigure(line_buffering=True)
+
+from scripts import jsonio
+from scripts.analysis.question_sampler import QuestionSampler, DIFFICULTY_LEVELS
+from scripts.analysis.analyze_and_create_quiz_presets import preset_distribution
+
+
+def _largest_remainder(total: int, weights: np.ndarray) -> np.ndarray:
+    """total'ı ağırlıklara göre tam sayılara böl (toplam korunur)"""
+    weights = np.asarray(weights, dtype=float)
+    if total <= 0 or weights.sum() <= 0:
+        return np.zeros(weights.size, dtype=np.int64)
+    exact = total * weights / weights.sum()
+    counts = np.floor(exact).astype(np.int64)
+    remainder = total - counts.sum()
+    if remainder:
+        counts[np.argsort(-(exact - counts), kind="stable")[:remainder]] += 1
+    return counts
+
+
+class PresetOptimizer:
+    """Greedy + yerel arama ile örtüşmesi az, dengeli preset seti üretici"""
+
+    def __init__(self, sampler: QuestionSampler, size: str = "full",
+                 difficulty_mix: Optional[List[float]] = None,
+                 difficulty_weight: float = 1.0, seed: Optional[int] = None):
+        self.rng = np.random.default_rng(seed)
+        self.size = size
+        self.difficulty_weight = difficulty_weight
+        self.total_questions, self.distribution = preset_distribution(size)
+
+        # Tüm havuzları tek bir düz diziye topla: pozisyon → id / kategori / zorluk
+        self.categories = list(self.distribution)
+        ids, cats, diffs = [], [], []
+        for ci, yds_cat in enumerate(self.categories):
+            pool = sampler.pools.get(yds_cat, np.empty(0, dtype=np.int64))
+            ids.append(pool)
+            cats.append(np.full(pool.size, ci, dtype=np.int16))
+            diffs.append(sampler.pool_difficulties.get(yds_cat, np.empty(0, dtype=np.int8)))
+        self.ids = np.concatenate(ids) if ids else np.empty(0, dtype=np.int64)
+        self.cat_of = np.concatenate(cats) if cats else np.empty(0, dtype=np.int16)
+        self.diff_of = np.concatenate(diffs) if diffs else np.empty(0, dtype=np.int8)
+        self.usage = np.zeros(self.ids.size, dtype=np.int64)
+
+        n_levels = len(DIFFICULTY_LEVELS)
+        self.subpools = [
+            [np.flatnonzero((self.cat_of == ci) & (self.diff_of == d)) for d in range(n_levels)]
+            for ci in range(len(self.categories))
+        ]
+
+        # Hedef zorluk karışımı: verilmezse havuzun kendi oranı
+        if difficulty_mix is None:
+            mix = np.bincount(self.diff_of, minlength=n_levels).astype(float)
+        else:
+            mix = np.asarray(difficulty_mix, dtype=float)
+        self.difficulty_mix = mix / mix.sum() if mix.sum() > 0 else np.full(n_levels, 1.0 / n_levels)
+
+        self.presets: List[np.ndarray] = []
+
+    # --------------------------------------------------------
+    # Greedy kurulum
+    # --------------------------------------------------------
+
+    def _least_used(self, candidates: np.ndarray, n: int, taken: np.ndarray) -> np.ndarray:
+        """Adaylardan presette olmayan en az kullanılmış n tanesini seç"""
+        candidates = candidates[~taken[candidates]]
+        if n <= 0 or candidates.size == 0:
+            return np.empty(0, dtype=np.int64)
+        # Kullanım sayısı + [0, 1) rastgele kırılım → eşit kullanımda rastgele seçim
+        keys = self.usage[candidates] + self.rng.random(candidates.size)
+        if n >= candidates.size:
+            return candidates
+        return candidates[np.argpartition(keys, n - 1)[:n]]
+
+    def _build_one(self) -> np.ndarray:
+        taken = np.zeros(self.ids.size, dtype=bool)
+        remaining_mix = _largest_remainder(self.total_questions, self.difficulty_mix)
+        remaining_slots = self.total_questions
+        picked = []
+
+        for ci in self.rng.permutation(len(self.categories)):
+            needed = self.distribution[self.categories[ci]]
+            # Kategori kotası, presetin kalan zorluk ihtiyacıyla orantılı dağıtılır
+            quotas = _largest_remainder(needed, remaining_mix / max(remaining_slots, 1))
+            chosen = []
+            for d, quota in enumerate(quotas):
+                sel = self._least_used(self.subpools[ci][d], int(quota), taken)
+                taken[sel] = True
+                chosen.append(sel)
+
+            # Zorluk kotası dolmadıysa kategorinin diğer sorularıyla tamamla
+            short = needed - sum(c.size for c in chosen)
+            if short > 0:
+                sel = self._least_used(np.concatenate(self.subpools[ci]), short, taken)
+                taken[sel] = True
+                chosen.append(sel)
+
+            chosen = np.concatenate(chosen)
+            remaining_mix = np.maximum(remaining_mix - np.bincount(self.diff_of[chosen], minlength=remaining_mix.size), 0)
+            remaining_slots -= chosen.size
+            picked.append(chosen)
+
+        # Kategorisi yetmeyen slotları herhangi bir havuzdan doldur
+        short = self.total_questions - sum(p.size for p in picked)
+        if short > 0:
+            sel = self._least_used(np.arange(self.ids.size), short, taken)
+            taken[sel] = True
+            picked.append(sel)
+
+        preset = np.concatenate(picked) if picked else np.empty(0, dtype=np.int64)
+        self.usage[preset] += 1
+        return preset
+
+    # --------------------------------------------------------
+    # Yerel arama
+    # --------------------------------------------------------
+
+    def _difficulty_error(self, preset: np.ndarray) -> np.ndarray:
+        """Preset zorluk sayıları − hedef (pozitif = fazla)"""
+        target = _largest_remainder(preset.size, self.difficulty_mix)
+        return np.bincount(self.diff_of[preset], minlength=target.size) - target
+
+    def _best_candidate(self, ci: int, d: int, taken: np.ndarray) -> Optional[int]:
+        candidates = self.subpools[ci][d]
+        candidates = candidates[~taken[candidates]]
+        if candidates.size == 0:
+            return None
+        return int(candidates[np.argmin(self.usage[candidates])])
+
+    def _improve_preset(self, preset: np.ndarray) -> int:
+        """Bir preset üzerinde iyileştiren takasları uygula, takas sayısını döndür"""
+        taken = np.zeros(self.ids.size, dtype=bool)
+        taken[preset] = True
+        swaps = 0
+
+        for slot in range(preset.size):
+            current = preset[slot]
+            ci, d_cur = int(self.cat_of[current]), int(self.diff_of[current])
+            error = self._difficulty_error(preset)
+
+            # Aynı zorluk + fazla zorluktan eksik zorluğa geçiş adayları
+            options = [d_cur]
+            if error[d_cur] > 0:
+                options += [d for d in np.flatnonzero(error < 0)]
+
+            best_delta, best = 0.0, None
+            for d_new in options:
+                candidate = self._best_candidate(ci, int(d_new), taken)
+                if candidate is None:
+                    continue
+                # Σ C(u, 2) tekrar maliyetindeki değişim
+                delta = float(self.usage[candidate] - (self.usage[current] - 1))
+                if d_new != d_cur:
+                    delta -= 2 * self.difficulty_weight
+                if delta < best_delta:
+                    best_delta, best = delta, candidate
+
+            if best is not None:
+                taken[current] = False
+                taken[best] = True
+                self.usage[current] -= 1
+                self.usage[best] += 1
+                preset[slot] = best
+                swaps += 1
+
+        return swaps
+
+    def optimize(self, count: int, max_passes: int = 5) -> List[np.ndarray]:
+        """count adet preset üret ve yerel aramayla iyileştir"""
+        self.presets = [self._build_one() for _ in range(count)]
+
+        for _ in range(max_passes):
+            swaps = sum(self._improve_preset(preset) for preset in self.presets)
+            if swaps == 0:
+                break
+
+        for preset in self.presets:
+            self.rng.shuffle(preset)
+        return self.presets
+
+    # --------------------------------------------------------
+    # Rapor
+    # --------------------------------------------------------
+
+    def preset_summary(self, preset: np.ndarray) -> dict:
+        cat_counts = np.bincount(self.cat_of[preset], minlength=len(self.categories))
+        diff_counts = np.bincount(self.diff_of[preset], minlength=len(DIFFICULTY_LEVELS))
+        return {
+            'question_ids': self.ids[preset].tolist(),
+            'distribution': {cat: int(c) for cat, c in zip(self.categories, cat_counts)},
+            'difficulty': {level: int(c) for level, c in zip(DIFFICULTY_LEVELS, diff_counts)},
+        }
+
+    def report(self) -> dict:
+        """Örtüşme, kategori dağılımı ve zorluk sapması raporu"""
+        count = len(self.presets)
+        if count == 0:
+            return {}
+
+        # Preset × soru incidence matrisi → ikili örtüşmeler = A·Aᵀ
+        rows = np.repeat(np.arange(count), [p.size for p in self.presets])
+        cols = np.concatenate(self.presets)
+        incidence = sparse.csr_matrix((np.ones(cols.size, dtype=np.int32), (rows, cols)),
+                                      shape=(count, self.ids.size))
+        overlap = (incidence @ incidence.T).toarray()
+        pair_overlaps = overlap[np.triu_indices(count, k=1)]
+
+        target = np.array([self.distribution[c] for c in self.categories])
+        dist_errors = np.array([
+            np.abs(np.bincount(self.cat_of[p], minlength=target.size) - target).sum()
+            for p in self.presets
+        ])
+        diff_errors = np.array([np.abs(self._difficulty_error(p)).sum() for p in self.presets])
+
+        used = self.usage[self.usage > 0]
+        return {
+            'preset_count': count,
+            'questions_per_preset': self.total_questions,
+            'pool_size': int(self.ids.size),
+            'unique_questions': int(used.size),
+            'total_slots': int(cols.size),
+            'max_usage': int(used.max()) if used.size else 0,
+            'reuse_cost': int((used * (used - 1) // 2).sum()),
+            'pair_overlap_mean': float(pair_overlaps.mean()) if pair_overlaps.size else 0.0,
+            'pair_overlap_max': int(pair_overlaps.max()) if pair_overlaps.size else 0,
+            'overlapping_pairs': int((pair_overlaps > 0).sum()),
+            'distribution_error_mean': float(dist_errors.mean()),
+            'distribution_error_max': int(dist_errors.max()),
+            'difficulty_target': {level: round(float(w), 3) for level, w in zip(DIFFICULTY_LEVELS, self.difficulty_mix)},
+            'difficulty_error_mean': float(diff_errors.mean()),
+            'difficulty_error_max': int(diff_errors.max()),
+        }
+
+
+def print_report(report: dict):
+    print("\n📊 Preset Seti Raporu")
+    print("-"*50)
+    print(f"   Preset: {report['preset_count']} × {report['questions_per_preset']} soru")
+    print(f"   Havuz: {report['pool_size']} soru, kullanılan: {report['unique_questions']}")
+    print(f"   En çok kullanım: {report['max_usage']}, tekrar maliyeti: {report['reuse_cost']}")
+    print(f"   İkili örtüşme: ort {report['pair_overlap_mean']:.2f}, maks {report['pair_overlap_max']} "
+          f"({report['overlapping_pairs']} çift)")
+    print(f"   Kategori sapması: ort {report['distribution_error_mean']:.2f}, maks {report['distribution_error_max']}")
+    print(f"   Zorluk sapması: ort {report['difficulty_error_mean']:.2f}, maks {report['difficulty_error_max']}")
+
+
+def generate_preset_batch(count: int, size: str = "full", seed: Optional[int] = None,
+                          difficulty_mix: Optional[List[float]] = None,
+                          output_path: str = "quiz_presets_batch.json",
+                          max_passes: int = 5) -> Dict:
+    """DB'den havuzları yükle, N preset üret ve JSON'a kaydet"""
+    print("="*60)
+    print(f"🎯 Toplu Preset Üretimi: {count} × {size}")
+    print("="*60)
+
+    start = time.time()
+    sampler = QuestionSampler.from_database(seed=seed)
+    print(f"\n📥 {sampler.eligible_ids.size} uygun soru yüklendi ({time.time() - start:.2f}sn)")
+
+    start = time.time()
+    optimizer = PresetOptimizer(sampler, size=size, difficulty_mix=difficulty_mix, seed=seed)
+    presets = optimizer.optimize(count, max_passes=max_passes)
+    print(f"⚡ {len(presets)} preset oluşturuldu ({time.time() - start:.2f}sn)")
+
+    report = optimizer.report()
+    print_report(report)
+
+    result = {
+        'generated_at': datetime.now().isoformat(),
+        'size': size,
+        'seed': seed,
+        'target_distribution': {cat: optimizer.distribution[cat] for cat in optimizer.categories},
+        'report': report,
+        'presets': [
+            {'name': f"{size}-{i + 1:04d}", **optimizer.preset_summary(preset)}
+            for i, preset in enumerate(presets)
+        ],
+    }
+
+    jsonio.dump(result, output_path)
+
+    print(f"\n✅ Preset seti kaydedildi: {output_path}")
+    return result
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Toplu quiz preset optimizasyonu")
+    parser.add_argument("--count", type=int, default=100, help="Üretilecek preset sayısı")
+    parser.add_argument("--size", choices=["mini", "medium", "full"], default="full", help="Preset boyutu")
+    parser.add_argument("--seed", type=int, default=None, help="Tekrarlanabilir üretim için seed")
+    parser.add_argument("--mix", type=str, default=None,
+                        help="Hedef zorluk oranı easy,medium,hard (örn: 0.3,0.4,0.3); varsayılan havuz oranı")
+    parser.add_argument("--passes", type=int, default=5, help="Yerel arama tur sayısı")
+    parser.add_argument("--output", type=str, default="quiz_presets_batch.json", help="Çıktı dosyası")
+
+    args = parser.parse_args()
+    mix = [float(x) for x in args.mix.split(",")] if args.mix else None
+    if mix is not None and len(mix) != len(DIFFICULTY_LEVELS):
+        parser.error(f"--mix {len(DIFFICULTY_LEVELS)} değer almalı: {','.join(DIFFICULTY_LEVELS)}")
+
+    generate_preset_batch(args.count, size=args.size, seed=args.seed, difficulty_mix=mix,
+                          output_path=args.output, max_passes=args.passes)
@@ -1,7 +1,8 @@
-import json
 import os
 from collections import Counter
 
+from scripts import jsonio
+
 def analyze_quality(gpt_dir: str = "yds_questions_gpt"):
     """GPT ile işlenmiş soruların kalite analizini yap"""
     
@@ -22,8 +23,7 @@ def analyze_quality(gpt_dir: str = "yds_questions_gpt"):
             continue
         
         filepath = os.path.join(gpt_dir, filename)
-        with open(filepath, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = jsonio.load(filepath)
         
         category = data.get("category", filename)
         questions = data.get("questions", [])
@@ -90,6 +90,100 @@ def analyze_quality(gpt_dir: str = "yds_questions_gpt"):
     return results
 
 
+def analyze_quality_snapshot(snapshot_path: str = "snapshots/corpus.arrow") -> dict:
+    """
+    analyze_quality ile aynı raporu kolonsal snapshot üzerinden üret
+    (scripts.export.columnar_snapshot). JSON dosyaları tek tek açılmaz,
+    sayımlar Arrow kolonları üzerinde vektörel yapılır.
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    from scripts.export.columnar_snapshot import load_snapshot
+
+    table = load_snapshot(snapshot_path)
+
+    # Sadece gpt_*.json dosyalarından gelen satırlar
+    sources = pc.unique(table.column("source_file").cast(pa.string())).to_pylist()
+    gpt_sources = [s for s in sources if s and os.path.basename(s).startswith("gpt_")]
+    table = table.filter(pc.is_in(table.column("source_file").cast(pa.string()), value_set=pa.array(gpt_sources)))
+
+    category = table.column("category").cast(pa.string())
+    answer = table.column("gpt_answer").cast(pa.string())
+    text = table.column("question_text")
+    corrected = table.column("corrected_question")
+
+    has_answer = pc.fill_null(pc.greater(pc.utf8_length(answer), 0), False)
+    processed = pc.fill_null(table.column("processed"), False)
+    has_explanation = pc.fill_null(pc.greater(pc.utf8_length(table.column("explanation")), 5), False)
+    is_corrected = pc.fill_null(pc.and_(pc.greater(pc.utf8_length(corrected), 0),
+                                        pc.not_equal(pc.fill_null(text, ""), corrected)), False)
+    valid_answer = pc.is_in(answer, value_set=pa.array(["A", "B", "C", "D", "E"]))
+
+    flags = pa.table({
+        "category": category,
+        "answer": answer,
+        "processed": pc.cast(processed, pa.int64()),
+        "has_answer": pc.cast(has_answer, pa.int64()),
+        "has_explanation": pc.cast(has_explanation, pa.int64()),
+        "text_corrected": pc.cast(is_corrected, pa.int64()),
+    })
+
+    results = {
+        "total_questions": table.num_rows,
+        "processed_success": pc.sum(flags["processed"]).as_py() or 0,
+        "has_answer": pc.sum(flags["has_answer"]).as_py() or 0,
+        "has_explanation": pc.sum(flags["has_explanation"]).as_py() or 0,
+        "has_correction": pc.sum(flags["text_corrected"]).as_py() or 0,
+        "answer_distribution": Counter(),
+        "categories": {},
+        "sample_corrections": [],
+        "issues": []
+    }
+
+    answered = flags.filter(has_answer)
+    for row in answered.group_by("answer").aggregate([("answer", "count")]).to_pylist():
+        results["answer_distribution"][row["answer"]] = row["answer_count"]
+
+    per_category = flags.group_by("category", use_threads=False).aggregate([
+        ("category", "count"), ("processed", "sum"), ("has_answer", "sum"),
+        ("has_explanation", "sum"), ("text_corrected", "sum"),
+    ])
+    for row in per_category.to_pylist():
+        results["categories"][row["category"]] = {
+            "total": row["category_count"],
+            "processed": row["processed_sum"],
+            "has_answer": row["has_answer_sum"],
+            "has_explanation": row["has_explanation_sum"],
+            "text_corrected": row["text_corrected_sum"],
+            "answer_dist": Counter(),
+            "issues": []
+        }
+    for row in answered.group_by(["category", "answer"], use_threads=False).aggregate([("answer", "count")]).to_pylist():
+        results["categories"][row["category"]]["answer_dist"][row["answer"]] = row["answer_count"]
+
+    # Sorunlu satırlar (cevapsız veya geçersiz cevap) — sadece bu küçük alt küme satıra açılır
+    problem_mask = pc.or_(pc.invert(has_answer), pc.invert(pc.fill_null(valid_answer, False)))
+    problems = table.filter(problem_mask).select(["category", "file_index", "gpt_answer"]).to_pylist()
+    for p in problems:
+        if p["gpt_answer"]:
+            issue = f"{p['category']} - Soru {p['file_index'] + 1}: Geçersiz cevap '{p['gpt_answer']}'"
+        else:
+            issue = f"{p['category']} - Soru {p['file_index'] + 1}: Cevap yok"
+        results["issues"].append(issue)
+        results["categories"][p["category"]]["issues"].append(issue)
+
+    samples = table.filter(is_corrected).slice(0, 10).select(["category", "question_text", "corrected_question"])
+    for row in samples.to_pylist():
+        original, fixed = row["question_text"] or "", row["corrected_question"]
+        results["sample_corrections"].append({
+            "category": row["category"],
+            "original": original[:200] + "..." if len(original) > 200 else original,
+            "corrected": fixed[:200] + "..." if len(fixed) > 200 else fixed
+        })
+
+    return results
+
+
 def print_report(results: dict):
     """Kalite raporunu yazdır"""
     
@@ -149,15 +243,21 @@ def print_report(results: dict):
 
 
 if __name__ == "__main__":
-    results = analyze_quality()
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="GPT ile işlenmiş soruların kalite raporu")
+    parser.add_argument("--snapshot", type=str, default=None,
+                        help="JSON dosyaları yerine kolonsal snapshot kullan (örn: snapshots/corpus.arrow)")
+    args = parser.parse_args()
+    
+    results = analyze_quality_snapshot(args.snapshot) if args.snapshot else analyze_quality()
     print_report(results)
     
     # JSON olarak da kaydet
-    with open("yds_questions_gpt/quality_report.json", "w", encoding="utf-8") as f:
-        # Counter'ları dict'e çevir
-        results["answer_distribution"] = dict(results["answer_distribution"])
-        for cat in results["categories"]:
-            results["categories"][cat]["answer_dist"] = dict(results["categories"][cat]["answer_dist"])
-        json.dump(results, f, indent=2, ensure_ascii=False)
+    # Counter'ları dict'e çevir
+    results["answer_distribution"] = dict(results["answer_distribution"])
+    for cat in results["categories"]:
+        results["categories"][cat]["answer_dist"] = dict(results["categories"][cat]["answer_dist"])
+    jsonio.dump(results, "yds_questions_gpt/quality_report.json")
     
     print("\n✓ Rapor kaydedildi: yds_questions_gpt/quality_report.json")
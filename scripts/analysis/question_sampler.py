@@ -0,0 +1,119 @@
+"""
+Bellek İçi Soru Örnekleyici
+
+Quiz preset üretimi için soru ID'lerini ve cevap/geçerlilik bayraklarını tek
+sorguyla yükler, YDS kategorisi başına kompakt NumPy dizileri olarak tutar ve
+seed'li bir generator ile tekrarsız örnekleme yapar. Her preset için
+`ORDER BY RANDOM()` ile tüm tabloyu sıralamaya gerek kalmaz.
+
+Kullanım:
+    from scripts.analysis.question_sampler import QuestionSampler
+
+    sampler = QuestionSampler.from_database(seed=42)
+    ids = sampler.sample("YDS Gramer", 10)
+    extra = sampler.sample_any(5, exclude=ids)
+"""
+
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+from scripts.db_utils import execute_query
+from scripts.constants import CATEGORY_ALIASES, resolve_yds_category
+
+# Zorluk seviyeleri (kod = indeks); boş/bilinmeyen değerler DB varsayılanı 'medium' sayılır
+DIFFICULTY_LEVELS = ("easy", "medium", "hard")
+DEFAULT_DIFFICULTY = DIFFICULTY_LEVELS.index("medium")
+
+
+def encode_difficulties(values: Iterable[Optional[str]]) -> np.ndarray:
+    """Zorluk metinlerini 0/1/2 kodlarına çevir"""
+    code_of = {level: code for code, level in enumerate(DIFFICULTY_LEVELS)}
+    return np.array([code_of.get((v or "").strip().lower(), DEFAULT_DIFFICULTY) for v in values],
+                    dtype=np.int8)
+
+
+class QuestionSampler:
+    """YDS kategorisi başına uygun soru ID havuzları + seed'li generator"""
+
+    def __init__(self, ids: np.ndarray, categories: List[Optional[str]],
+                 has_answer: np.ndarray, is_valid: np.ndarray,
+                 seed: Optional[int] = None, require_valid: bool = True,
+                 difficulties: Optional[List[Optional[str]]] = None):
+        self.rng = np.random.default_rng(seed)
+
+        ids = np.asarray(ids, dtype=np.int64)
+        if difficulties is None:
+            difficulty = np.full(ids.size, DEFAULT_DIFFICULTY, dtype=np.int8)
+        else:
+            difficulty = encode_difficulties(difficulties)
+        eligible = np.asarray(has_answer, dtype=bool)
+        if require_valid:
+            eligible &= np.asarray(is_valid, dtype=bool)
+
+        # Kategorileri kanonik YDS kategorisine çevir ve kodla (dictionary encoding);
+        # kanonik isimler kendilerine eşlendiği için yds_category kolonu da doğrudan verilebilir
+        names, codes = np.unique(np.array([resolve_yds_category(c) or "" for c in categories], dtype=np.str_),
+                                 return_inverse=True)
+        code_of = {name: code for code, name in enumerate(names)}
+
+        self.eligible_ids = np.sort(ids[eligible])
+        self.pools: Dict[str, np.ndarray] = {}
+        self.pool_difficulties: Dict[str, np.ndarray] = {}  # pools ile hizalı zorluk kodları
+        for yds_cat in CATEGORY_ALIASES:
+            if yds_cat in code_of:
+                mask = eligible & (codes == code_of[yds_cat])
+            else:
+                mask = np.zeros(ids.size, dtype=bool)
+            order = np.argsort(ids[mask], kind="stable")
+            self.pools[yds_cat] = ids[mask][order]
+            self.pool_difficulties[yds_cat] = difficulty[mask][order]
+
+    @classmethod
+    def from_database(cls, seed: Optional[int] = None, require_valid: bool = True) -> "QuestionSampler":
+        """Tüm soruların ID, kategori, bayrak ve zorluklarını tek sorguda yükle"""
+        rows = execute_query("""
+            SELECT id, COALESCE(yds_category, category) AS category,
+                   (correct_answer IS NOT NULL AND correct_answer != '') AS has_answer,
+                   COALESCE(is_valid, true) AS is_valid,
+                   difficulty
+            FROM questions
+        """, fetch_all=True, use_dict_cursor=False)
+        rows = rows or []
+        return cls(
+            ids=[r[0] for r in rows],
+            categories=[r[1] for r in rows],
+            has_answer=[bool(r[2]) for r in rows],
+            is_valid=[bool(r[3]) for r in rows],
+            seed=seed,
+            require_valid=require_valid,
+            difficulties=[r[4] for r in rows],
+        )
+
+    def pool_size(self, yds_category: str) -> int:
+        """Kategoride örneklenebilir soru sayısı"""
+        return int(self.pools.get(yds_category, np.empty(0)).size)
+
+    def _draw(self, pool: np.ndarray, n: int, exclude: Optional[Iterable[int]]) -> np.ndarray:
+        if exclude is not None:
+            exclude = np.fromiter(exclude, dtype=np.int64)
+            if exclude.size:
+                pool = pool[~np.isin(pool, exclude, assume_unique=False)]
+        n = min(n, pool.size)
+        if n <= 0:
+            return np.empty(0, dtype=np.int64)
+        return self.rng.choice(pool, size=n, replace=False)
+
+    def sample(self, yds_category: str, n: int, exclude: Optional[Iterable[int]] = None) -> np.ndarray:
+        """YDS kategorisinden n soru (tekrarsız); havuz yetmezse daha az döner"""
+        pool = self.pools.get(yds_category, np.empty(0, dtype=np.int64))
+        return self._draw(pool, n, exclude)
+
+    def sample_any(self, n: int, exclude: Optional[Iterable[int]] = None) -> np.ndarray:
+        """Tüm uygun sorulardan n soru (eksik kategorileri tamamlamak için)"""
+        return self._draw(self.eligible_ids, n, exclude)
+
+    def shuffle(self, ids: List[int]) -> List[int]:
+        """ID listesini aynı generator ile karıştır"""
+        ids = np.asarray(ids, dtype=np.int64)
+        return self.rng.permutation(ids).tolist()
@@ -5,14 +5,23 @@ Veritabanındaki soru ve şıklardan kelime frekansı çıkarır.
 Çok kelimeli ifadeler (phrasal verbs, collocations, prepositional phrases)
 önce tek birim olarak tespit edilir, sonra kalan kelimeler unigram olarak sayılır.
 
+Streaming modda sorular server-side (named) cursor ile parça parça okunur ve
+tek geçişte hem genel hem kategori analizcilerine verilir; ne satırlar ne de
+sayaçlar soru sayısıyla büyür (--index / --matrix hariç).
+
 Kullanım:
     python word_frequency_analysis.py
     python word_frequency_analysis.py --category "YDS Gramer"
     python word_frequency_analysis.py --top 200
     python word_frequency_analysis.py --min-freq 5
+    python word_frequency_analysis.py --index
+    python word_frequency_analysis.py --mode streaming --capacity 5000
+    python word_frequency_analysis.py --matrix
 
 Çıktı:
     word_frequency_results.json
+    word_frequency_index.bin (--index ile, ifade → soru ID ters indeksi)
+    word_frequency_matrix.npz (--matrix ile, soru × ifade CSR matrisi)
 """
 
 import argparse
@@ -20,11 +29,17 @@ import json
 import re
 import sys
 import time
-from collections import Counter
+from collections import Counter, defaultdict
 from datetime import datetime
+from typing import Iterator
+
+from psycopg2.extras import RealDictCursor
 
-from scripts.db_utils import execute_query
-from scripts.english_phrases import get_phrases_by_length, get_stop_words, get_all_phrases
+from scripts import jsonio
+from scripts.db_utils import execute_query, get_categories, get_db_connection
+from scripts.english_phrases import load_phrase_dictionary
+from scripts.analysis.inverted_index import InvertedIndex
+from scripts.analysis.heavy_hitters import SpaceSaving
 
 
 # ============================================================
@@ -73,6 +88,18 @@ def extract_options_text(options) -> str:
     return " ".join(texts)
 
 
+def question_texts(q: dict) -> list:
+    """Sorunun analiz edilecek İngilizce metinleri: soru, şıklar ve ipucu"""
+    texts = [q.get('question_text', ''), extract_options_text(q.get('options'))]
+    
+    # Türkçe çeviri ve açıklamayı ATLA (İngilizce frekans isteniyor)
+    # Ama tip alanı İngilizce olabilir
+    tip = q.get('tip', '')
+    if tip and not any(c in tip for c in 'çşğüöıÇŞĞÜÖİ'):
+        texts.append(tip)
+    return texts
+
+
 # ============================================================
 # HİBRİT FREKANS ANALİZİ
 # ============================================================
@@ -85,33 +112,59 @@ class HybridFrequencyAnalyzer:
     3. Eşleşen pozisyonları işaretle
     4. İşaretlenmemiş kelimeleri unigram olarak say
     5. Stop words filtrele
+    
+    track_documents=True ise her ifadenin hangi soruda geçtiği de tutulur
+    (ters indeks için, bkz. inverted_index.py).
+    
+    mode="streaming" ise sayaçlar sabit kapasiteli Space-Saving yapısıdır
+    (bkz. heavy_hitters.py); sonuçlar hata sınırıyla birlikte raporlanır.
     """
     
-    def __init__(self):
-        self.phrases_by_length = get_phrases_by_length()
-        self.stop_words = get_stop_words()
-        self.all_phrases = get_all_phrases()
+    def __init__(self, track_documents: bool = False, mode: str = "exact",
+                 capacity: int = 10000):
+        if mode not in ("exact", "streaming"):
+            raise ValueError(f"Geçersiz mod: {mode}")
+        self.mode = mode
+        
+        # Derlenmiş sözlük süreç başına bir kez yüklenir, tüm analizciler paylaşır
+        dictionary = load_phrase_dictionary()
+        self.phrases_by_length = dictionary.by_length
+        self.stop_words = dictionary.stop_words
+        self.all_phrases = dictionary.phrases
         
         # Uzundan kısaya sıralı kelime sayıları
-        self.sorted_lengths = sorted(self.phrases_by_length.keys(), reverse=True)
-        self.max_phrase_len = self.sorted_lengths[0] if self.sorted_lengths else 1
+        self.sorted_lengths = dictionary.sorted_lengths
+        self.max_phrase_len = dictionary.max_phrase_len
         
         # Sayaçlar
-        self.phrase_counter = Counter()    # Çok kelimeli ifadeler
-        self.word_counter = Counter()      # Tekil kelimeler
-        self.combined_counter = Counter()  # Birleşik (hepsi)
+        if mode == "streaming":
+            # Phrase ve kelime anahtarları ayrık; birleşik liste sonuçta türetilir
+            self.phrase_counter = SpaceSaving(capacity)
+            self.word_counter = SpaceSaving(capacity)
+            self.combined_counter = None
+        else:
+            self.phrase_counter = Counter()    # Çok kelimeli ifadeler
+            self.word_counter = Counter()      # Tekil kelimeler
+            self.combined_counter = Counter()  # Birleşik (hepsi)
+        
+        # Soru bazlı ifade sayıları: {soru_id: Counter}
+        self.document_terms = defaultdict(Counter) if track_documents else None
         
         # İstatistikler
         self.total_texts = 0
         self.total_phrase_matches = 0
         self.total_word_matches = 0
     
-    def analyze_text(self, text: str):
+    def analyze_text(self, text: str, doc_id: int = None):
         """Tek bir metni analiz et — sliding window yaklaşımı"""
         cleaned = clean_text(text)
         if not cleaned:
             return
         
+        doc_terms = None
+        if self.document_terms is not None and doc_id is not None:
+            doc_terms = self.document_terms[doc_id]
+        
         self.total_texts += 1
         words = cleaned.split()
         n = len(words)
@@ -127,9 +180,14 @@ class HybridFrequencyAnalyzer:
                     continue
                 candidate = " ".join(words[i:i + length])
                 if candidate in phrases_set:
-                    self.phrase_counter[candidate] += 1
-                    self.combined_counter[candidate] += 1
+                    if self.combined_counter is None:
+                        self.phrase_counter.add(candidate)
+                    else:
+                        self.phrase_counter[candidate] += 1
+                        self.combined_counter[candidate] += 1
                     self.total_phrase_matches += 1
+                    if doc_terms is not None:
+                        doc_terms[candidate] += 1
                     for j in range(i, i + length):
                         used[j] = True
         
@@ -145,12 +203,19 @@ class HybridFrequencyAnalyzer:
             if not word.isalpha():
                 continue
             
-            self.word_counter[word] += 1
-            self.combined_counter[word] += 1
+            if self.combined_counter is None:
+                self.word_counter.add(word)
+            else:
+                self.word_counter[word] += 1
+                self.combined_counter[word] += 1
             self.total_word_matches += 1
+            if doc_terms is not None:
+                doc_terms[word] += 1
     
     def get_results(self, top_n: int = 500, min_freq: int = 2) -> dict:
         """Analiz sonuçlarını döndür"""
+        if self.mode == "streaming":
+            return self._get_streaming_results(top_n, min_freq)
         
         # Birleşik sıralama
         combined_top = [
@@ -192,47 +257,117 @@ class HybridFrequencyAnalyzer:
                 "phrase_dictionary_size": len(self.all_phrases),
             }
         }
+    
+    def _get_streaming_results(self, top_n: int, min_freq: int) -> dict:
+        """Space-Saving sayaçlarından sonuç üret (count = üst sınır, error = en fazla fazlalık)"""
+        
+        def entry(counter: SpaceSaving, expr: str, count: int) -> dict:
+            error = counter.error(expr)
+            return {
+                "expression": expr,
+                "count": count,
+                "error": error,
+                "guaranteed_count": count - error,
+            }
+        
+        # Anahtarlar ayrık olduğu için iki listeyi birleştirip sıralamak yeterli
+        merged = [(self.phrase_counter, expr, count) for expr, count in self.phrase_counter.most_common(top_n)]
+        merged += [(self.word_counter, expr, count) for expr, count in self.word_counter.most_common(top_n)]
+        merged.sort(key=lambda item: item[2], reverse=True)
+        
+        combined_top = [
+            {
+                **entry(counter, expr, count),
+                "type": "phrase" if expr in self.all_phrases else "word",
+                "word_count": len(expr.split())
+            }
+            for counter, expr, count in merged[:top_n]
+            if count >= min_freq
+        ]
+        
+        phrases_top = [
+            {**entry(self.phrase_counter, expr, count), "word_count": len(expr.split())}
+            for expr, count in self.phrase_counter.most_common(200)
+            if count >= min_freq
+        ]
+        
+        words_top = [
+            entry(self.word_counter, expr, count)
+            for expr, count in self.word_counter.most_common(300)
+            if count >= min_freq
+        ]
+        
+        return {
+            "combined": combined_top,
+            "phrases_only": phrases_top,
+            "words_only": words_top,
+            "stats": {
+                "total_texts_analyzed": self.total_texts,
+                "total_phrase_matches": self.total_phrase_matches,
+                "total_word_matches": self.total_word_matches,
+                "unique_phrases_found": len(self.phrase_counter),
+                "unique_words_found": len(self.word_counter),
+                "unique_combined": len(self.phrase_counter) + len(self.word_counter),
+                "phrase_dictionary_size": len(self.all_phrases),
+                "mode": "streaming",
+                "capacity": self.phrase_counter.capacity,
+                # İzlenmeyen ifadelerin gerçek sayısı bu değerleri aşamaz
+                "unmonitored_phrase_max": self.phrase_counter.min_count,
+                "unmonitored_word_max": self.word_counter.min_count,
+            }
+        }
 
 
 # ============================================================
 # VERİTABANI SORGULAMA
 # ============================================================
 
+QUESTIONS_SQL = """
+    SELECT id, question_text, options, correct_answer, category,
+           question_tr, explanation_tr, tip
+    FROM questions
+"""
+STREAM_BATCH_SIZE = 2000
+
+
 def fetch_questions(category: str = None) -> list:
     """Veritabanından soruları çek"""
     if category:
-        sql = """
-            SELECT question_text, options, correct_answer, category,
-                   question_tr, explanation_tr, tip
-            FROM questions
-            WHERE category = %s
-        """
-        return execute_query(sql, (category,), fetch_all=True, use_dict_cursor=True)
-    else:
-        sql = """
-            SELECT question_text, options, correct_answer, category,
-                   question_tr, explanation_tr, tip
-            FROM questions
-        """
-        return execute_query(sql, fetch_all=True, use_dict_cursor=True)
+        return execute_query(QUESTIONS_SQL + " WHERE category = %s", (category,),
+                             fetch_all=True, use_dict_cursor=True)
+    return execute_query(QUESTIONS_SQL, fetch_all=True, use_dict_cursor=True)
+
+
+def iter_questions(category: str = None, batch_size: int = STREAM_BATCH_SIZE) -> Iterator[dict]:
+    """Soruları server-side (named) cursor ile getir: satırlar sunucuda kalır, batch_size kadar çekilir"""
+    sql = QUESTIONS_SQL + (" WHERE category = %s" if category else "")
+    with get_db_connection() as conn:
+        cur = conn.cursor(name="word_frequency_questions", cursor_factory=RealDictCursor)
+        cur.itersize = batch_size
+        try:
+            cur.execute(sql, (category,) if category else None)
+            while True:
+                rows = cur.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield from rows
+        finally:
+            cur.close()
+            conn.rollback()
 
 
 def fetch_categories() -> list:
-    """Kategorileri getir"""
-    sql = """
-        SELECT DISTINCT category, COUNT(*) as count
-        FROM questions
-        GROUP BY category
-        ORDER BY count DESC
-    """
-    return execute_query(sql, fetch_all=True, use_dict_cursor=True)
+    """Kategorileri getir (question_category_stats tablosundan)"""
+    return get_categories()
 
 
 # ============================================================
 # ANA FONKSİYON
 # ============================================================
 
-def run_analysis(category: str = None, top_n: int = 500, min_freq: int = 2):
+def run_analysis(category: str = None, top_n: int = 500, min_freq: int = 2,
+                 build_index: bool = False, mode: str = "exact", capacity: int = 10000,
+                 build_matrix: bool = False):
     """Ana analiz fonksiyonu"""
     
     print("=" * 70)
@@ -247,41 +382,57 @@ def run_analysis(category: str = None, top_n: int = 500, min_freq: int = 2):
         marker = " 👈" if category and cat['category'] == category else ""
         print(f"   - {cat['category']}: {cat['count']} soru{marker}")
     
-    # Soruları çek
-    print(f"\n📥 Sorular yükleniyor...")
-    start = time.time()
-    questions = fetch_questions(category)
-    print(f"   {len(questions)} soru yüklendi ({time.time() - start:.1f}sn)")
-    
-    if not questions:
-        print("❌ Soru bulunamadı!")
-        return
+    # Soruları çek: exact modda hepsi bir kerede, streaming modda cursor'dan parça parça
+    if mode == "streaming":
+        questions = iter_questions(category)
+    else:
+        print(f"\n📥 Sorular yükleniyor...")
+        start = time.time()
+        questions = fetch_questions(category)
+        print(f"   {len(questions)} soru yüklendi ({time.time() - start:.1f}sn)")
     
     # Analiz başlat
-    analyzer = HybridFrequencyAnalyzer()
+    analyzer = HybridFrequencyAnalyzer(track_documents=build_index or build_matrix,
+                                       mode=mode, capacity=capacity)
+    if mode == "streaming":
+        print(f"\n🧮 Streaming mod: ifade ve kelime için en fazla {capacity} anahtar izlenecek")
+        if capacity < top_n:
+            print(f"   ⚠️ Kapasite ({capacity}) --top değerinden ({top_n}) küçük; sonuçlar kesilecek")
+    
+    # Kategori analizcileri aynı geçişte beslenir (soru listesi tekrar taranmaz)
+    cat_analyzers = {} if category else {
+        cat['category']: HybridFrequencyAnalyzer(mode=mode, capacity=capacity) for cat in categories
+    }
+    cat_counts = Counter()
+    doc_categories = {}
     
     print(f"\n🔍 Analiz ediliyor...")
     start = time.time()
     
-    for i, q in enumerate(questions):
-        # Soru metnini analiz et
-        analyzer.analyze_text(q.get('question_text', ''))
+    total_questions = 0
+    for q in questions:
+        total_questions += 1
+        # Soru metni, şıklar ve (İngilizce ise) ipucu
+        for text in question_texts(q):
+            analyzer.analyze_text(text, doc_id=q.get('id'))
+        if build_index or build_matrix:
+            doc_categories[q['id']] = q.get('category')
         
-        # Şıkları analiz et
-        options_text = extract_options_text(q.get('options'))
-        analyzer.analyze_text(options_text)
+        cat_analyzer = cat_analyzers.get(q.get('category'))
+        if cat_analyzer is not None:
+            cat_analyzer.analyze_text(q.get('question_text', ''))
+            cat_analyzer.analyze_text(extract_options_text(q.get('options')))
+            cat_counts[q.get('category')] += 1
         
-        # Türkçe çeviri ve açıklamayı ATLA (İngilizce frekans isteniyor)
-        # Ama tip alanı İngilizce olabilir
-        tip = q.get('tip', '')
-        if tip and not any(c in tip for c in 'çşğüöıÇŞĞÜÖİ'):
-            analyzer.analyze_text(tip)
-        
-        if (i + 1) % 1000 == 0:
-            print(f"   İlerleme: {i + 1}/{len(questions)}")
+        if total_questions % 1000 == 0:
+            print(f"   İlerleme: {total_questions} soru")
+    
+    if not total_questions:
+        print("❌ Soru bulunamadı!")
+        return
     
     elapsed = time.time() - start
-    print(f"   ✅ Analiz tamamlandı ({elapsed:.1f}sn)")
+    print(f"   ✅ Analiz tamamlandı: {total_questions} soru ({elapsed:.1f}sn)")
     
     # Sonuçları al
     results = analyzer.get_results(top_n=top_n, min_freq=min_freq)
@@ -317,22 +468,13 @@ def run_analysis(category: str = None, top_n: int = 500, min_freq: int = 2):
     
     # Kategori bazlı analiz
     if not category:
-        print(f"\n📂 Kategori Bazlı Analiz başlatılıyor...")
+        print(f"\n📂 Kategori Bazlı Analiz sonuçları...")
         category_results = {}
         
-        for cat in categories:
-            cat_name = cat['category']
-            cat_questions = [q for q in questions if q.get('category') == cat_name]
-            
-            cat_analyzer = HybridFrequencyAnalyzer()
-            for q in cat_questions:
-                cat_analyzer.analyze_text(q.get('question_text', ''))
-                options_text = extract_options_text(q.get('options'))
-                cat_analyzer.analyze_text(options_text)
-            
+        for cat_name, cat_analyzer in cat_analyzers.items():
             cat_results = cat_analyzer.get_results(top_n=50, min_freq=2)
             category_results[cat_name] = {
-                "question_count": len(cat_questions),
+                "question_count": cat_counts[cat_name],
                 "top_expressions": cat_results['combined'][:30],
                 "top_phrases": cat_results['phrases_only'][:15],
                 "stats": cat_results['stats']
@@ -348,16 +490,37 @@ def run_analysis(category: str = None, top_n: int = 500, min_freq: int = 2):
             "category": category or "ALL",
             "top_n": top_n,
             "min_freq": min_freq,
-            "total_questions": len(questions)
+            "mode": mode,
+            "total_questions": total_questions
         },
         **results
     }
     
     output_file = "word_frequency_results.json"
-    with open(output_file, "w", encoding="utf-8") as f:
-        json.dump(output, f, indent=2, ensure_ascii=False)
+    jsonio.dump(output, output_file)
     
     print(f"\n💾 Sonuçlar kaydedildi: {output_file}")
+    
+    # Ters indeks: ifade → soru ID'leri
+    if build_index:
+        index = InvertedIndex.build(analyzer.document_terms, doc_categories)
+        index_file = "word_frequency_index.bin"
+        size = index.save(index_file)
+        print(f"🗂️  Ters indeks kaydedildi: {index_file} "
+              f"({len(index)} ifade, {size / 1024:.1f} KB)")
+    
+    # Doküman-terim matrisi: soru × ifade (SciPy CSR)
+    if build_matrix:
+        from scripts.analysis.document_term_matrix import (
+            build_document_term_matrix, save_document_term_matrix
+        )
+        dtm = build_document_term_matrix(analyzer.document_terms, doc_categories, analyzer.all_phrases)
+        matrix_file = "word_frequency_matrix.npz"
+        save_document_term_matrix(matrix_file, dtm)
+        rows, cols = dtm.matrix.shape
+        print(f"🧮 Doküman-terim matrisi kaydedildi: {matrix_file} "
+              f"({rows} soru x {cols} ifade, {dtm.matrix.nnz} dolu hücre)")
+    
     print(f"{'=' * 70}")
 
 
@@ -366,6 +529,14 @@ if __name__ == "__main__":
     parser.add_argument("--category", type=str, default=None, help="Belirli bir kategori filtresi")
     parser.add_argument("--top", type=int, default=500, help="En çok kaç ifade gösterilsin (varsayılan: 500)")
     parser.add_argument("--min-freq", type=int, default=2, help="Minimum frekans eşiği (varsayılan: 2)")
+    parser.add_argument("--index", action="store_true", help="İfade → soru ID ters indeksini de oluştur")
+    parser.add_argument("--matrix", action="store_true", help="Soru × ifade CSR matrisini .npz olarak kaydet")
+    parser.add_argument("--mode", choices=["exact", "streaming"], default="exact",
+                        help="Sayım modu: exact (varsayılan) veya sabit bellekli streaming (Space-Saving)")
+    parser.add_argument("--capacity", type=int, default=10000,
+                        help="Streaming modda ifade/kelime başına izlenecek anahtar sayısı (varsayılan: 10000)")
     
     args = parser.parse_args()
-    run_analysis(category=args.category, top_n=args.top, min_freq=args.min_freq)
+    run_analysis(category=args.category, top_n=args.top, min_freq=args.min_freq,
+                 build_index=args.index, mode=args.mode, capacity=args.capacity,
+                 build_matrix=args.matrix)
@@ -59,6 +59,21 @@ CATEGORY_ALIASES = {
     "YDS Phrasal Verbs / Prepositions": ["YDS Phrasal Verbs / Prepositions", "Phrasal Verbs"],
 }
 
+# Ters alias haritası (DB kategorisi → kanonik YDS kategorisi), bir kez hesaplanır.
+# questions.yds_category kolonu ingest sırasında bu harita ile doldurulur.
+CATEGORY_TO_YDS = {
+    alias: yds_cat
+    for yds_cat, aliases in CATEGORY_ALIASES.items()
+    for alias in aliases
+}
+
+
+def resolve_yds_category(category):
+    """DB kategorisini kanonik YDS kategorisine çevir (eşlenmiyorsa None)"""
+    if not category:
+        return None
+    return CATEGORY_TO_YDS.get(category.strip())
+
 # YDS Dosya Yolları
 YDS_FILES = [
     ("yds_questions/grammar_revision.json", "YDS Gramer"),
@@ -5,7 +5,7 @@ PostgreSQL bağlantı ve sorgu yönetimi
 
 import psycopg2
 from psycopg2.extras import RealDictCursor
-from psycopg2 import pool
+from psycopg2 import pool, errors
 from typing import Optional, Any, Callable, List, Dict
 from contextlib import contextmanager
 import time
@@ -207,16 +207,58 @@ def batch_insert(table: str, columns: List[str], values: List[tuple],
     return inserted
 
 
-def get_categories() -> List[Dict]:
-    """Get all question categories from database"""
-    query = """
-        SELECT DISTINCT category, COUNT(*) as count 
-        FROM questions 
-        WHERE category IS NOT NULL
-        GROUP BY category 
+def get_category_stats(detailed: bool = False) -> List[Dict]:
+    """
+    Get per-category question counts from question_category_stats
+    
+    Args:
+        detailed: Return (category, difficulty, gpt_status) rows instead of per-category totals
+    
+    Returns:
+        Rows with category, count, with_answer, validated, invalid
+        (plus difficulty and gpt_status when detailed)
+    
+    Falls back to a full table scan if the stats table has not been created yet
+    (see scripts/migration/category_stats.py).
+    """
+    group_columns = "category, difficulty, gpt_status" if detailed else "category"
+    stats_query = f"""
+        SELECT {group_columns},
+               SUM(total)::int AS count,
+               SUM(with_answer)::int AS with_answer,
+               SUM(validated)::int AS validated,
+               SUM(invalid)::int AS invalid
+        FROM question_category_stats
+        GROUP BY {group_columns}
+        HAVING SUM(total) > 0
         ORDER BY count DESC
     """
-    return execute_query(query, fetch_all=True, use_dict_cursor=True)
+    try:
+        return execute_query(stats_query, fetch_all=True, use_dict_cursor=True)
+    except errors.UndefinedTable:
+        scan_columns = ("category, COALESCE(difficulty, '') AS difficulty, COALESCE(gpt_status, '') AS gpt_status"
+                        if detailed else "category")
+        scan_group = "1, 2, 3" if detailed else "1"
+        scan_query = f"""
+            SELECT {scan_columns},
+                   COUNT(*) AS count,
+                   COUNT(*) FILTER (WHERE correct_answer IS NOT NULL AND correct_answer != '') AS with_answer,
+                   COUNT(*) FILTER (WHERE gpt_verified_at IS NOT NULL) AS validated,
+                   COUNT(*) FILTER (WHERE is_valid = false) AS invalid
+            FROM questions
+            WHERE category IS NOT NULL
+            GROUP BY {scan_group}
+            ORDER BY count DESC
+        """
+        return execute_query(scan_query, fetch_all=True, use_dict_cursor=True)
+
+
+def get_categories() -> List[Dict]:
+    """Get all question categories with their question counts"""
+    return [
+        {'category': row['category'], 'count': row['count']}
+        for row in get_category_stats()
+    ]
 
 
 def check_question_exists(question_text: str, category: str) -> bool:
@@ -4,8 +4,14 @@ YDS/YÖKDİL sınavlarında sıkça karşılaşılan phrasal verbs, collocations
 prepositional phrases, conjunctions ve fixed expressions.
 
 Frekans analizinde bu ifadeler tek birim olarak sayılır.
+
+Derlenmiş sözlük (eşleştirici yapısı + stop words) süreç başına bir kez, bellekte
+oluşturulur ve tüm analizciler tarafından paylaşılır.
 """
 
+import hashlib
+from typing import Dict, FrozenSet, NamedTuple, Optional, Tuple
+
 # ============================================================
 # PHRASAL VERBS (600+)
 # ============================================================
@@ -494,28 +500,85 @@ STOP_WORDS = {
 }
 
 
-def get_all_phrases():
-    """Tüm çok kelimeli ifadeleri birleşik set olarak döndür (lowercase)"""
-    all_phrases = set()
-    for phrase_list in [PHRASAL_VERBS, PREPOSITIONAL_PHRASES, 
-                        CONJUNCTIONS_LINKERS, ACADEMIC_COLLOCATIONS]:
+# ============================================================
+# DERLENMİŞ SÖZLÜK
+# ============================================================
+
+class PhraseDictionary(NamedTuple):
+    """Derlenmiş, değişmez ifade sözlüğü (tüm analizciler aynı nesneyi paylaşır)"""
+    content_hash: str
+    phrases: FrozenSet[str]                  # Tüm ifadeler (lowercase)
+    by_length: Dict[int, FrozenSet[str]]     # Kelime sayısı → ifadeler
+    sorted_lengths: Tuple[int, ...]          # Uzundan kısaya kelime sayıları
+    max_phrase_len: int
+    stop_words: FrozenSet[str]
+
+
+_phrase_dictionary: Optional[PhraseDictionary] = None
+
+
+def _source_lists():
+    return [PHRASAL_VERBS, PREPOSITIONAL_PHRASES, CONJUNCTIONS_LINKERS, ACADEMIC_COLLOCATIONS]
+
+
+def phrase_dictionary_hash() -> str:
+    """Kaynak listelerin içerik hash'i (sözlük sürümünü tanımlar)"""
+    digest = hashlib.sha256()
+    for phrase_list in _source_lists():
+        digest.update("\n".join(phrase_list).encode("utf-8"))
+        digest.update(b"\x00")
+    digest.update("\n".join(sorted(STOP_WORDS)).encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+def compile_phrase_dictionary(content_hash: str = None) -> PhraseDictionary:
+    """Ham listelerden eşleştirici yapısını derle"""
+    phrases = set()
+    for phrase_list in _source_lists():
         for phrase in phrase_list:
-            all_phrases.add(phrase.lower().strip())
-    return all_phrases
+            phrases.add(phrase.lower().strip())
+
+    by_length = {}
+    for phrase in phrases:
+        by_length.setdefault(len(phrase.split()), set()).add(phrase)
+
+    sorted_lengths = tuple(sorted(by_length, reverse=True))
+    return PhraseDictionary(
+        content_hash=content_hash or phrase_dictionary_hash(),
+        phrases=frozenset(phrases),
+        by_length={length: frozenset(group) for length, group in by_length.items()},
+        sorted_lengths=sorted_lengths,
+        max_phrase_len=sorted_lengths[0] if sorted_lengths else 1,
+        stop_words=frozenset(STOP_WORDS),
+    )
+
+
+def load_phrase_dictionary() -> PhraseDictionary:
+    """Derlenmiş sözlüğü döndür (süreç başına bir kez derlenir)"""
+    global _phrase_dictionary
+    if _phrase_dictionary is None:
+        _phrase_dictionary = compile_phrase_dictionary()
+    return _phrase_dictionary
+
+
+def get_all_phrases():
+    """Tüm çok kelimeli ifadeleri birleşik set olarak döndür (lowercase, değişmez)"""
+    return load_phrase_dictionary().phrases
 
 
 def get_phrases_by_length():
-    """İfadeleri kelime sayısına göre grupla (uzundan kısaya sıralı)"""
-    all_phrases = get_all_phrases()
-    by_length = {}
-    for phrase in all_phrases:
-        word_count = len(phrase.split())
-        if word_count not in by_length:
-            by_length[word_count] = set()
-        by_length[word_count].add(phrase)
-    return by_length
+    """İfadeleri kelime sayısına göre grupla"""
+    return dict(load_phrase_dictionary().by_length)
 
 
 def get_stop_words():
     """Stop words setini döndür"""
     return STOP_WORDS
+
+
+if __name__ == "__main__":
+    dictionary = load_phrase_dictionary()
+    print(f"📚 {len(dictionary.phrases)} ifade, {len(dictionary.stop_words)} stop word "
+          f"(hash: {dictionary.content_hash})")
+    for length in dictionary.sorted_lengths:
+        print(f"   {length} kelime: {len(dictionary.by_length[length])}")
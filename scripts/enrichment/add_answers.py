@@ -1,7 +1,7 @@
-import json
 import asyncio
 from datetime import datetime
 
+from scripts import jsonio
 from scripts.openai_utils import get_openai_client
 
 client = get_openai_client()
@@ -52,8 +52,7 @@ async def process_file(filepath: str):
     """Bir dosyadaki tüm sorular için cevapları al"""
     print(f"\nİşleniyor: {filepath}")
     
-    with open(filepath, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = jsonio.load(filepath)
     
     questions = data.get("questions", [])
     total = len(questions)
@@ -90,8 +89,7 @@ async def process_file(filepath: str):
     data["with_answer_count"] = len([q for q in questions if q.get("correct_answer")])
     data["answers_added_at"] = datetime.now().isoformat()
     
-    with open(filepath, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    jsonio.dump(data, filepath)
     
     print(f"  ✓ {data['with_answer_count']}/{total} soru cevaplı")
 
@@ -128,23 +126,20 @@ async def main():
     # Özet güncelle
     summary_file = os.path.join(questions_dir, "_summary.json")
     if os.path.exists(summary_file):
-        with open(summary_file, "r", encoding="utf-8") as f:
-            summary = json.load(f)
+        summary = jsonio.load(summary_file)
         
         total_with_answer = 0
         for cat, info in summary.get("categories", {}).items():
             cat_file = os.path.join(questions_dir, info["file"])
             if os.path.exists(cat_file):
-                with open(cat_file, "r", encoding="utf-8") as f:
-                    cat_data = json.load(f)
+                cat_data = jsonio.load(cat_file)
                 info["with_answer"] = cat_data.get("with_answer_count", 0)
                 total_with_answer += info["with_answer"]
         
         summary["total_with_answer"] = total_with_answer
         summary["answers_added_at"] = datetime.now().isoformat()
         
-        with open(summary_file, "w", encoding="utf-8") as f:
-            json.dump(summary, f, indent=2, ensure_ascii=False)
+        jsonio.dump(summary, summary_file)
         
         print(f"\nToplam cevaplı soru: {total_with_answer}")
 
@@ -1,7 +1,7 @@
 """questions.json dosyasındaki soruları GPT ile cevapla"""
-import json
 import asyncio
 
+from scripts import jsonio
 from scripts.openai_utils import get_openai_client
 
 client = get_openai_client()
@@ -23,8 +23,7 @@ Cevap:"""
     return r.choices[0].message.content.strip().upper()[0]
 
 async def main():
-    with open('questions.json', 'r', encoding='utf-8') as f:
-        qs = json.load(f)
+    qs = jsonio.load('questions.json')
     
     print(f"Toplam {len(qs)} soru")
     
@@ -34,8 +33,7 @@ async def main():
             q['correct_answer'] = ans
             print(f"{i+1}. Cevap: {ans}")
     
-    with open('questions.json', 'w', encoding='utf-8') as f:
-        json.dump(qs, f, indent=2, ensure_ascii=False)
+    jsonio.dump(qs, 'questions.json')
     print('Kaydedildi!')
 
 if __name__ == "__main__":
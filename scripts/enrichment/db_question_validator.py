@@ -15,8 +15,9 @@ import time
 from datetime import datetime
 from psycopg2.extras import RealDictCursor
 
+from scripts import jsonio
 from scripts.config import get_database_url
-from scripts.db_utils import get_db_connection, execute_query, db_manager
+from scripts.db_utils import get_db_connection, execute_query, db_manager, get_categories
 from scripts.openai_utils import validate_question as _validate_question
 
 DATABASE_URL = get_database_url()
@@ -66,18 +67,6 @@ def parse_options_from_jsonb(options_jsonb):
     return options_jsonb
 
 
-def get_categories():
-    """Veritabanındaki kategorileri getir"""
-    return execute_query(
-        """SELECT DISTINCT category, COUNT(*) as count 
-           FROM questions 
-           WHERE category IS NOT NULL
-           GROUP BY category 
-           ORDER BY count DESC""",
-        fetch_all=True, use_dict_cursor=True
-    )
-
-
 def get_questions_by_category(category: str, limit: int = None, offset: int = 0):
     """Kategoriye göre soruları getir"""
     sql = """
@@ -288,8 +277,7 @@ async def main():
         "categories": all_results
     }
     
-    with open("validation_summary.json", "w", encoding="utf-8") as f:
-        json.dump(summary, f, indent=2, ensure_ascii=False)
+    jsonio.dump(summary, "validation_summary.json")
     
     print(f"\n✅ Özet kaydedildi: validation_summary.json")
 
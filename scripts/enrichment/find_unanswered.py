@@ -1,23 +1,35 @@
 """Tüm JSON dosyalarında cevapsız soruları bul ve cevapla"""
-import json
-import glob
+import os
 import asyncio
 
+from scripts import jsonio
 from scripts.openai_utils import get_openai_client
 
 client = get_openai_client()
 
+# Soru dosyası içermeyen dizinler (node_modules binlerce package.json içerir)
+EXCLUDED_DIRS = {'node_modules', '.git', '__pycache__', '.venv', 'venv', 'icons', 'api', 'src', 'snapshots', 'bundles'}
+
+
+def iter_json_files(root: str = '.'):
+    """Soru JSON dosyalarını dolaş, hariç tutulan dizinlere hiç inme"""
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if d not in EXCLUDED_DIRS and not d.startswith('.'))
+        for filename in sorted(filenames):
+            if filename.endswith('.json'):
+                yield os.path.relpath(os.path.join(dirpath, filename), root)
+
+
 def find_unanswered():
     """Cevapsız soruları bul"""
     unanswered = []
     
-    for filepath in glob.glob('**/*.json', recursive=True):
+    for filepath in iter_json_files():
         if '_summary' in filepath:
             continue
         
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = jsonio.load(filepath)
             
             # Liste mi dict mi?
             if isinstance(data, list):
@@ -78,8 +90,7 @@ async def answer_all():
     for item in unanswered:
         fp = item['filepath']
         if fp not in files_data:
-            with open(fp, 'r', encoding='utf-8') as f:
-                files_data[fp] = json.load(f)
+            files_data[fp] = jsonio.load(fp)
     
     # Cevapla
     semaphore = asyncio.Semaphore(50)
@@ -106,8 +117,7 @@ async def answer_all():
     
     # Kaydet
     for fp, data in files_data.items():
-        with open(fp, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        jsonio.dump(data, fp)
     
     print("Kaydedildi!")
 
@@ -2,6 +2,7 @@ import asyncio
 import json
 from datetime import datetime
 
+from scripts import jsonio
 from scripts.openai_utils import get_openai_client, parse_gpt_response
 
 client = get_openai_client()
@@ -102,8 +103,7 @@ async def process_category(category_file: str, questions_dir: str, output_dir: s
         print(f"  ❌ Dosya bulunamadı: {category_file}")
         return None
     
-    with open(filepath, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = jsonio.load(filepath)
     
     category_name = data.get("category", category_file)
     questions = data.get("questions", [])
@@ -157,8 +157,7 @@ async def process_category(category_file: str, questions_dir: str, output_dir: s
     output_filename = f"gpt_{category_file}"
     output_path = os.path.join(output_dir, output_filename)
     
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(output_data, f, indent=2, ensure_ascii=False)
+    jsonio.dump(output_data, output_path)
     
     print(f"  ✓ Kaydedildi: {output_filename}")
     
@@ -215,8 +214,7 @@ async def main():
     }
     
     summary_path = os.path.join(output_dir, "_summary.json")
-    with open(summary_path, "w", encoding="utf-8") as f:
-        json.dump(summary, f, indent=2, ensure_ascii=False)
+    jsonio.dump(summary, summary_path)
     
     print(f"✓ Özet: {summary_path}")
 
@@ -1,59 +1,32 @@
-"""Eksik soruları yeniden scrape et ve GPT ile cevapla"""
+"""
+Eksik soruları yeniden scrape et ve GPT ile cevapla
+
+Eşzamanlı boru hattı:
+    eksik URL'ler → [kazıma: FETCH_CONCURRENCY worker, PagePool] → sınırlı kuyruk
+                 → [cevaplama: GPT_CONCURRENCY worker] → dosya bazında kayıt
+
+Bir dosyanın tüm eksik soruları işlendiğinde, sadece değiştiyse hemen yazılır.
+"""
 import asyncio
-import json
 import glob
 import os
-import re
 from datetime import datetime
 from playwright.async_api import async_playwright
 
+from scripts import jsonio
 from scripts.openai_utils import get_openai_client
+from scripts.scrapers.browser_service import open_browser
+from scripts.scrapers.crawler import state_path
+from scripts.scrapers.http_client import HttpClient
+from scripts.scrapers.negative_cache import BROKEN, MISSING, NEGATIVE_CACHE_NAME, NegativeCache
+from scripts.scrapers.page_pool import PagePool
+from scripts.scrapers.question_page import PageMissing, QuestionFetcher
 
 client = get_openai_client()
 
-async def scrape_single_question(page) -> dict:
-    """Tek bir soru sayfasını kazır - ana scraper ile aynı selector'lar"""
-    result = {
-        "question_number": "",
-        "question_text": "",
-        "options": [],
-        "correct_answer": None
-    }
-    
-    try:
-        fieldset = await page.query_selector("#commentForm fieldset")
-        if fieldset:
-            fieldset_html = await fieldset.inner_html()
-            
-            num_match = re.search(r'<div[^>]*font-weight[^>]*bold[^>]*>([^<]+)</div>', fieldset_html)
-            if num_match:
-                result["question_number"] = num_match.group(1).strip()
-            
-            text_match = re.search(r'<div[^>]*width:\s*590px[^>]*>(.*?)</div>', fieldset_html, re.DOTALL)
-            if text_match:
-                text = text_match.group(1)
-                text = text.replace("<br>", "\n").replace("<br/>", "\n")
-                text = re.sub(r'<[^>]+>', '', text)
-                result["question_text"] = text.strip()
-        
-        option_elems = await page.query_selector_all(".custom-radio")
-        for opt in option_elems:
-            input_elem = await opt.query_selector("input[type='radio']")
-            label_elem = await opt.query_selector("label")
-            if input_elem and label_elem:
-                value = await input_elem.get_attribute("value")
-                label_html = await label_elem.inner_html()
-                label_text = label_html.replace("<br>", "").replace("<br/>", "").strip()
-                label_text = re.sub(r'<[^>]+>', '', label_text).strip()
-                result["options"].append({
-                    "letter": value,
-                    "text": label_text
-                })
-                
-    except Exception as e:
-        result["error"] = str(e)
-    
-    return result
+FETCH_CONCURRENCY = 5     # Aynı anda çekilen soru sayfası
+GPT_CONCURRENCY = 10      # Aynı anda GPT isteği
+ANSWER_QUEUE_SIZE = 20    # Kazıma → cevaplama kuyruğu (GPT yavaşsa kazıma bekler)
 
 
 async def get_answer_from_gpt(question_text: str, options: list) -> str:
@@ -89,10 +62,15 @@ Doğru cevap:"""
     return None
 
 
-async def retry_failed_questions():
+def update_file_counts(data: dict):
+    data["success_count"] = len([q for q in data["questions"] if q.get("question_text")])
+    data["with_answer_count"] = len([q for q in data["questions"] if q.get("correct_answer")])
+    data["updated_at"] = datetime.now().isoformat()
+
+
+async def retry_failed_questions(output_dir: str = "yds_questions", fetch_concurrency: int = FETCH_CONCURRENCY,
+                                 gpt_concurrency: int = GPT_CONCURRENCY):
     """Eksik soruları yeniden dene"""
-    output_dir = "yds_questions"
-    
     # Eksik soruları bul
     failed_questions = []
     files_data = {}
@@ -101,8 +79,7 @@ async def retry_failed_questions():
         if "_summary" in filepath:
             continue
         
-        with open(filepath, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = jsonio.load(filepath)
         
         files_data[filepath] = data
         
@@ -119,59 +96,119 @@ async def retry_failed_questions():
         print("Eksik soru yok!")
         return
     
-    print(f"Toplam {len(failed_questions)} eksik soru bulundu")
+    # Sitede olmadığı/bozuk olduğu bilinen URL'ler (TTL dolana kadar) denenmez
+    negative = NegativeCache(state_path(output_dir, NEGATIVE_CACHE_NAME))
+    unknown = [fq for fq in failed_questions if negative.get(fq["url"]) is None]
+    
+    print(f"Toplam {len(failed_questions)} eksik soru bulundu "
+          f"({len(failed_questions) - len(unknown)} tanesi negatif önbellekte, atlanıyor)")
+    print(f"Kazıma: {fetch_concurrency} paralel, GPT: {gpt_concurrency} paralel")
     print("="*50)
     
-    success = 0
+    if not unknown:
+        print("Durumu bilinmeyen eksik soru yok!")
+        return
     
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
-        page = await browser.new_page()
-        
-        for i, fq in enumerate(failed_questions):
+    # Dosya başına kalan eksik soru sayısı ve değişen dosyalar
+    pending = {}
+    for fq in unknown:
+        pending[fq["filepath"]] = pending.get(fq["filepath"], 0) + 1
+    changed = set()
+    progress = {"fetched": 0, "answered": 0, "success": 0, "written": 0}
+    
+    def finish(fq: dict):
+        """Sorunun işi bitti; dosyanın tüm eksikleri bittiyse ve değiştiyse yaz"""
+        filepath = fq["filepath"]
+        pending[filepath] -= 1
+        if pending[filepath] == 0 and filepath in changed:
+            data = files_data[filepath]
+            update_file_counts(data)
+            jsonio.dump(data, filepath)
+            progress["written"] += 1
+    
+    async def report(every: float = 2.0):
+        while True:
+            await asyncio.sleep(every)
+            print(f"\r[Retry] {progress['fetched']}/{len(unknown)} çekildi, "
+                  f"{progress['answered']} cevaplandı (kuyruk: {answer_queue.qsize()}), "
+                  f"{progress['written']} dosya yazıldı", end="", flush=True)
+    
+    url_queue = asyncio.Queue()
+    for fq in unknown:
+        url_queue.put_nowait(fq)
+    answer_queue = asyncio.Queue(maxsize=ANSWER_QUEUE_SIZE)
+    
+    async def fetch_worker(fetcher: QuestionFetcher):
+        while True:
+            try:
+                fq = url_queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
             url = fq["url"]
-            print(f"\r[{i+1}/{len(failed_questions)}] {url[:60]}...", end="", flush=True)
             
             try:
-                await page.goto(url, wait_until="networkidle", timeout=60000)
-                await asyncio.sleep(1)
-                
-                # Sayfa hata veriyorsa atla
-                html = await page.content()
-                if "Hatalı Sayfa" in html:
-                    print(f"\n  Sayfa mevcut değil: {url[-40:]}")
-                    continue
-                
-                q = await scrape_single_question(page)
-                
-                if q.get("question_text") and q.get("options"):
-                    # GPT ile cevapla
-                    answer = await get_answer_from_gpt(q["question_text"], q["options"])
-                    q["correct_answer"] = answer
-                    q["url"] = url
-                    q["category"] = fq["category"]
-                    q["index"] = files_data[fq["filepath"]]["questions"][fq["index"]].get("index")
-                    q["test_url"] = files_data[fq["filepath"]]["questions"][fq["index"]].get("test_url")
-                    
-                    # Güncelle
-                    files_data[fq["filepath"]]["questions"][fq["index"]] = q
-                    success += 1
-                    
+                q = await fetcher.fetch(url)
+            except PageMissing as e:
+                negative.mark(url, MISSING, str(e))
+                q = None
             except Exception as e:
-                print(f"\n  Hata: {str(e)[:50]}")
-        
-        await browser.close()
+                print(f"\n  Hata: {url[-40:]}: {str(e)[:50]}")
+                q = None
+            
+            progress["fetched"] += 1
+            if q is not None and q.get("question_text") and q.get("options"):
+                negative.clear(url)
+                await answer_queue.put((fq, q))  # Kuyruk doluysa cevaplama stage'ini bekle
+            else:
+                if q is not None:
+                    negative.mark(url, BROKEN, "eksik içerik")
+                finish(fq)
     
-    print(f"\n\n{success}/{len(failed_questions)} soru tamamlandı")
+    async def answer_worker():
+        while True:
+            fq, q = await answer_queue.get()
+            try:
+                q["correct_answer"] = await get_answer_from_gpt(q["question_text"], q["options"])
+                original = files_data[fq["filepath"]]["questions"][fq["index"]]
+                q["url"] = fq["url"]
+                q["category"] = fq["category"]
+                q["index"] = original.get("index")
+                q["test_url"] = original.get("test_url")
+                
+                # Güncelle
+                files_data[fq["filepath"]]["questions"][fq["index"]] = q
+                changed.add(fq["filepath"])
+                progress["success"] += 1
+            finally:
+                progress["answered"] += 1
+                finish(fq)
+                answer_queue.task_done()
     
-    # Dosyaları kaydet
-    for filepath, data in files_data.items():
-        data["success_count"] = len([q for q in data["questions"] if q.get("question_text")])
-        data["with_answer_count"] = len([q for q in data["questions"] if q.get("correct_answer")])
-        data["updated_at"] = datetime.now().isoformat()
+    async with async_playwright() as p, HttpClient(max_connections=fetch_concurrency) as http:
+        browser = await open_browser(p)
+        pool = PagePool(browser, size=fetch_concurrency)
+        # Önce statik HTTP ön kontrolü: "Hatalı Sayfa" tarayıcı açmadan elenir
+        fetcher = QuestionFetcher(http, pool)
         
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        answerers = [asyncio.create_task(answer_worker()) for _ in range(gpt_concurrency)]
+        reporter = asyncio.create_task(report())
+        try:
+            await asyncio.gather(*[fetch_worker(fetcher) for _ in range(fetch_concurrency)])
+            await answer_queue.join()
+        finally:
+            for task in answerers + [reporter]:
+                task.cancel()
+            await asyncio.gather(*answerers, reporter, return_exceptions=True)
+            await pool.close()
+            await browser.close()
+            negative.close()
+    
+    print(f"\n\n{progress['success']}/{len(unknown)} soru tamamlandı ({fetcher.stats['static']} statik, "
+          f"{fetcher.stats['browser']} tarayıcı, {negative.stats['marked']} negatif önbelleğe eklendi)")
+    print(f"{len(changed)}/{len(files_data)} dosya değişti")
+    
+    if not changed:
+        return
     
     # Summary güncelle
     all_qs = []
@@ -196,8 +233,7 @@ async def retry_failed_questions():
         }
     }
     
-    with open(f"{output_dir}/_summary.json", "w", encoding="utf-8") as f:
-        json.dump(summary, f, indent=2, ensure_ascii=False)
+    jsonio.dump(summary, f"{output_dir}/_summary.json")
     
     print(f"\nSonuç: {summary['total_success']}/{summary['total_questions']} başarılı")
 
@@ -0,0 +1,361 @@
+"""
+Uçtan Uca Akış Boru Hattı: scrape → cevap → zenginleştirme → DB
+
+Aşamalar dosya üzerinden sırayla (önce hepsini kazı, sonra hepsini cevapla,
+sonra dosyaları zenginleştir, sonra dosyaları okuyup DB'ye yaz) çalışmak
+yerine sınırlı asyncio kuyruklarıyla birbirine bağlanır; bir soru kazındıktan
+kısa süre sonra DB'ye yazılır:
+
+    crawl ─▶ ⟨kuyruk⟩ ─▶ answer ─▶ ⟨kuyruk⟩ ─▶ enrich ─▶ ⟨kuyruk⟩ ─▶ store
+
+- answer: sitenin cevabı form POST'uyla (AnswerFetcher); yoksa GPT-4.1 nano
+- enrich: `enrich_question` (GPT-4o-mini); sitenin cevabı korunur
+- store: kayıtlar gruplar halinde `insert_to_db` (ayrı thread) + CheckpointLog
+  ile JSON dosyalarına
+
+Kuyruklar doluyken üreten aşama bekler: GPT yavaşsa kazıma da yavaşlar.
+Her aşamanın işlediği kayıt, hızı, kuyruk doluluğu ve meşgul worker sayısı
+canlı raporlanır. DB'ye yazılan URL'ler `_crawl/stream_pipeline.jsonl`'e
+işlenir; yeniden çalıştırmada kazınmış ama yazılmamış sorular depodan
+akmaya devam eder.
+
+Kullanım:
+    python -m scripts.enrichment.stream_pipeline
+    python -m scripts.enrichment.stream_pipeline Modals --no-db
+    python -m scripts.enrichment.stream_pipeline --enrich-workers 20 --queue-size 100
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from datetime import datetime
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from playwright.async_api import async_playwright
+
+sys.stdout.reconfigure(line_buffering=True)
+
+from scripts.constants import YDS_FILES
+from scripts.openai_utils import enrich_question
+from scripts.scrapers.browser_service import open_browser
+from scripts.scrapers.checkpoint_log import CheckpointLog, category_filename
+from scripts.scrapers.crawler import Crawler, CrawlStore, QuestionExtractor, TestExtractor, state_path
+from scripts.scrapers.html_archive import HtmlArchive, archive_path
+from scripts.scrapers.http_client import HttpClient
+from scripts.scrapers.negative_cache import NEGATIVE_CACHE_NAME, NegativeCache
+from scripts.scrapers.page_pool import DEFAULT_PER_HOST, PagePool
+from scripts.scrapers.question_page import AnswerFetcher, QuestionFetcher
+from scripts.scrapers.sources import YDS_TESTS
+from scripts.scrapers.yds_scraper_gpt import get_correct_answer_from_gpt
+
+OUTPUT_DIR = "yds_questions"
+SCRAPE_CONCURRENCY = 5
+ANSWER_CONCURRENCY = 10
+ENRICH_CONCURRENCY = 10
+QUEUE_SIZE = 50           # Aşamalar arası kuyruk kapasitesi
+DB_BATCH_SIZE = 50
+DB_BATCH_WAIT = 2.0       # sn; grup dolmasa da bu kadar bekledikten sonra yazılır
+REPORT_EVERY = 2.0
+
+# Kategori dosyası → DB kategorisi (yds_enrich_and_upload ile aynı eşleme)
+DB_CATEGORY_BY_FILE = {os.path.basename(path): category for path, category in YDS_FILES}
+
+
+def db_category(category: str) -> str:
+    """Kazınan kategori adını DB kategorisine çevir (YDS_FILES'ta yoksa aynen)"""
+    filename = category_filename(category)
+    return (DB_CATEGORY_BY_FILE.get(filename)
+            or DB_CATEGORY_BY_FILE.get(f"yds_{filename}")
+            or category)
+
+
+# ============================================================
+# AŞAMA / BORU HATTI
+# ============================================================
+
+class Stage:
+    """
+    Sınırlı giriş kuyruğu + `workers` adet worker. `handler` tek kayıt alır
+    (batch_size > 1 ise kayıt listesi) ve sonraki aşamaya gidecek kaydı
+    (listeyi) döndürür; None dönen kayıtlar akıştan düşer.
+    """
+
+    def __init__(self, name: str, handler: Callable[..., Awaitable], workers: int = 1,
+                 queue_size: int = QUEUE_SIZE, batch_size: int = 1, batch_wait: float = DB_BATCH_WAIT):
+        self.name = name
+        self.handler = handler
+        self.workers = workers
+        self.batch_size = batch_size
+        self.batch_wait = batch_wait
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.next: Optional["Stage"] = None
+        self.stats = {"in": 0, "out": 0, "dropped": 0, "busy": 0}
+
+    async def put(self, item):
+        """Kuyruk doluysa bekler (backpressure)"""
+        await self.queue.put(item)
+        self.stats["in"] += 1
+
+    async def _take(self) -> List:
+        items = [await self.queue.get()]
+        deadline = time.monotonic() + self.batch_wait
+        while len(items) < self.batch_size:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                items.append(await asyncio.wait_for(self.queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        return items
+
+    async def _forward(self, result):
+        if result is None:
+            self.stats["dropped"] += 1
+            return
+        self.stats["out"] += 1
+        if self.next is not None:
+            await self.next.put(result)
+
+    async def _worker(self):
+        while True:
+            items = await self._take()
+            self.stats["busy"] += 1
+            try:
+                if self.batch_size > 1:
+                    results = await self.handler(items) or []
+                    for result in results:
+                        await self._forward(result)
+                    self.stats["dropped"] += len(items) - len(results)
+                else:
+                    await self._forward(await self.handler(items[0]))
+            except Exception as e:
+                self.stats["dropped"] += len(items)
+                print(f"\n⚠️  [{self.name}] {e}")
+            finally:
+                self.stats["busy"] -= 1
+                for _ in items:
+                    self.queue.task_done()
+
+
+class Pipeline:
+    """Aşamaları sırayla bağlar; `submit` ilk aşamaya kayıt verir"""
+
+    def __init__(self, stages: List[Stage], source_name: str = "scrape"):
+        self.stages = stages
+        for stage, next_stage in zip(stages, stages[1:]):
+            stage.next = next_stage
+        self.source_name = source_name
+        self.submitted = 0
+        self._tasks: List[asyncio.Task] = []
+        self._start = time.monotonic()
+
+    async def submit(self, item):
+        self.submitted += 1
+        await self.stages[0].put(item)
+
+    def start(self, report_every: float = REPORT_EVERY):
+        self._start = time.monotonic()
+        for stage in self.stages:
+            self._tasks.extend(asyncio.create_task(stage._worker()) for _ in range(stage.workers))
+        if report_every:
+            self._tasks.append(asyncio.create_task(self._report(report_every)))
+
+    def status_line(self) -> str:
+        elapsed = max(time.monotonic() - self._start, 1e-9)
+        parts = [f"{self.source_name} {self.submitted} ({self.submitted / elapsed:.1f}/sn)"]
+        for stage in self.stages:
+            s = stage.stats
+            parts.append(f"⟨{stage.queue.qsize()}/{stage.queue.maxsize}⟩ {stage.name} {s['out']} "
+                         f"({s['out'] / elapsed:.1f}/sn, {s['busy']}/{stage.workers} meşgul)")
+        return " → ".join(parts)
+
+    async def _report(self, every: float):
+        while True:
+            await asyncio.sleep(every)
+            print(f"\r{self.status_line()}", end="", flush=True)
+
+    async def stop(self):
+        """Worker'ları ve raporlayıcıyı iptal et (kuyrukta kalanlar işlenmez; tekrar çağrılabilir)"""
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def drain(self):
+        """Kaynak bittikten sonra: aşamaları sırayla boşalt ve worker'ları durdur"""
+        try:
+            for stage in self.stages:
+                await stage.queue.join()
+        finally:
+            await self.stop()
+        print(f"\r{self.status_line()}")
+
+
+# ============================================================
+# YDS AKIŞI
+# ============================================================
+
+async def run_stream(tests: list = None, output_dir: str = OUTPUT_DIR, use_db: bool = True,
+                     scrape_concurrency: int = SCRAPE_CONCURRENCY, answer_concurrency: int = ANSWER_CONCURRENCY,
+                     enrich_concurrency: int = ENRICH_CONCURRENCY, queue_size: int = QUEUE_SIZE,
+                     per_host: int = DEFAULT_PER_HOST) -> Dict[str, int]:
+    """Testleri kazı ve her soruyu cevap → zenginleştirme → DB aşamalarından akıt"""
+    if tests is None:
+        tests = YDS_TESTS
+
+    insert_to_db = None
+    if use_db:
+        # psycopg2 sadece DB aşaması açıkken gerekir
+        from scripts.enrichment.yds_enrich_and_upload import insert_to_db
+
+    os.makedirs(output_dir, exist_ok=True)
+    checkpoint = CheckpointLog(output_dir)
+    if await checkpoint.recover():
+        print("♻️  Önceki çalışmadan kalan log'lar uygulandı")
+    stored = CrawlStore(state_path(output_dir, "stream_pipeline"))
+    totals = {"stored": 0, "inserted": 0, "db_failed": 0, "already_stored": 0}
+
+    gpt_semaphore = asyncio.Semaphore(answer_concurrency)
+    enrich_semaphore = asyncio.Semaphore(enrich_concurrency)
+
+    print(f"Toplam {len(tests)} test, {sum(t['count'] for t in tests)} soru")
+    print(f"Kazıma: {scrape_concurrency}, cevap: {answer_concurrency}, zenginleştirme: {enrich_concurrency} paralel, "
+          f"kuyruk: {queue_size}, DB: {'açık' if use_db else 'kapalı'}")
+    print("=" * 60)
+    start_time = datetime.now()
+
+    async with async_playwright() as p, HttpClient(max_connections=scrape_concurrency * 2) as http:
+        browser = await open_browser(p)
+        pool = PagePool(browser, size=scrape_concurrency, per_host=per_host)
+        archive = HtmlArchive(archive_path(output_dir))
+        answers = AnswerFetcher(http, pool)
+
+        async def answer(q: dict) -> dict:
+            if not q.get("correct_answer"):
+                try:
+                    q["correct_answer"] = await answers.fetch(q["url"])
+                except Exception:
+                    q["correct_answer"] = None
+            if not q.get("correct_answer"):
+                q["correct_answer"] = await get_correct_answer_from_gpt(q["question_text"], q["options"], gpt_semaphore)
+            return q
+
+        async def enrich(q: dict) -> dict:
+            if q.get("enriched"):
+                return q
+            result = await enrich_question(q, db_category(q["category"]), enrich_semaphore)
+            if q.get("correct_answer"):
+                result["correct_answer"] = q["correct_answer"]  # Sitenin/cevap aşamasının cevabı esas
+            return result
+
+        async def store(batch: List[dict]) -> List[dict]:
+            for q in batch:
+                checkpoint.record_scraped(q["category"], q)
+
+            complete = True
+            if insert_to_db is not None:
+                by_category: Dict[str, List[dict]] = {}
+                for q in batch:
+                    by_category.setdefault(db_category(q["category"]), []).append(q)
+                for category, questions in by_category.items():
+                    inserted, skipped, failed = await asyncio.to_thread(insert_to_db, questions, category)
+                    totals["inserted"] += inserted
+                    totals["db_failed"] += failed
+                    # DB hatasında grup işaretlenmez; sonraki çalışmada tekrar denenir
+                    # (yazılmış olanlar check_question_exists ile atlanır)
+                    complete = complete and failed == 0
+
+            if complete:
+                for q in batch:
+                    if q.get("enriched") and q.get("correct_answer"):
+                        stored.mark_done(q["url"], "question", {"category": q["category"]})
+                        totals["stored"] += 1
+            return batch
+
+        pipeline = Pipeline([
+            Stage("answer", answer, workers=answer_concurrency, queue_size=queue_size),
+            Stage("enrich", enrich, workers=enrich_concurrency, queue_size=queue_size),
+            Stage("store", store, workers=1, queue_size=queue_size * 2, batch_size=DB_BATCH_SIZE),
+        ])
+
+        async def feed(kind: str, q: dict):
+            """Crawler'dan gelen soru: eksikse ya da zaten DB'deyse akışa girmez"""
+            if kind != "question" or not (q.get("question_text") and q.get("options")):
+                return
+            if q["url"] in stored.done:
+                totals["already_stored"] += 1
+                return
+            await pipeline.submit(dict(q))
+
+        crawler = Crawler(
+            [TestExtractor(http), QuestionExtractor(QuestionFetcher(http, pool, archive=archive))],
+            store=CrawlStore(state_path(output_dir, "stream_scrape")),
+            workers=scrape_concurrency,
+            host_concurrency=per_host,
+            on_record=feed,
+            emit_cached=True,
+            negative=NegativeCache(state_path(output_dir, NEGATIVE_CACHE_NAME)),
+        )
+        for test in tests:
+            crawler.add("test", test["url"], {"category": test["category"], "count": test["count"]})
+
+        pipeline.start()
+        try:
+            await crawler.run(report_every=0)
+            await pipeline.drain()
+        finally:
+            # crawler.run hata verirse aşama worker'ları da durdurulur
+            await pipeline.stop()
+            stored.close()
+            archive.close()
+            await pool.close()
+            await browser.close()
+
+    summary = await checkpoint.close()
+    elapsed = (datetime.now() - start_time).total_seconds()
+
+    print(f"\n{'=' * 60}")
+    print(f"TAMAMLANDI! Süre: {elapsed:.1f}sn")
+    print(f"Kazınan: {crawler.stats['fetched']} ({crawler.stats['cached']} depodan, "
+          f"{totals['already_stored']} zaten yazılmış)")
+    print(f"Yazılan: {totals['stored']} soru" + (f", DB'ye eklenen: {totals['inserted']}" if use_db else ""))
+    if totals["db_failed"]:
+        print(f"⚠️  DB hatası: {totals['db_failed']} soru yazılamadı (sonraki çalışmada tekrar denenecek)")
+    print(answers.report())
+    if summary:
+        print(f"Dosyalar: {summary['total_with_answer']}/{summary['total_questions']} cevaplı")
+    return totals
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Scrape → cevap → zenginleştirme → DB akış boru hattı")
+    parser.add_argument("category", nargs="?", help="Kategori filtresi (örn. Modals)")
+    parser.add_argument("--output-dir", default=OUTPUT_DIR, help="Çıktı klasörü")
+    parser.add_argument("--no-db", action="store_true", help="DB'ye yazma, sadece JSON dosyalarına")
+    parser.add_argument("--scrape-workers", type=int, default=SCRAPE_CONCURRENCY)
+    parser.add_argument("--answer-workers", type=int, default=ANSWER_CONCURRENCY)
+    parser.add_argument("--enrich-workers", type=int, default=ENRICH_CONCURRENCY)
+    parser.add_argument("--queue-size", type=int, default=QUEUE_SIZE, help="Aşamalar arası kuyruk kapasitesi")
+
+    args = parser.parse_args()
+
+    tests = YDS_TESTS
+    if args.category:
+        tests = [t for t in YDS_TESTS if args.category.lower() in t["category"].lower()]
+        print(f"Kategori filtresi: {args.category}")
+    if not tests:
+        print("Eşleşen test bulunamadı!")
+        return
+
+    asyncio.run(run_stream(
+        tests, args.output_dir, use_db=not args.no_db,
+        scrape_concurrency=args.scrape_workers, answer_concurrency=args.answer_workers,
+        enrich_concurrency=args.enrich_workers, queue_size=args.queue_size,
+    ))
+
+
+if __name__ == "__main__":
+    main()
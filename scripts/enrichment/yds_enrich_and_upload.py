@@ -15,7 +15,6 @@ Kategoriler:
 """
 
 import asyncio
-import json
 import os
 import sys
 import time
@@ -24,9 +23,10 @@ from psycopg2.extras import Json
 
 sys.stdout.reconfigure(line_buffering=True)
 
+from scripts import jsonio
 from scripts.config import get_database_url
 from scripts.db_utils import get_db_connection, execute_query, check_question_exists
-from scripts.constants import YDS_FILES
+from scripts.constants import YDS_FILES, resolve_yds_category
 from scripts.openai_utils import enrich_question
 
 DATABASE_URL = get_database_url()
@@ -35,13 +35,23 @@ CONCURRENT_LIMIT = 10  # Daha hızlı işlem için artırıldı
 
 
 def insert_to_db(questions: list, category: str) -> tuple:
-    """Zenginleştirilmiş soruları PostgreSQL'e ekle - options sadece şıkları içerir, zenginleştirme alanları sütunlara yazılır"""
+    """
+    Zenginleştirilmiş soruları PostgreSQL'e ekle - options sadece şıkları içerir, zenginleştirme alanları sütunlara yazılır
+
+    Returns:
+        (inserted, skipped, failed): skipped = eksik/zaten DB'de olan sorular,
+        failed = DB hatası yüzünden yazılamayanlar (sonra tekrar denenmeli)
+    """
     inserted = 0
     skipped = 0
+    failed = 0
+    yds_category = resolve_yds_category(category)
     
     batch_size = 50
     for batch_start in range(0, len(questions), batch_size):
         batch = questions[batch_start:batch_start + batch_size]
+        # Sayılar commit başarılı olunca eklenir; bağlantı/commit hatasında grup yazılmamış sayılır
+        batch_inserted = batch_skipped = batch_failed = 0
         
         try:
             with get_db_connection() as conn:
@@ -49,17 +59,19 @@ def insert_to_db(questions: list, category: str) -> tuple:
                 
                 for q in batch:
                     if not q.get("enriched") or not q.get("correct_answer"):
-                        skipped += 1
+                        batch_skipped += 1
                         continue
                     
                     question_text = q.get("question_text", "").strip()
                     if not question_text:
-                        skipped += 1
+                        batch_skipped += 1
                         continue
                     
                     try:
+                        # Tek satırın hatası transaction'ı bozmasın, gruptaki diğerleri yazılsın
+                        cur.execute("SAVEPOINT insert_question")
                         if check_question_exists(question_text, category):
-                            skipped += 1
+                            batch_skipped += 1
                             continue
                         
                         options = q.get("options", [])
@@ -67,14 +79,15 @@ def insert_to_db(questions: list, category: str) -> tuple:
                         cur.execute("""
                             INSERT INTO questions (
                                 question_text, options, correct_answer, category, 
-                                url, test_url, question_tr, explanation_tr, 
+                                yds_category, url, test_url, question_tr, explanation_tr, 
                                 tested_skill, difficulty, tip
-                            ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+                            ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
                         """, (
                             question_text,
                             Json(options),
                             q.get("correct_answer"),
                             category,
+                            yds_category,
                             q.get("url", ""),
                             q.get("test_url", ""),
                             q.get("question_tr", ""),
@@ -83,11 +96,13 @@ def insert_to_db(questions: list, category: str) -> tuple:
                             q.get("difficulty", "medium"),
                             q.get("tip", "")
                         ))
-                        inserted += 1
+                        cur.execute("RELEASE SAVEPOINT insert_question")
+                        batch_inserted += 1
                             
                     except Exception as e:
                         print(f"   ❌ DB Hata (soru): {e}")
-                        skipped += 1
+                        cur.execute("ROLLBACK TO SAVEPOINT insert_question")
+                        batch_failed += 1
                         continue
                 
                 conn.commit()
@@ -95,10 +110,16 @@ def insert_to_db(questions: list, category: str) -> tuple:
             
         except Exception as e:
             print(f"   ❌ DB Bağlantı Hatası: {e}")
+            failed += len(batch) - batch_skipped
+            skipped += batch_skipped
             time.sleep(2)
             continue
+        
+        inserted += batch_inserted
+        skipped += batch_skipped
+        failed += batch_failed
     
-    return inserted, skipped
+    return inserted, skipped, failed
 
 
 async def process_category(file_path: str, category: str) -> dict:
@@ -112,8 +133,7 @@ async def process_category(file_path: str, category: str) -> dict:
         print(f"   ❌ Dosya bulunamadı!")
         return {"success": 0, "errors": 0, "db_inserted": 0}
     
-    with open(file_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    data = jsonio.load(file_path)
     
     questions = data.get("questions", [])
     total = len(questions)
@@ -138,8 +158,8 @@ async def process_category(file_path: str, category: str) -> dict:
     if not to_process:
         # Sadece DB'ye ekle
         print(f"   📤 Database'e ekleniyor...")
-        db_inserted, db_skipped = insert_to_db(already_enriched, category)
-        print(f"   ✅ DB'ye eklenen: {db_inserted}, Atlanan: {db_skipped}")
+        db_inserted, db_skipped, db_failed = insert_to_db(already_enriched, category)
+        print(f"   ✅ DB'ye eklenen: {db_inserted}, Atlanan: {db_skipped}, Hatalı: {db_failed}")
         return {"success": len(already_enriched), "errors": 0, "db_inserted": db_inserted}
     
     semaphore = asyncio.Semaphore(CONCURRENT_LIMIT)
@@ -178,16 +198,15 @@ async def process_category(file_path: str, category: str) -> dict:
         
         # Her batch sonrası JSON'a kaydet (güvenlik için)
         data["questions"] = questions
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        jsonio.dump(data, file_path)
     
     elapsed = time.time() - start_time
     print(f"   ✅ Zenginleştirme: {success} başarılı, {errors} hata ({elapsed:.1f}sn)")
     
     # Database'e ekle
     print(f"   📤 Database'e ekleniyor...")
-    db_inserted, db_skipped = insert_to_db(enriched_questions, category)
-    print(f"   ✅ DB'ye eklenen: {db_inserted}, Atlanan: {db_skipped}")
+    db_inserted, db_skipped, db_failed = insert_to_db(enriched_questions, category)
+    print(f"   ✅ DB'ye eklenen: {db_inserted}, Atlanan: {db_skipped}, Hatalı: {db_failed}")
     
     return {"success": success + len(already_enriched), "errors": errors, "db_inserted": db_inserted}
 
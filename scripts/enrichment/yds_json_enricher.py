@@ -8,7 +8,6 @@ YDS JSON dosyalarını GPT-4o-mini ile zenginleştir
 """
 
 import asyncio
-import json
 import os
 import sys
 import time
@@ -16,6 +15,7 @@ from datetime import datetime
 
 sys.stdout.reconfigure(line_buffering=True)
 
+from scripts import jsonio
 from scripts.constants import YDS_FILES
 from scripts.openai_utils import enrich_question
 
@@ -33,8 +33,7 @@ async def process_file(file_path: str, category: str) -> dict:
         print(f"   ❌ Dosya bulunamadı!")
         return {"success": 0, "errors": 0, "skipped": 0}
     
-    with open(file_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    data = jsonio.load(file_path)
     
     questions = data.get("questions", [])
     total = len(questions)
@@ -91,8 +90,7 @@ async def process_file(file_path: str, category: str) -> dict:
         
         # Her batch sonrası kaydet (güvenlik için)
         data["questions"] = questions
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        jsonio.dump(data, file_path)
     
     elapsed = time.time() - start_time
     print(f"   ✅ Tamamlandı: {success} başarılı, {errors} hata ({elapsed:.1f}sn)")
@@ -0,0 +1,258 @@
+"""
+Soru Bankasının Kolonsal (Parquet / Arrow) Snapshot'ı
+
+questions tablosunu ve JSON korpuslarını (yds_questions/, yds_questions_gpt/)
+çevrimdışı analiz için kolonsal formata yazar:
+
+    <out>/questions.parquet  + questions.arrow   → DB tablosu
+    <out>/corpus.parquet     + corpus.arrow      → JSON dosyaları (source_file kolonu ile)
+
+`category`, `difficulty`, `gpt_status` gibi düşük kardinaliteli kolonlar
+dictionary-encoded yazılır. Parquet arşiv/paylaşım içindir (zstd sıkıştırmalı,
+kaynaktan akıtılarak yazılır); Arrow IPC dosyası sıkıştırmasızdır ve
+`load_snapshot` ile memory-map edilerek kopyasız açılır, analiz scriptleri
+kolonları yerinde sorgular.
+
+DB tablosu named (server-side) cursor ile parça parça okunur; tüm tablo
+RealDictCursor ile belleğe alınmaz.
+
+`pyarrow` gerekir (pip install pyarrow).
+
+Kullanım:
+    python -m scripts.export.columnar_snapshot                 # DB + JSON
+    python -m scripts.export.columnar_snapshot --no-db         # Sadece JSON korpusları
+
+    from scripts.export.columnar_snapshot import load_snapshot
+    table = load_snapshot("snapshots/corpus.arrow")            # pyarrow.Table (mmap)
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from scripts import jsonio
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+sys.stdout.reconfigure(line_buffering=True)
+
+CORPUS_DIRS = ["yds_questions", "yds_questions_gpt"]
+DB_BATCH_SIZE = 2000
+
+
+def _require_pyarrow():
+    if pa is None:
+        raise RuntimeError("pyarrow kurulu değil: pip install pyarrow")
+
+
+def _schemas():
+    """Kolon şemaları (pyarrow import edildikten sonra kurulur)"""
+    dict_string = pa.dictionary(pa.int32(), pa.string())
+    option = pa.list_(pa.struct([("letter", pa.string()), ("text", pa.string())]))
+
+    questions = pa.schema([
+        ("id", pa.int64()),
+        ("question_number", pa.string()),
+        ("question_text", pa.string()),
+        ("options", option),
+        ("correct_answer", dict_string),
+        ("category", dict_string),
+        ("yds_category", dict_string),
+        ("url", pa.string()),
+        ("test_url", pa.string()),
+        ("question_tr", pa.string()),
+        ("explanation_tr", pa.string()),
+        ("tested_skill", pa.string()),
+        ("difficulty", dict_string),
+        ("tip", pa.string()),
+        ("is_valid", pa.bool_()),
+        ("gpt_status", dict_string),
+        ("gpt_verified_at", pa.timestamp("us")),
+        ("created_at", pa.timestamp("us")),
+    ])
+
+    corpus = pa.schema([
+        ("source_file", dict_string),
+        ("file_index", pa.int32()),
+        ("category", dict_string),
+        ("question_number", pa.string()),
+        ("question_text", pa.string()),
+        ("options", option),
+        ("correct_answer", dict_string),
+        ("url", pa.string()),
+        ("test_url", pa.string()),
+        ("question_tr", pa.string()),
+        ("explanation_tr", pa.string()),
+        ("tested_skill", pa.string()),
+        ("difficulty", dict_string),
+        ("tip", pa.string()),
+        ("gpt_answer", dict_string),
+        ("explanation", pa.string()),
+        ("corrected_question", pa.string()),
+        ("processed", pa.bool_()),
+    ])
+    return questions, corpus
+
+
+def _normalize_options(options) -> List[Dict]:
+    """JSONB/str/list şık listesini [{letter, text}] biçimine getir"""
+    if isinstance(options, str):
+        try:
+            options = json.loads(options)
+        except ValueError:
+            return []
+    if not isinstance(options, list):
+        return []
+    result = []
+    for o in options:
+        if isinstance(o, dict):
+            result.append({"letter": o.get("letter"), "text": o.get("text")})
+        else:
+            result.append({"letter": None, "text": str(o)})
+    return result
+
+
+def _as_str(value) -> Optional[str]:
+    return None if value is None else str(value)
+
+
+# ============================================================
+# KAYNAKLAR
+# ============================================================
+
+def iter_db_batches(schema, batch_size: int = DB_BATCH_SIZE) -> Iterator["pa.RecordBatch"]:
+    """questions tablosunu server-side cursor ile RecordBatch olarak oku"""
+    from scripts.db_utils import get_db_connection
+
+    columns = schema.names
+    with get_db_connection() as conn:
+        # Named cursor → satırlar sunucuda kalır, itersize kadar çekilir
+        cur = conn.cursor(name="columnar_snapshot")
+        cur.itersize = batch_size
+        cur.execute(f"SELECT {', '.join(columns)} FROM questions ORDER BY id")
+        while True:
+            rows = cur.fetchmany(batch_size)
+            if not rows:
+                break
+            data = {name: [row[i] for row in rows] for i, name in enumerate(columns)}
+            data["options"] = [_normalize_options(o) for o in data["options"]]
+            yield pa.RecordBatch.from_pydict(data, schema=schema)
+        cur.close()
+        conn.rollback()
+
+
+def iter_corpus_files(dirs: Iterable[str] = CORPUS_DIRS) -> Iterator[str]:
+    """Korpus dizinlerindeki soru JSON dosyaları (özet/rapor dosyaları hariç)"""
+    for directory in dirs:
+        if not os.path.isdir(directory):
+            continue
+        for filename in sorted(os.listdir(directory)):
+            if filename.endswith(".json") and not filename.startswith("_") and filename != "quality_report.json":
+                yield os.path.join(directory, filename)
+
+
+def iter_corpus_batches(schema, dirs: Iterable[str] = CORPUS_DIRS) -> Iterator["pa.RecordBatch"]:
+    """Her JSON dosyasını bir RecordBatch olarak oku"""
+    for filepath in iter_corpus_files(dirs):
+        data = jsonio.load(filepath)
+        if not isinstance(data, dict) or "questions" not in data:
+            continue
+
+        questions = data["questions"]
+        file_category = data.get("category")
+        columns = {name: [] for name in schema.names}
+        for i, q in enumerate(questions):
+            row = {
+                "source_file": filepath,
+                "file_index": i,
+                "category": file_category or q.get("category"),
+                "question_number": _as_str(q.get("question_number")),
+                "options": _normalize_options(q.get("options")),
+                "processed": q.get("processed"),
+            }
+            for name in schema.names:
+                columns[name].append(row[name] if name in row else _as_str(q.get(name)))
+        yield pa.RecordBatch.from_pydict(columns, schema=schema)
+
+
+# ============================================================
+# YAZMA / OKUMA
+# ============================================================
+
+def write_snapshot(batches: Iterable["pa.RecordBatch"], schema, out_dir: str, name: str) -> int:
+    """
+    Batch'leri Parquet'e akıt, ardından Arrow IPC kopyasını üret; satır sayısını döndür.
+    IPC dosya formatı alan başına tek sözlük kabul ettiği için sözlükler
+    Parquet'ten okunan tabloda birleştirilip tek parça halinde yazılır.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    parquet_path = os.path.join(out_dir, f"{name}.parquet")
+    arrow_path = os.path.join(out_dir, f"{name}.arrow")
+
+    rows = 0
+    with pq.ParquetWriter(parquet_path + ".tmp", schema, compression="zstd") as writer:
+        for batch in batches:
+            writer.write_batch(batch)
+            rows += batch.num_rows
+    os.replace(parquet_path + ".tmp", parquet_path)
+
+    table = pq.read_table(parquet_path, schema=schema).unify_dictionaries().combine_chunks()
+    with pa.OSFile(arrow_path + ".tmp", "wb") as sink, pa.ipc.new_file(sink, schema) as writer:
+        writer.write_table(table)
+    os.replace(arrow_path + ".tmp", arrow_path)
+    return rows
+
+
+def load_snapshot(path: str) -> "pa.Table":
+    """
+    Snapshot'ı aç: .arrow dosyaları memory-map edilir (kopyasız),
+    .parquet dosyaları normal okunur.
+    """
+    _require_pyarrow()
+    if path.endswith(".parquet"):
+        return pq.read_table(path)
+    return pa.ipc.open_file(pa.memory_map(path, "r")).read_all()
+
+
+def export_snapshots(out_dir: str = "snapshots", include_db: bool = True,
+                     corpus_dirs: Iterable[str] = CORPUS_DIRS) -> Dict[str, int]:
+    """DB tablosunu ve JSON korpuslarını kolonsal snapshot olarak yaz"""
+    _require_pyarrow()
+    questions_schema, corpus_schema = _schemas()
+    written = {}
+
+    if include_db:
+        start = time.time()
+        written["questions"] = write_snapshot(iter_db_batches(questions_schema), questions_schema, out_dir, "questions")
+        print(f"   🗄️  questions: {written['questions']} satır ({time.time() - start:.1f}sn)")
+
+    start = time.time()
+    written["corpus"] = write_snapshot(iter_corpus_batches(corpus_schema, corpus_dirs), corpus_schema, out_dir, "corpus")
+    print(f"   📄 corpus: {written['corpus']} satır ({time.time() - start:.1f}sn)")
+    return written
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Soru bankasının Parquet / Arrow snapshot'ı")
+    parser.add_argument("--out", type=str, default="snapshots", help="Çıktı dizini")
+    parser.add_argument("--no-db", action="store_true", help="DB tablosunu atla, sadece JSON korpusları")
+
+    args = parser.parse_args()
+
+    print("="*60)
+    print("🧊 Kolonsal Snapshot")
+    print("="*60)
+
+    written = export_snapshots(args.out, include_db=not args.no_db)
+    for name in written:
+        for ext in ("parquet", "arrow"):
+            path = os.path.join(args.out, f"{name}.{ext}")
+            print(f"   ✅ {path} ({os.path.getsize(path) / 1024 / 1024:.1f}MB)")
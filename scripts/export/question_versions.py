@@ -0,0 +1,276 @@
+"""
+Soru Bankası Sürümleri ve Delta Yamaları
+
+db_question_validator soruları düzelttiğinde ya da yeniden ürettiğinde
+istemcilerin tüm kategori paketlerini tekrar indirmemesi için:
+
+1. `snapshot`: bankanın o anki halini numaralı bir sürüm olarak saklar
+   (içerik değişmediyse yeni sürüm açılmaz).
+2. Yeni sürüm için son N sürümün her birinden minimal bir yama üretir:
+   eklenen sorular (tam kayıt), silinen ID'ler ve değişen sorular için
+   sadece değişen alanlar.
+3. İstemcinin okuduğu sürüm zinciri manifest'ini yazar: elindeki sürümden
+   en son sürüme tek yamayla geçebilir, zincirde yoksa tam paketi indirir.
+
+static_bundles her build'de aynı soru listesinin snapshot'ını buradan alır
+(`snapshot_version`); paket manifest'indeki `version` bu tamsayı sürümdür.
+
+Çıktı:
+    question_versions/v<N>.json.gz         → sunucu tarafı snapshot'lar (build durumu)
+    bundles/patches/v<A>-v<B>.<hash>.json  → içerik hash'li yamalar
+    bundles/versions.json                  → sürüm zinciri manifest'i
+
+Kullanım:
+    python -m scripts.export.question_versions snapshot --keep 5
+    python -m scripts.export.question_versions verify
+    python -m scripts.export.question_versions diff 3 5
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import sys
+from datetime import datetime
+from typing import Dict, List, Optional
+
+sys.stdout.reconfigure(line_buffering=True)
+
+from scripts import jsonio
+from scripts.export.static_bundles import (
+    QUESTION_FIELDS, fetch_validated_questions, serialize, write_shard,
+)
+
+SNAPSHOT_DIR = "question_versions"
+PATCH_DIR = "patches"
+VERSIONS_MANIFEST = "versions.json"
+DEFAULT_KEEP = 5
+
+
+# ============================================================
+# SNAPSHOT
+# ============================================================
+
+def snapshot_records(questions: List[Dict]) -> Dict[int, Dict]:
+    """Soruları {id: kayıt} biçimine çevir (sadece paketlenen alanlar)"""
+    return {q["id"]: {field: q.get(field) for field in QUESTION_FIELDS} for q in questions}
+
+
+def snapshot_hash(records: Dict[int, Dict]) -> str:
+    """Snapshot içeriğinin hash'i (ID sırasına göre deterministik)"""
+    return hashlib.sha256(serialize([records[i] for i in sorted(records)])).hexdigest()
+
+
+def snapshot_path(snapshot_dir: str, version: int) -> str:
+    return os.path.join(snapshot_dir, f"v{version}.json.gz")
+
+
+def save_snapshot(snapshot_dir: str, version: int, records: Dict[int, Dict]):
+    os.makedirs(snapshot_dir, exist_ok=True)
+    path = snapshot_path(snapshot_dir, version)
+    data = gzip.compress(serialize([records[i] for i in sorted(records)]), mtime=0)
+    with open(path + ".tmp", "wb") as f:
+        f.write(data)
+    os.replace(path + ".tmp", path)
+
+
+def load_snapshot(snapshot_dir: str, version: int) -> Dict[int, Dict]:
+    with gzip.open(snapshot_path(snapshot_dir, version), "rb") as f:
+        return {q["id"]: q for q in json.loads(f.read())}
+
+
+# ============================================================
+# DIFF / PATCH
+# ============================================================
+
+def diff_snapshots(old: Dict[int, Dict], new: Dict[int, Dict]) -> Dict:
+    """
+    İki snapshot arasındaki minimal yama
+
+    Returns:
+        {"added": [kayıt], "removed": [id], "changed": {id: {alan: yeni değer}}}
+    """
+    added = [new[i] for i in sorted(new.keys() - old.keys())]
+    removed = sorted(old.keys() - new.keys())
+    changed = {}
+    for i in sorted(old.keys() & new.keys()):
+        before, after = old[i], new[i]
+        if before == after:
+            continue
+        fields = {k: v for k, v in after.items() if before.get(k) != v}
+        # Yeni snapshot'ta olmayan alanlar (şema değişikliği) null olarak gönderilir
+        fields.update({k: None for k in before.keys() - after.keys()})
+        changed[str(i)] = fields
+    return {"added": added, "removed": removed, "changed": changed}
+
+
+def apply_patch(records: Dict[int, Dict], patch: Dict) -> Dict[int, Dict]:
+    """Yamayı snapshot'a uygula (istemcideki senkronizasyonun referans uygulaması)"""
+    result = {i: dict(q) for i, q in records.items()}
+    for i in patch["removed"]:
+        result.pop(i, None)
+    for i, fields in patch["changed"].items():
+        result[int(i)].update(fields)
+    for q in patch["added"]:
+        result[q["id"]] = dict(q)
+    return result
+
+
+# ============================================================
+# SÜRÜM ZİNCİRİ
+# ============================================================
+
+def load_versions_manifest(out_dir: str) -> Dict:
+    path = os.path.join(out_dir, VERSIONS_MANIFEST)
+    if not os.path.exists(path):
+        return {"latest": None, "versions": [], "patches": {}}
+    return jsonio.load(path)
+
+
+def save_versions_manifest(out_dir: str, manifest: Dict):
+    os.makedirs(out_dir, exist_ok=True)
+    path = os.path.join(out_dir, VERSIONS_MANIFEST)
+    jsonio.dump(manifest, path)
+
+
+def create_version(records: Dict[int, Dict], out_dir: str = "bundles",
+                   snapshot_dir: str = SNAPSHOT_DIR, keep: int = DEFAULT_KEEP) -> Optional[int]:
+    """
+    Snapshot'ı yeni sürüm olarak kaydet ve son `keep` sürümden yamaları üret.
+    İçerik son sürümle aynıysa None döner.
+    """
+    manifest = load_versions_manifest(out_dir)
+    digest = snapshot_hash(records)
+
+    if manifest["versions"] and manifest["versions"][-1]["sha256"] == digest:
+        return None
+
+    version = (manifest["latest"] or 0) + 1
+    save_snapshot(snapshot_dir, version, records)
+
+    patch_dir = os.path.join(out_dir, PATCH_DIR)
+    os.makedirs(patch_dir, exist_ok=True)
+
+    # Sadece en son sürüme giden yamalar tutulur; eski hedefli yamalar gereksiz
+    patches = {}
+    previous_versions = manifest["versions"][-keep:] if keep > 0 else []
+    for entry in previous_versions:
+        base = entry["version"]
+        if not os.path.exists(snapshot_path(snapshot_dir, base)):
+            continue
+        patch = diff_snapshots(load_snapshot(snapshot_dir, base), records)
+        payload = {"from": base, "to": version, **patch}
+        shard = write_shard(patch_dir, f"v{base}-v{version}", payload)
+        shard["file"] = f"{PATCH_DIR}/{os.path.basename(shard['file'])}"
+        shard.update({
+            "added": len(patch["added"]),
+            "removed": len(patch["removed"]),
+            "changed": len(patch["changed"]),
+        })
+        patches[str(base)] = shard
+
+    manifest["versions"].append({
+        "version": version,
+        "created_at": datetime.now().isoformat(),
+        "sha256": digest,
+        "count": len(records),
+    })
+    manifest["versions"] = manifest["versions"][-(keep + 1):]
+    manifest["latest"] = version
+    manifest["patches"] = patches
+    save_versions_manifest(out_dir, manifest)
+
+    prune_versions(out_dir, snapshot_dir, manifest)
+    return version
+
+
+def snapshot_version(records: Dict[int, Dict], out_dir: str = "bundles",
+                     snapshot_dir: str = SNAPSHOT_DIR, keep: int = DEFAULT_KEEP) -> int:
+    """Snapshot'ın sürüm numarası: içerik son sürümle aynıysa o sürüm, değilse yeni sürüm açılır"""
+    version = create_version(records, out_dir=out_dir, snapshot_dir=snapshot_dir, keep=keep)
+    return version if version is not None else load_versions_manifest(out_dir)["latest"]
+
+
+def prune_versions(out_dir: str, snapshot_dir: str, manifest: Dict):
+    """Zincirden düşen snapshot'ları ve artık referans verilmeyen yamaları sil"""
+    live_versions = {v["version"] for v in manifest["versions"]}
+    if os.path.isdir(snapshot_dir):
+        for filename in os.listdir(snapshot_dir):
+            if filename.startswith("v") and filename.endswith(".json.gz"):
+                if int(filename[1:-len(".json.gz")]) not in live_versions:
+                    os.remove(os.path.join(snapshot_dir, filename))
+
+    patch_dir = os.path.join(out_dir, PATCH_DIR)
+    live_files = {os.path.basename(p["file"]) for p in manifest["patches"].values()}
+    for filename in os.listdir(patch_dir):
+        if filename not in live_files:
+            os.remove(os.path.join(patch_dir, filename))
+
+
+def verify_versions(out_dir: str = "bundles", snapshot_dir: str = SNAPSHOT_DIR) -> bool:
+    """Her yamayı kaynak snapshot'a uygulayıp en son sürümün hash'ini üretiyor mu kontrol et"""
+    manifest = load_versions_manifest(out_dir)
+    if manifest["latest"] is None:
+        print("⚠️ Henüz sürüm yok")
+        return True
+
+    expected = manifest["versions"][-1]["sha256"]
+    ok = True
+    for base, entry in manifest["patches"].items():
+        patch = jsonio.load(os.path.join(out_dir, entry["file"]))
+        result = apply_patch(load_snapshot(snapshot_dir, int(base)), patch)
+        match = snapshot_hash(result) == expected
+        ok &= match
+        print(f"   {'✅' if match else '❌'} v{base} → v{manifest['latest']} ({entry['bytes'] / 1024:.1f}KB)")
+    return ok
+
+
+# ============================================================
+# CLI
+# ============================================================
+
+def run_snapshot(out_dir: str, snapshot_dir: str, keep: int, include_invalid: bool):
+    print("="*60)
+    print("🗂️  Soru Bankası Sürümü")
+    print("="*60)
+
+    records = snapshot_records(fetch_validated_questions(include_invalid=include_invalid))
+    print(f"\n📥 {len(records)} soru yüklendi")
+
+    version = create_version(records, out_dir=out_dir, snapshot_dir=snapshot_dir, keep=keep)
+    if version is None:
+        print("\n✅ Değişiklik yok, yeni sürüm açılmadı")
+        return
+
+    manifest = load_versions_manifest(out_dir)
+    print(f"\n🆕 Sürüm v{version}")
+    for base, entry in manifest["patches"].items():
+        print(f"   v{base} → v{version}: +{entry['added']} -{entry['removed']} ~{entry['changed']} "
+              f"({entry['bytes'] / 1024:.1f}KB)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Soru bankası sürümleri ve delta yamaları")
+    parser.add_argument("command", choices=["snapshot", "verify", "diff"], help="Komut")
+    parser.add_argument("versions", nargs="*", type=int, help="diff için iki sürüm numarası")
+    parser.add_argument("--out", type=str, default="bundles", help="Yama + manifest dizini")
+    parser.add_argument("--snapshots", type=str, default=SNAPSHOT_DIR, help="Snapshot dizini")
+    parser.add_argument("--keep", type=int, default=DEFAULT_KEEP, help="Yama üretilecek önceki sürüm sayısı")
+    parser.add_argument("--include-invalid", action="store_true", help="is_valid = false soruları da dahil et")
+
+    args = parser.parse_args()
+
+    if args.command == "snapshot":
+        run_snapshot(args.out, args.snapshots, args.keep, args.include_invalid)
+    elif args.command == "verify":
+        sys.exit(0 if verify_versions(args.out, args.snapshots) else 1)
+    else:
+        if len(args.versions) != 2:
+            parser.error("diff iki sürüm numarası alır: diff <eski> <yeni>")
+        old, new = (load_snapshot(args.snapshots, v) for v in args.versions)
+        patch = diff_snapshots(old, new)
+        print(f"v{args.versions[0]} → v{args.versions[1]}: +{len(patch['added'])} "
+              f"-{len(patch['removed'])} ~{len(patch['changed'])}")
+        for i, fields in list(patch["changed"].items())[:20]:
+            print(f"   #{i}: {', '.join(fields)}")
@@ -0,0 +1,266 @@
+"""
+Statik Soru Paketleri (PWA)
+
+Doğrulanmış soru bankasını kategori başına JSON parçalarına (shard) böler,
+her parçayı içerik hash'li dosya adıyla yazar. Quiz presetleri de ID listesi yerine tam soru
+içerikleriyle ayrı parçalar olarak üretilir. İstemci önce küçük manifest'i
+alır, sonra ihtiyaç duyduğu parçaları statik hosting'den çeker; Postgres'e
+okuma trafiği gitmez.
+
+Çıktı:
+    bundles/manifest.json                   → kısa cache (her build'de değişir)
+    bundles/shards/<kategori>.<hash>.json   → içerik hash'li, kalıcı cache
+    bundles/shards/preset-<ad>.<hash>.json
+
+Hash içerikten türetildiği için aynı içerik aynı dosya adını alır: değişmeyen
+kategoriler yeniden indirilmez, sw.js parçaları süresiz cache'leyebilir.
+Manifest'in `version` alanı, aynı soru listesinden alınan snapshot'ın
+versions.json'daki tamsayı sürümüdür (question_versions); istemci paketlerin
+hangi sürüme ait olduğunu yama zinciriyle karşılaştırabilir.
+Sıkıştırma hosting'e bırakılır (Vercel statik dosyaları Accept-Encoding'e göre
+gzip/brotli ile sunar); önceden sıkıştırılmış kopyalar yazılmaz.
+
+Kullanım:
+    python -m scripts.export.static_bundles
+    python -m scripts.export.static_bundles --out bundles --presets quiz_presets.json --prune
+    python -m scripts.export.static_bundles --snapshots question_versions --keep 5
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+import unicodedata
+from datetime import datetime
+from typing import Dict, List, Optional
+
+sys.stdout.reconfigure(line_buffering=True)
+
+from scripts import jsonio
+from scripts.db_utils import execute_query
+
+# API'nin (questionService.getQuestions) döndürdüğü alanlarla aynı
+QUESTION_FIELDS = [
+    "id", "question_number", "question_text", "options", "correct_answer",
+    "category", "url", "test_url", "tip", "explanation_tr", "question_tr", "difficulty",
+]
+
+HASH_LENGTH = 12
+SHARD_DIR = "shards"
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 1
+
+
+# ============================================================
+# VERİ
+# ============================================================
+
+def fetch_validated_questions(include_invalid: bool = False) -> List[Dict]:
+    """Cevabı olan (ve varsayılan olarak geçersiz işaretlenmemiş) soruları getir"""
+    sql = f"""
+        SELECT {', '.join(QUESTION_FIELDS)}
+        FROM questions
+        WHERE correct_answer IS NOT NULL AND correct_answer != ''
+    """
+    if not include_invalid:
+        sql += " AND COALESCE(is_valid, true)"
+    sql += " ORDER BY category, id"
+
+    rows = execute_query(sql, fetch_all=True, use_dict_cursor=True) or []
+    questions = []
+    for row in rows:
+        q = dict(row)
+        options = q.get("options")
+        if isinstance(options, str):
+            options = json.loads(options)
+        q["options"] = options if isinstance(options, list) else []
+        questions.append(q)
+    return questions
+
+
+def load_presets(path: str) -> Dict[str, List[int]]:
+    """
+    Preset dosyasını {ad: [soru_id]} olarak oku.
+    Hem quiz_presets.json ({boyut: {question_ids}}) hem de preset_optimizer
+    çıktısı ({"presets": [{name, question_ids}]}) desteklenir.
+    """
+    if not path or not os.path.exists(path):
+        return {}
+    data = jsonio.load(path)
+
+    if isinstance(data.get("presets"), list):
+        return {p["name"]: p["question_ids"] for p in data["presets"]}
+    return {
+        name: preset["question_ids"]
+        for name, preset in data.items()
+        if isinstance(preset, dict) and "question_ids" in preset
+    }
+
+
+# ============================================================
+# PARÇA YAZIMI
+# ============================================================
+
+def slugify(text: str) -> str:
+    """Kategori adını dosya adına uygun ASCII slug'a çevir"""
+    text = text.replace("ı", "i").replace("İ", "I")
+    text = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode("ascii")
+    return re.sub(r"[^a-z0-9]+", "-", text.lower()).strip("-") or "category"
+
+
+def serialize(payload) -> bytes:
+    """Deterministik, kompakt JSON (aynı içerik → aynı byte'lar → aynı hash)"""
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":"), sort_keys=True).encode("utf-8")
+
+
+def write_shard(shard_dir: str, name: str, payload) -> Dict:
+    """
+    Parçayı içerik hash'li ad ile yaz.
+    Aynı adlı dosya zaten varsa içerik aynıdır; tekrar yazılmaz.
+    """
+    raw = serialize(payload)
+    digest = hashlib.sha256(raw).hexdigest()
+    filename = f"{name}.{digest[:HASH_LENGTH]}.json"
+    path = os.path.join(shard_dir, filename)
+
+    if not os.path.exists(path):
+        tmp = f"{path}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(raw)
+        os.replace(tmp, path)
+
+    return {
+        "file": f"{SHARD_DIR}/{filename}",
+        "sha256": digest,
+        "bytes": len(raw),
+    }
+
+
+def prune_shards(shard_dir: str, keep: set) -> int:
+    """Manifest'te olmayan eski parçaları (ve eski build'lerin .gz/.br kopyalarını) sil"""
+    removed = 0
+    for filename in os.listdir(shard_dir):
+        if filename not in keep:
+            os.remove(os.path.join(shard_dir, filename))
+            removed += 1
+    return removed
+
+
+# ============================================================
+# BUILD
+# ============================================================
+
+def build_bundles(questions: List[Dict], presets: Dict[str, List[int]], out_dir: str,
+                  version: int, prune: bool = False) -> Dict:
+    """
+    Kategori + preset parçalarını ve manifest'i yaz, manifest'i döndür.
+    `version`: aynı soru listesinin versions.json'daki snapshot sürümü.
+    """
+    shard_dir = os.path.join(out_dir, SHARD_DIR)
+    os.makedirs(shard_dir, exist_ok=True)
+
+    by_category: Dict[str, List[Dict]] = {}
+    for q in questions:
+        by_category.setdefault(q["category"], []).append(q)
+
+    manifest = {
+        "manifest_version": MANIFEST_VERSION,
+        "version": version,
+        "generated_at": datetime.now().isoformat(),
+        "total_questions": len(questions),
+        "categories": {},
+        "presets": {},
+    }
+
+    used_slugs = set()
+    for category in sorted(by_category):
+        slug = slugify(category)
+        # Farklı kategoriler aynı slug'a düşerse ayırt et
+        base, n = slug, 2
+        while slug in used_slugs:
+            slug = f"{base}-{n}"
+            n += 1
+        used_slugs.add(slug)
+
+        items = by_category[category]
+        entry = write_shard(shard_dir, slug, {"category": category, "questions": items})
+        entry["count"] = len(items)
+        manifest["categories"][category] = entry
+
+    by_id = {q["id"]: q for q in questions}
+    for name, ids in presets.items():
+        items = [by_id[i] for i in ids if i in by_id]
+        missing = len(ids) - len(items)
+        entry = write_shard(shard_dir, f"preset-{slugify(name)}", {"name": name, "questions": items})
+        entry["count"] = len(items)
+        if missing:
+            entry["missing"] = missing
+            print(f"   ⚠️ {name}: {missing} soru pakette yok (geçersiz/silinmiş)")
+        manifest["presets"][name] = entry
+
+    # İçerik hash'i = tüm parça hash'lerinin hash'i (presetler dahil; içerik değişmezse o da değişmez)
+    all_hashes = sorted(e["sha256"] for group in ("categories", "presets") for e in manifest[group].values())
+    manifest["content_hash"] = hashlib.sha256("".join(all_hashes).encode()).hexdigest()[:HASH_LENGTH]
+
+    manifest_path = os.path.join(out_dir, MANIFEST_NAME)
+    jsonio.dump(manifest, manifest_path)
+
+    if prune:
+        keep = {os.path.basename(e["file"]) for group in ("categories", "presets") for e in manifest[group].values()}
+        removed = prune_shards(shard_dir, keep)
+        if removed:
+            print(f"   🧹 {removed} eski parça dosyası silindi")
+
+    return manifest
+
+
+def main(out_dir: str = "bundles", presets_path: Optional[str] = "quiz_presets.json",
+         include_invalid: bool = False, prune: bool = False,
+         snapshot_dir: Optional[str] = None, keep: Optional[int] = None):
+    print("="*60)
+    print("📦 Statik Soru Paketleri")
+    print("="*60)
+
+    start = time.time()
+    questions = fetch_validated_questions(include_invalid=include_invalid)
+    print(f"\n📥 {len(questions)} soru yüklendi ({time.time() - start:.1f}sn)")
+
+    presets = load_presets(presets_path)
+    if presets:
+        print(f"🎯 {len(presets)} preset: {presets_path}")
+
+    # Paketler ve versions.json aynı snapshot'tan: sürüm numarası ortak
+    # (question_versions bu modülü import ettiği için burada import edilir)
+    from scripts.export import question_versions
+    version = question_versions.snapshot_version(
+        question_versions.snapshot_records(questions), out_dir=out_dir,
+        snapshot_dir=snapshot_dir or question_versions.SNAPSHOT_DIR,
+        keep=question_versions.DEFAULT_KEEP if keep is None else keep,
+    )
+
+    manifest = build_bundles(questions, presets, out_dir, version, prune=prune)
+
+    print(f"\n📂 Kategoriler:")
+    for category, entry in manifest["categories"].items():
+        print(f"   {category}: {entry['count']} soru, {entry['bytes'] / 1024:.0f}KB")
+
+    print(f"\n✅ Manifest: {os.path.join(out_dir, MANIFEST_NAME)} (sürüm v{manifest['version']})")
+    return manifest
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="PWA için statik soru paketleri oluştur")
+    parser.add_argument("--out", type=str, default="bundles", help="Çıktı dizini")
+    parser.add_argument("--presets", type=str, default="quiz_presets.json", help="Preset dosyası (boş: preset yok)")
+    parser.add_argument("--include-invalid", action="store_true", help="is_valid = false soruları da dahil et")
+    parser.add_argument("--prune", action="store_true", help="Manifest'te olmayan eski parçaları sil")
+    parser.add_argument("--snapshots", type=str, default=None, help="Snapshot dizini (question_versions)")
+    parser.add_argument("--keep", type=int, default=None, help="Yama üretilecek önceki sürüm sayısı")
+
+    args = parser.parse_args()
+    main(out_dir=args.out, presets_path=args.presets or None,
+         include_invalid=args.include_invalid, prune=args.prune,
+         snapshot_dir=args.snapshots, keep=args.keep)
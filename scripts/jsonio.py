@@ -0,0 +1,290 @@
+"""
+JSON Okuma/Yazma Katmanı
+Korpus dosyalarını (yds_questions/*.json, _summary.json, ilerleme dosyaları)
+okuyan/yazan tüm scriptlerin ortak giriş noktası.
+
+- orjson kuruluysa onu kullanır, yoksa stdlib json'a düşer (çıktı biçimi aynı:
+  UTF-8, indent=2)
+- dump() varsayılan olarak atomiktir: geçici dosyaya yazıp rename eder, yarıda
+  kesilen bir kayıt mevcut dosyayı bozmaz; dosya izinleri korunur (yeni dosya
+  open() ile açılmış gibi 0o666 & ~umask alır)
+- compact=True ile boşluksuz yazar (indent yok)
+- iter_array() çok büyük dizileri tamamını belleğe almadan eleman eleman okur
+
+Kullanım:
+    from scripts import jsonio
+
+    data = jsonio.load("yds_questions/yds_diyalog.json")
+    jsonio.dump(data, "yds_questions/yds_diyalog.json")
+    for q in jsonio.iter_array("yds_all_questions.json", key="questions"):
+        ...
+
+    python -m scripts.jsonio                    # yds_questions/*.json üzerinde benchmark
+"""
+
+import json
+import os
+import stat
+import tempfile
+from typing import Any, Iterator, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+BACKEND = "orjson" if orjson else "json"
+
+_STREAM_CHUNK = 1 << 16
+_WHITESPACE = " \t\n\r"
+
+
+def _read_umask() -> int:
+    # umask sadece değiştirilerek okunabilir; thread'lerden önce, import sırasında bir kez
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+
+_UMASK = _read_umask()
+
+
+def loads(data) -> Any:
+    """bytes/str → Python nesnesi"""
+    if orjson:
+        return orjson.loads(data)
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        data = bytes(data).decode("utf-8")
+    return json.loads(data)
+
+
+def dumps(obj: Any, compact: bool = False, sort_keys: bool = False) -> bytes:
+    """Python nesnesi → UTF-8 bytes (varsayılan indent=2, ensure_ascii=False)"""
+    if orjson:
+        option = orjson.OPT_NON_STR_KEYS
+        if not compact:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, option=option)
+    if compact:
+        text = json.dumps(obj, ensure_ascii=False, separators=(",", ":"), sort_keys=sort_keys)
+    else:
+        text = json.dumps(obj, ensure_ascii=False, indent=2, sort_keys=sort_keys)
+    return text.encode("utf-8")
+
+
+def load(path: str) -> Any:
+    """Dosyayı oku ve parse et"""
+    with open(path, "rb") as f:
+        return loads(f.read())
+
+
+def _file_mode(path: str) -> int:
+    """Mevcut dosyanın izinleri; dosya yoksa open()'ın vereceği 0o666 & ~umask"""
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        return 0o666 & ~_UMASK
+
+
+def dump(obj: Any, path: str, compact: bool = False, atomic: bool = True,
+         sort_keys: bool = False) -> int:
+    """
+    Nesneyi dosyaya yaz, yazılan byte sayısını döndür
+
+    Args:
+        compact: Boşluksuz yaz (indent yok)
+        atomic: Aynı dizinde geçici dosyaya yazıp os.replace ile taşı
+    """
+    data = dumps(obj, compact=compact, sort_keys=sort_keys)
+    if not atomic:
+        with open(path, "wb") as f:
+            f.write(data)
+        return len(data)
+
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(path)}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        # mkstemp dosyayı 0600 açar; rename sonrası hedefin izinleri değişmesin
+        os.chmod(tmp, _file_mode(path))
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+    return len(data)
+
+
+# ============================================================
+# AKIŞLI DİZİ OKUMA
+# ============================================================
+
+class _Reader:
+    """Metin akışı üzerinde raw_decode için tampon"""
+
+    def __init__(self, f, chunk_size: int):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self) -> bool:
+        if self.eof:
+            return False
+        chunk = self.f.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        # Tüketilmiş kısmı at, tampon sadece işlenmemiş veriyi tutsun
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Boşlukları atla, sıradaki karakteri döndür (EOF'ta '')"""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self.fill():
+                return ""
+
+    def expect(self, char: str):
+        if self.peek() != char:
+            raise ValueError(f"JSON akışında '{char}' bekleniyordu, '{self.peek()}' bulundu")
+        self.pos += 1
+
+    def value(self, decoder: json.JSONDecoder) -> Any:
+        """Sıradaki JSON değerini çöz; tampon yetmezse okumaya devam et"""
+        self.peek()
+        while True:
+            try:
+                obj, end = decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if not self.fill():
+                    raise
+                continue
+            # Sayılar tampon sonunda kesilmiş olabilir ("12" + "34")
+            if end == len(self.buf) and not self.eof and isinstance(obj, (int, float)):
+                if self.fill():
+                    continue
+            self.pos = end
+            return obj
+
+
+def iter_array(path: str, key: Optional[str] = None,
+               chunk_size: int = _STREAM_CHUNK) -> Iterator[Any]:
+    """
+    Dosyadaki diziyi eleman eleman oku (dosya bir bütün olarak belleğe alınmaz)
+
+    Args:
+        key: None ise dosyanın kendisi dizi olmalı; verilirse üst seviye
+             nesnedeki bu anahtarın değeri (örn. "questions") akıtılır
+    """
+    decoder = json.JSONDecoder()
+    with open(path, "r", encoding="utf-8") as f:
+        reader = _Reader(f, chunk_size)
+
+        if key is not None:
+            reader.expect("{")
+            while True:
+                if reader.peek() == "}":
+                    return
+                name = reader.value(decoder)
+                reader.expect(":")
+                if name == key:
+                    break
+                reader.value(decoder)  # Diğer alanları atla
+                if reader.peek() == ",":
+                    reader.pos += 1
+
+        reader.expect("[")
+        if reader.peek() == "]":
+            return
+        while True:
+            yield reader.value(decoder)
+            char = reader.peek()
+            if char == ",":
+                reader.pos += 1
+            elif char == "]":
+                return
+            else:
+                raise ValueError(f"JSON dizisinde ',' veya ']' bekleniyordu, '{char}' bulundu")
+
+
+# ============================================================
+# BENCHMARK
+# ============================================================
+
+def _measure(fn):
+    """(süre sn, tracemalloc tepe bellek byte) döndür"""
+    import time
+    import tracemalloc
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def benchmark(paths, repeat: int = 3):
+    """stdlib json ile aktif backend'i load/dump süresi ve tepe bellek açısından karşılaştır"""
+    import io
+
+    def stdlib_load(path):
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def stdlib_dump(obj):
+        json.dump(obj, io.StringIO(), indent=2, ensure_ascii=False)
+
+    def drain(path):
+        for _ in iter_array(path, key="questions"):
+            pass
+
+    cases = [
+        ("json.load", lambda p, d: stdlib_load(p)),
+        (f"jsonio.load ({BACKEND})", lambda p, d: load(p)),
+        ("json.dump", lambda p, d: stdlib_dump(d)),
+        (f"jsonio.dumps ({BACKEND})", lambda p, d: dumps(d)),
+        ("jsonio.iter_array", lambda p, d: drain(p)),
+    ]
+
+    total_bytes = sum(os.path.getsize(p) for p in paths)
+    print(f"📂 {len(paths)} dosya, {total_bytes / 1024 / 1024:.1f}MB, tekrar: {repeat}\n")
+    print(f"{'İşlem':<28} {'Süre (ms)':>10} {'Tepe bellek (MB)':>18}")
+    print("-" * 58)
+
+    data = {p: load(p) for p in paths}
+    for name, fn in cases:
+        best_time, peak = float("inf"), 0
+        for _ in range(repeat):
+            # Süre tüm dosyaların toplamı, bellek tek dosyadaki en yüksek tepe
+            elapsed_all = 0.0
+            for p in paths:
+                elapsed, mem = _measure(lambda: fn(p, data[p]))
+                elapsed_all += elapsed
+                peak = max(peak, mem)
+            best_time = min(best_time, elapsed_all)
+        print(f"{name:<28} {best_time * 1000:>10.1f} {peak / 1024 / 1024:>18.2f}")
+
+if __name__ == "__main__":
+    import argparse
+    import glob
+
+    parser = argparse.ArgumentParser(description="jsonio load/dump benchmark'ı")
+    parser.add_argument("paths", nargs="*", help="JSON dosyaları (varsayılan: yds_questions/*.json)")
+    parser.add_argument("--repeat", type=int, default=3, help="Tekrar sayısı (en iyi süre raporlanır)")
+
+    args = parser.parse_args()
+    paths = args.paths or sorted(p for p in glob.glob("yds_questions/*.json")
+                                 if not os.path.basename(p).startswith("_"))
+    benchmark(paths, repeat=args.repeat)
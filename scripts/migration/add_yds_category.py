@@ -0,0 +1,103 @@
+"""
+questions.yds_category kolonunu ekle ve doldur
+
+Serbest metin `category` değerleri CATEGORY_TO_YDS haritasıyla kanonik YDS
+kategorisine çevrilip `yds_category` kolonuna yazılır. Preset ve analiz
+sorguları alias listeleriyle `category IN (...)` yerine bu indeksli kolon
+üzerinde tek eşitlik araması yapar.
+
+Yeni eklenen sorular için kolonu ingest yolları doldurur
+(yds_enrich_and_upload, migrate_yds_questions_refactored). Bu script
+idempotenttir; alias haritası değiştiğinde tekrar çalıştırılabilir.
+
+Kullanım:
+    python -m scripts.migration.add_yds_category
+    python -m scripts.migration.add_yds_category --dry-run
+"""
+
+import argparse
+import sys
+
+from psycopg2.extras import execute_values
+
+sys.stdout.reconfigure(line_buffering=True)
+
+from scripts.db_utils import get_db_connection
+from scripts.constants import CATEGORY_TO_YDS
+
+
+def migrate_yds_category(dry_run: bool = False):
+    print("="*60)
+    print("🏷️  yds_category Kolonu Migrasyonu")
+    print("="*60)
+
+    with get_db_connection() as conn:
+        cur = conn.cursor()
+
+        # 1. Kolon + indeks
+        cur.execute("ALTER TABLE questions ADD COLUMN IF NOT EXISTS yds_category VARCHAR(100)")
+        cur.execute("CREATE INDEX IF NOT EXISTS idx_questions_yds_category ON questions(yds_category)")
+        print("\n✅ Kolon ve indeks hazır")
+
+        # 2. Alias haritasıyla tek UPDATE ... FROM (VALUES ...) ile doldur
+        # (kategori, ingest'teki resolve_yds_category gibi baş/son boşluklarından arındırılıp eşlenir)
+        execute_values(cur, """
+            UPDATE questions AS q
+            SET yds_category = m.yds_category
+            FROM (VALUES %s) AS m(category, yds_category)
+            WHERE BTRIM(q.category, E' \\t\\r\\n') = m.category
+            AND q.yds_category IS DISTINCT FROM m.yds_category
+        """, list(CATEGORY_TO_YDS.items()), page_size=len(CATEGORY_TO_YDS))
+        updated = cur.rowcount
+
+        # Haritadan çıkarılmış alias'ların eski değerlerini temizle
+        cur.execute("""
+            UPDATE questions
+            SET yds_category = NULL
+            WHERE yds_category IS NOT NULL
+            AND NOT (BTRIM(category, E' \\t\\r\\n') = ANY(%s))
+        """, (list(CATEGORY_TO_YDS),))
+        cleared = cur.rowcount
+        print(f"\n📝 Güncellenen: {updated}, temizlenen: {cleared}")
+
+        # 3. Rapor
+        cur.execute("""
+            SELECT yds_category, COUNT(*)
+            FROM questions
+            GROUP BY yds_category
+            ORDER BY COUNT(*) DESC
+        """)
+        print("\n📂 YDS Kategorileri:")
+        print("-"*50)
+        for yds_category, count in cur.fetchall():
+            print(f"   {yds_category or '(eşlenmemiş)'}: {count} soru")
+
+        cur.execute("""
+            SELECT category, COUNT(*)
+            FROM questions
+            WHERE yds_category IS NULL
+            GROUP BY category
+            ORDER BY COUNT(*) DESC
+        """)
+        unmapped = cur.fetchall()
+        if unmapped:
+            print("\n⚠️ Eşlenemeyen Kategoriler:")
+            for category, count in unmapped:
+                print(f"   - {category}: {count} soru")
+
+        if dry_run:
+            conn.rollback()
+            print("\n🔍 Dry run: değişiklikler geri alındı")
+        else:
+            conn.commit()
+            print("\n✅ Migrasyon tamamlandı")
+
+        cur.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="questions.yds_category kolonunu ekle ve doldur")
+    parser.add_argument("--dry-run", action="store_true", help="Değişiklikleri kaydetmeden raporla")
+
+    args = parser.parse_args()
+    migrate_yds_category(dry_run=args.dry_run)
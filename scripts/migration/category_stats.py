@@ -0,0 +1,187 @@
+"""
+question_category_stats Tablosu (Materyalize Kategori İstatistikleri)
+
+Kategori sayımlarını her seferinde `GROUP BY category` ile tüm questions
+tablosunu tarayarak hesaplamak yerine (category, difficulty, gpt_status)
+kırılımında önceden toplanmış sayımları tutar:
+
+    total        → toplam soru
+    with_answer  → correct_answer dolu
+    validated    → GPT ile doğrulanmış (gpt_verified_at dolu)
+    invalid      → is_valid = false
+
+Tablo satır bazlı bir trigger ile artımlı güncellenir (INSERT/DELETE ve ilgili
+kolonlardaki UPDATE'ler eski katkıyı çıkarıp yenisini ekler). Trigger dışı
+toplu değişikliklerden sonra `--refresh` ile tablo baştan hesaplanabilir.
+Python yardımcıları (db_utils.get_categories, get_category_stats) bu tablodan
+O(kategori) okur.
+
+Kullanım:
+    python -m scripts.migration.category_stats            # Tablo + trigger + ilk doldurma
+    python -m scripts.migration.category_stats --refresh  # Sadece yeniden hesapla
+    python -m scripts.migration.category_stats --verify   # Tam taramayla karşılaştır
+"""
+
+import argparse
+import sys
+
+sys.stdout.reconfigure(line_buffering=True)
+
+from scripts.db_utils import get_db_connection
+
+
+# NULL difficulty / gpt_status '' olarak saklanır (birincil anahtar NULL kabul etmez)
+CREATE_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS question_category_stats (
+        category VARCHAR(100) NOT NULL,
+        difficulty VARCHAR(20) NOT NULL DEFAULT '',
+        gpt_status VARCHAR(20) NOT NULL DEFAULT '',
+        total INTEGER NOT NULL DEFAULT 0,
+        with_answer INTEGER NOT NULL DEFAULT 0,
+        validated INTEGER NOT NULL DEFAULT 0,
+        invalid INTEGER NOT NULL DEFAULT 0,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        PRIMARY KEY (category, difficulty, gpt_status)
+    )
+"""
+
+# Tek bir sorunun katkısını (delta = +1 / -1) ilgili satıra uygular
+CREATE_FUNCTION_SQL = """
+    CREATE OR REPLACE FUNCTION question_category_stats_apply(q questions, delta INTEGER)
+    RETURNS VOID AS $$
+    BEGIN
+        INSERT INTO question_category_stats AS s
+            (category, difficulty, gpt_status, total, with_answer, validated, invalid, updated_at)
+        VALUES (
+            q.category,
+            COALESCE(q.difficulty, ''),
+            COALESCE(q.gpt_status, ''),
+            delta,
+            CASE WHEN q.correct_answer IS NOT NULL AND q.correct_answer != '' THEN delta ELSE 0 END,
+            CASE WHEN q.gpt_verified_at IS NOT NULL THEN delta ELSE 0 END,
+            CASE WHEN q.is_valid = false THEN delta ELSE 0 END,
+            CURRENT_TIMESTAMP
+        )
+        ON CONFLICT (category, difficulty, gpt_status) DO UPDATE SET
+            total = s.total + EXCLUDED.total,
+            with_answer = s.with_answer + EXCLUDED.with_answer,
+            validated = s.validated + EXCLUDED.validated,
+            invalid = s.invalid + EXCLUDED.invalid,
+            updated_at = EXCLUDED.updated_at;
+    END;
+    $$ LANGUAGE plpgsql;
+
+    CREATE OR REPLACE FUNCTION question_category_stats_trigger()
+    RETURNS TRIGGER AS $$
+    BEGIN
+        IF TG_OP IN ('UPDATE', 'DELETE') THEN
+            PERFORM question_category_stats_apply(OLD, -1);
+        END IF;
+        IF TG_OP IN ('INSERT', 'UPDATE') THEN
+            PERFORM question_category_stats_apply(NEW, 1);
+        END IF;
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql;
+"""
+
+# UPDATE sadece sayımı etkileyen kolonlarda tetiklenir (çeviri/ipucu güncellemeleri değil)
+CREATE_TRIGGER_SQL = """
+    DROP TRIGGER IF EXISTS trg_question_category_stats ON questions;
+    CREATE TRIGGER trg_question_category_stats
+    AFTER INSERT OR DELETE OR UPDATE OF category, difficulty, gpt_status, correct_answer, is_valid, gpt_verified_at
+    ON questions
+    FOR EACH ROW EXECUTE FUNCTION question_category_stats_trigger();
+"""
+
+AGGREGATE_SQL = """
+    SELECT category,
+           COALESCE(difficulty, '') AS difficulty,
+           COALESCE(gpt_status, '') AS gpt_status,
+           COUNT(*) AS total,
+           COUNT(*) FILTER (WHERE correct_answer IS NOT NULL AND correct_answer != '') AS with_answer,
+           COUNT(*) FILTER (WHERE gpt_verified_at IS NOT NULL) AS validated,
+           COUNT(*) FILTER (WHERE is_valid = false) AS invalid
+    FROM questions
+    GROUP BY 1, 2, 3
+"""
+
+
+def refresh_category_stats(cur):
+    """Tabloyu tam taramayla baştan hesapla (trigger'lar eşzamanlı yazamasın diye kilitli)"""
+    cur.execute("LOCK TABLE question_category_stats IN EXCLUSIVE MODE")
+    cur.execute("DELETE FROM question_category_stats")
+    cur.execute(f"""
+        INSERT INTO question_category_stats
+            (category, difficulty, gpt_status, total, with_answer, validated, invalid)
+        {AGGREGATE_SQL}
+    """)
+    return cur.rowcount
+
+
+def install_category_stats():
+    """Tablo, fonksiyonlar ve trigger'ı oluştur, ardından ilk doldurmayı yap"""
+    with get_db_connection() as conn:
+        cur = conn.cursor()
+        cur.execute(CREATE_TABLE_SQL)
+        cur.execute(CREATE_FUNCTION_SQL)
+        # Trigger ile ilk doldurma aynı transaction'da: arada eklenen soru kaybolmaz
+        cur.execute("LOCK TABLE questions IN SHARE ROW EXCLUSIVE MODE")
+        cur.execute(CREATE_TRIGGER_SQL)
+        rows = refresh_category_stats(cur)
+        conn.commit()
+        cur.close()
+    print(f"✅ Tablo + trigger kuruldu, {rows} istatistik satırı yazıldı")
+
+
+def refresh_only():
+    with get_db_connection() as conn:
+        cur = conn.cursor()
+        rows = refresh_category_stats(cur)
+        conn.commit()
+        cur.close()
+    print(f"✅ İstatistikler yeniden hesaplandı: {rows} satır")
+
+
+def verify_category_stats() -> bool:
+    """Materyalize sayımları tam taramayla karşılaştır"""
+    with get_db_connection() as conn:
+        cur = conn.cursor()
+        cur.execute(AGGREGATE_SQL)
+        expected = {tuple(r[:3]): tuple(r[3:]) for r in cur.fetchall()}
+        cur.execute("""
+            SELECT category, difficulty, gpt_status, total, with_answer, validated, invalid
+            FROM question_category_stats
+            WHERE total != 0
+        """)
+        actual = {tuple(r[:3]): tuple(r[3:]) for r in cur.fetchall()}
+        cur.close()
+
+    mismatches = [key for key in expected.keys() | actual.keys() if expected.get(key) != actual.get(key)]
+    if mismatches:
+        print(f"❌ {len(mismatches)} satır uyuşmuyor:")
+        for key in mismatches[:20]:
+            print(f"   {key}: beklenen {expected.get(key)}, tabloda {actual.get(key)}")
+        return False
+
+    print(f"✅ {len(expected)} satır tam taramayla uyumlu")
+    return True
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="question_category_stats tablosu")
+    parser.add_argument("--refresh", action="store_true", help="Sadece tabloyu yeniden hesapla")
+    parser.add_argument("--verify", action="store_true", help="Tabloyu tam taramayla doğrula")
+
+    args = parser.parse_args()
+
+    print("="*60)
+    print("📊 Kategori İstatistik Tablosu")
+    print("="*60)
+
+    if args.verify:
+        sys.exit(0 if verify_category_stats() else 1)
+    elif args.refresh:
+        refresh_only()
+    else:
+        install_category_stats()
@@ -10,8 +10,9 @@ from datetime import datetime
 
 sys.stdout.reconfigure(line_buffering=True)
 
+from scripts import jsonio
 from scripts.db_utils import get_db_connection, check_question_exists
-from scripts.constants import YDS_FILES
+from scripts.constants import YDS_FILES, resolve_yds_category
 
 
 def migrate_questions():
@@ -28,9 +29,9 @@ def migrate_questions():
             continue
         
         print(f"\n📂 {category_name}")
+        yds_category = resolve_yds_category(category_name)
         
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = jsonio.load(file_path)
         
         questions = data.get("questions", [])
         print(f"   Toplam soru: {len(questions)}")
@@ -61,13 +62,14 @@ def migrate_questions():
                 try:
                     cur.execute("""
                         INSERT INTO questions (
-                            question_text, options, correct_answer, category, url, test_url
-                        ) VALUES (%s, %s::jsonb, %s, %s, %s, %s)
+                            question_text, options, correct_answer, category, yds_category, url, test_url
+                        ) VALUES (%s, %s::jsonb, %s, %s, %s, %s, %s)
                     """, (
                         question_text,
                         options_json,
                         correct_answer,
                         category_name,
+                        yds_category,
                         url,
                         test_url
                     ))
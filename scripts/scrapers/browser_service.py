@@ -0,0 +1,138 @@
+"""
+Paylaşılan Tarayıcı Servisi (CDP)
+
+Her scraper çalıştırmasında Chromium'u baştan başlatıp kapatmak yerine uzun
+ömürlü bir tarayıcı süreci açık tutulur; scraper'lar varsa ona CDP üzerinden
+bağlanır, yoksa eskisi gibi kendi tarayıcısını başlatır. Python Playwright'ta
+`launch_server` olmadığından servis Chromium'u `--remote-debugging-port` ile
+açar ve istemciler `connect_over_cdp` kullanır.
+
+Servis:
+    python -m scripts.scrapers.browser_service serve            # 127.0.0.1:9222
+    python -m scripts.scrapers.browser_service serve --port 9333
+    python -m scripts.scrapers.browser_service status
+
+İstemci (tüm giriş noktaları):
+    async with async_playwright() as p:
+        browser = await open_browser(p)   # bağlan ya da başlat; süreyi raporla
+        ...
+        await browser.close()             # bağlıysa sadece bağlantı kapanır
+
+Uç nokta `BROWSER_CDP_URL` ortam değişkeniyle değiştirilebilir.
+"""
+
+import argparse
+import asyncio
+import os
+import time
+from urllib.parse import urlsplit
+
+DEFAULT_PORT = 9222
+CDP_URL_ENV = "BROWSER_CDP_URL"
+PROBE_TIMEOUT = 0.5      # sn; servis yoksa beklemeden başlatmaya düş
+CONNECT_TIMEOUT = 5000   # ms
+
+
+def cdp_url(port: int = DEFAULT_PORT) -> str:
+    return os.environ.get(CDP_URL_ENV) or f"http://127.0.0.1:{port}"
+
+
+async def is_listening(url: str, timeout: float = PROBE_TIMEOUT) -> bool:
+    """Uç noktada TCP dinleyen var mı (bağlantı reddi/timeout'ta False)"""
+    parts = urlsplit(url)
+    try:
+        _, writer = await asyncio.wait_for(
+            asyncio.open_connection(parts.hostname, parts.port or 80), timeout)
+    except (OSError, asyncio.TimeoutError):
+        return False
+    writer.close()
+    return True
+
+
+async def open_browser(p, endpoint: str = None, headless: bool = True, label: str = "Tarayıcı"):
+    """
+    Paylaşılan servise bağlan; servis yoksa ya da bağlantı başarısızsa
+    Chromium'u başlat. Soğuk başlangıç süresi her iki durumda da yazdırılır.
+    """
+    endpoint = endpoint or cdp_url()
+    start = time.perf_counter()
+
+    if await is_listening(endpoint):
+        try:
+            browser = await p.chromium.connect_over_cdp(endpoint, timeout=CONNECT_TIMEOUT)
+            print(f"🌐 {label}: paylaşılan servise bağlanıldı ({endpoint}, "
+                  f"{time.perf_counter() - start:.2f}sn)")
+            return browser
+        except Exception as e:
+            print(f"⚠️  {label}: servise bağlanılamadı ({e}), yeni tarayıcı başlatılıyor")
+
+    browser = await p.chromium.launch(headless=headless)
+    print(f"🌐 {label}: yeni tarayıcı başlatıldı ({time.perf_counter() - start:.2f}sn)")
+    return browser
+
+
+# ============================================================
+# SERVİS
+# ============================================================
+
+async def serve(port: int = DEFAULT_PORT, headless: bool = True):
+    """Chromium'u uzaktan hata ayıklama portuyla aç ve kapatılana kadar açık tut"""
+    from playwright.async_api import async_playwright
+
+    endpoint = f"http://127.0.0.1:{port}"
+    if await is_listening(endpoint):
+        print(f"⚠️  {endpoint} zaten kullanımda")
+        return
+
+    async with async_playwright() as p:
+        start = time.perf_counter()
+        browser = await p.chromium.launch(
+            headless=headless,
+            args=[f"--remote-debugging-port={port}", "--remote-debugging-address=127.0.0.1"],
+        )
+        print(f"🌐 Tarayıcı servisi hazır: {endpoint} ({time.perf_counter() - start:.2f}sn)")
+        print("   Kapatmak için Ctrl+C")
+
+        closed = asyncio.Event()
+        browser.on("disconnected", lambda _: closed.set())
+        try:
+            await closed.wait()
+        finally:
+            if browser.is_connected():
+                await browser.close()
+
+
+async def status(endpoint: str):
+    if not await is_listening(endpoint):
+        print(f"❌ Servis yok: {endpoint}")
+        return
+
+    from playwright.async_api import async_playwright
+    async with async_playwright() as p:
+        start = time.perf_counter()
+        browser = await p.chromium.connect_over_cdp(endpoint, timeout=CONNECT_TIMEOUT)
+        elapsed = time.perf_counter() - start
+        print(f"✅ {endpoint}: Chromium {browser.version}, {len(browser.contexts)} context, "
+              f"bağlantı {elapsed:.2f}sn")
+        await browser.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Scraper'lar için paylaşılan tarayıcı servisi")
+    parser.add_argument("command", choices=["serve", "status"], help="Komut")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="CDP portu")
+    parser.add_argument("--headful", action="store_true", help="Tarayıcıyı görünür aç")
+
+    args = parser.parse_args()
+
+    try:
+        if args.command == "serve":
+            asyncio.run(serve(args.port, headless=not args.headful))
+        else:
+            asyncio.run(status(cdp_url(args.port)))
+    except KeyboardInterrupt:
+        print("\n👋 Tarayıcı servisi kapatıldı")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,278 @@
+"""
+Append-Only Scraper Checkpoint Log'u
+
+Her ilerleme kaydında tüm kategori dosyalarını + _summary.json'u baştan yazmak
+yerine olaylar kategori başına JSONL dosyalarına eklenir:
+
+    <output_dir>/_log/<kategori>.jsonl
+        {"type": "scraped", "category": "...", "question": {...}}   → kazınan soru
+        {"type": "answer", "category": "...", "url": "...", "correct_answer": "B"}
+
+Checkpoint maliyeti yeni olay sayısıyla orantılıdır. Belirli sayıda olay
+biriktiğinde log'lar arka planda (ayrı thread'de) mevcut JSON düzenine
+sıkıştırılır: kategori dosyası okunur, log url bazında üzerine uygulanır,
+jsonio ile atomik yazılır ve _summary.json'daki ilgili kategori satırı
+güncellenir. Sıkıştırma sürerken gelen olaylar yeni log dosyasına yazılır.
+
+Kesilen bir çalışmadan kalan log'lar bir sonraki `CheckpointLog` açılışında
+uygulanır (olaylar url'ye göre idempotent).
+
+Kullanım:
+    checkpoint = CheckpointLog("yds_questions")
+    await checkpoint.recover()
+    checkpoint.record_scraped(category, question)
+    checkpoint.record_answer(category, url, "C")
+    summary = await checkpoint.close()
+"""
+
+import asyncio
+import os
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+from scripts import jsonio
+
+LOG_DIR = "_log"
+SUMMARY_FILE = "_summary.json"
+COMPACT_EVERY = 500  # Bu kadar olaydan sonra arka planda sıkıştır
+COMPACTING_SUFFIX = ".compacting"
+
+
+def category_filename(category: str) -> str:
+    """Kategori → JSON dosya adı (yds_scraper_gpt ile aynı kural)"""
+    return f"{category.replace(' ', '_').replace('/', '_').lower()}.json"
+
+
+def question_counts(questions: List[Dict]) -> Dict[str, int]:
+    return {
+        "count": len(questions),
+        "success": sum(1 for q in questions if q.get("question_text")),
+        "with_answer": sum(1 for q in questions if q.get("correct_answer")),
+    }
+
+
+def saved_answers(output_dir: str, categories: Iterable[str]) -> Dict[str, str]:
+    """Kategori JSON dosyalarındaki cevaplar: {url: correct_answer} (recover() sonrası güncel)"""
+    answers = {}
+    for category in set(categories):
+        filename = os.path.join(output_dir, category_filename(category))
+        if not os.path.exists(filename):
+            continue
+        for q in jsonio.load(filename).get("questions", []):
+            if q.get("url") and q.get("correct_answer"):
+                answers[q["url"]] = q["correct_answer"]
+    return answers
+
+
+def read_events(path: str) -> List[Dict]:
+    """JSONL log'unu oku; yarım kalmış son satır (kesinti) atlanır"""
+    events = []
+    with open(path, "rb") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                events.append(jsonio.loads(line))
+            except ValueError:
+                continue
+    return events
+
+
+def apply_events(questions: List[Dict], events: List[Dict]) -> List[Dict]:
+    """Olayları soru listesine url bazında uygula (yerinde günceller, sıra korunur)"""
+    by_url = {q.get("url"): i for i, q in enumerate(questions) if q.get("url")}
+    for event in events:
+        if event["type"] == "scraped":
+            q = event["question"]
+            i = by_url.get(q.get("url"))
+            if i is None:
+                by_url[q.get("url")] = len(questions)
+                questions.append(q)
+            elif q.get("question_text") or not questions[i].get("question_text"):
+                # Önceden alınmış cevap yeniden kazımada kaybolmasın
+                if not q.get("correct_answer") and questions[i].get("correct_answer"):
+                    q = {**q, "correct_answer": questions[i]["correct_answer"]}
+                questions[i] = q
+            # Metinsiz kayıt (hata / eksik sayfa) mevcut soruyu ezmez
+        elif event["type"] == "answer":
+            i = by_url.get(event["url"])
+            # Cevapsız olay (GPT/site cevap veremedi) önceki cevabı silmez
+            if i is not None and event["correct_answer"] is not None:
+                questions[i]["correct_answer"] = event["correct_answer"]
+    return questions
+
+
+class CheckpointLog:
+    """Kategori başına append-only olay log'u + arka plan sıkıştırma"""
+
+    def __init__(self, output_dir: str, compact_every: int = COMPACT_EVERY):
+        self.output_dir = output_dir
+        self.log_dir = os.path.join(output_dir, LOG_DIR)
+        self.compact_every = compact_every
+        os.makedirs(self.log_dir, exist_ok=True)
+
+        self._files = {}            # kategori → açık log dosyası
+        self._dirty = set()         # sıkıştırılmamış olayı olan kategoriler
+        self._pending = 0           # son sıkıştırmadan beri olay sayısı
+        self._compact_lock = asyncio.Lock()
+        self._compact_task: Optional[asyncio.Task] = None
+        self.summary: Optional[Dict] = None
+
+    # ------------------------------------------------------------
+    # Yazma
+    # ------------------------------------------------------------
+
+    def _log_path(self, category: str) -> str:
+        return os.path.join(self.log_dir, category_filename(category) + "l")
+
+    def _append(self, category: str, event: Dict):
+        f = self._files.get(category)
+        if f is None:
+            f = self._files[category] = open(self._log_path(category), "ab")
+        f.write(jsonio.dumps(event, compact=True) + b"\n")
+        f.flush()
+        self._dirty.add(category)
+        self._pending += 1
+        if self._pending >= self.compact_every:
+            self.schedule_compaction()
+
+    def record_scraped(self, category: str, question: Dict):
+        self._append(category, {"type": "scraped", "category": category, "question": question})
+
+    def record_answer(self, category: str, url: str, correct_answer: Optional[str]):
+        self._append(category, {"type": "answer", "category": category, "url": url,
+                                "correct_answer": correct_answer})
+
+    # ------------------------------------------------------------
+    # Sıkıştırma
+    # ------------------------------------------------------------
+
+    def _rotate(self) -> List[str]:
+        """Kirli log'ları .compacting adına taşı; yeni olaylar yeni dosyaya yazılır"""
+        categories = sorted(self._dirty)
+        self._dirty.clear()
+        self._pending = 0
+        for category in categories:
+            f = self._files.pop(category, None)
+            if f:
+                f.close()
+            path = self._log_path(category)
+            segment = path + COMPACTING_SUFFIX
+            if not os.path.exists(path):
+                continue
+            if os.path.exists(segment):
+                # Yarım kalmış sıkıştırmadan segment kalmış: yeni olayları sonuna ekle
+                # (başta "\n": segment yarım satırla bitmiş olabilir, boş satırlar atlanır)
+                with open(path, "rb") as src, open(segment, "ab") as dst:
+                    dst.write(b"\n" + src.read())
+                os.remove(path)
+            else:
+                os.replace(path, segment)
+        return categories
+
+    def _compact_category(self, category: str) -> Dict[str, int]:
+        """Bir kategorinin log segment'ini JSON dosyasına uygula (thread'de çalışır)"""
+        filename = os.path.join(self.output_dir, category_filename(category))
+        data = jsonio.load(filename) if os.path.exists(filename) else {}
+        questions = data.get("questions", [])
+
+        segment = self._log_path(category) + COMPACTING_SUFFIX
+        if os.path.exists(segment):
+            apply_events(questions, read_events(segment))
+
+        counts = question_counts(questions)
+        jsonio.dump({
+            "category": category,
+            "updated_at": datetime.now().isoformat(),
+            "total_questions": counts["count"],
+            "success_count": counts["success"],
+            "with_answer_count": counts["with_answer"],
+            "questions": questions,
+        }, filename)
+
+        if os.path.exists(segment):
+            os.remove(segment)
+        return counts
+
+    def _write_summary(self, updates: Dict[str, Dict[str, int]]) -> Dict:
+        """_summary.json'da sadece değişen kategorilerin satırlarını güncelle"""
+        path = os.path.join(self.output_dir, SUMMARY_FILE)
+        summary = jsonio.load(path) if os.path.exists(path) else {}
+        categories = summary.get("categories", {})
+        for category, counts in updates.items():
+            categories[category] = {**counts, "file": category_filename(category)}
+
+        summary = {
+            "updated_at": datetime.now().isoformat(),
+            "total_questions": sum(c["count"] for c in categories.values()),
+            "total_success": sum(c["success"] for c in categories.values()),
+            "total_with_answer": sum(c["with_answer"] for c in categories.values()),
+            "categories": categories,
+        }
+        jsonio.dump(summary, path)
+        return summary
+
+    def _compact(self, categories: List[str]) -> Dict:
+        updates = {category: self._compact_category(category) for category in categories}
+        return self._write_summary(updates)
+
+    async def compact(self) -> Optional[Dict]:
+        """Birikmiş log'ları JSON dosyalarına sıkıştır (event loop'u bloklamaz)"""
+        async with self._compact_lock:
+            categories = self._rotate()
+            # Önceki bir kesintiden kalan segment'ler de işlenir
+            categories = sorted(set(categories) | set(self._leftover_segments()))
+            if not categories:
+                # Yeni olay yoksa (örn. her şey önceki çalışmadan) diskteki özet geçerli
+                path = os.path.join(self.output_dir, SUMMARY_FILE)
+                if self.summary is None and os.path.exists(path):
+                    self.summary = jsonio.load(path)
+                return self.summary
+            self.summary = await asyncio.to_thread(self._compact, categories)
+            return self.summary
+
+    def schedule_compaction(self):
+        """Çalışan yoksa arka planda sıkıştırma başlat"""
+        if self._compact_task is None or self._compact_task.done():
+            self._compact_task = asyncio.create_task(self.compact())
+
+    def _leftover_segments(self) -> List[str]:
+        """Diskte kalmış .compacting segment'lerinin kategorileri"""
+        leftovers = []
+        for filename in os.listdir(self.log_dir):
+            if filename.endswith(".jsonl" + COMPACTING_SUFFIX):
+                leftovers.append(self._category_of(filename[:-len(COMPACTING_SUFFIX)]))
+        return [c for c in leftovers if c]
+
+    def _category_of(self, log_filename: str) -> Optional[str]:
+        """Log dosya adından kategori adını bul (olaylardaki category alanı)"""
+        for suffix in ("", COMPACTING_SUFFIX):
+            path = os.path.join(self.log_dir, log_filename + suffix)
+            if not os.path.exists(path):
+                continue
+            for event in read_events(path):
+                if event.get("category"):
+                    return event["category"]
+        return None
+
+    async def recover(self) -> Optional[Dict]:
+        """Kesilen bir çalışmadan kalan log'ları JSON dosyalarına uygula"""
+        for filename in os.listdir(self.log_dir):
+            if filename.endswith(".jsonl"):
+                category = self._category_of(filename)
+                if category:
+                    self._dirty.add(category)
+        if not self._dirty and not self._leftover_segments():
+            return None
+        return await self.compact()
+
+    async def close(self) -> Optional[Dict]:
+        """Çalışan sıkıştırmayı bekle, kalan olayları sıkıştır, log dosyalarını kapat"""
+        if self._compact_task is not None:
+            await self._compact_task
+        summary = await self.compact()
+        for f in self._files.values():
+            f.close()
+        self._files.clear()
+        return summary
@@ -0,0 +1,444 @@
+"""
+Birleşik Crawl Motoru
+
+Dört scraper'ın (scraper, yds_scraper, yds_scraper_gpt, yds_category_scraper)
+ortak çekirdeği. Paralellik test ya da kategori başına değil URL başınadır:
+
+- Global URL frontier: kategori sayfası → test → soru sayfaları tek bir
+  öncelik kuyruğunda (önce sorular, sonra testler, sonra kategoriler)
+- Host başına hız sınırı (istek/sn) ve eşzamanlılık sınırı
+- Kalıcı ziyaret/başarısız deposu (append-only JSONL): tamamlanan URL'ler
+  yeniden çalıştırmada çekilmez, kayıtları depodan gelir; sadece eksik ve
+  başarısız URL'ler çekilir
+- Negatif önbellek (TTL'li): sitede olmayan ya da bozuk olduğu bilinen
+  URL'ler süreleri dolana kadar hiç istenmez
+- Takılabilir extractor'lar: her URL türü (kind) için bir `Extractor`
+  çıkarımı yapar ve alt URL'leri üretir
+
+Giriş noktaları motorun ince konfigürasyonlarıdır:
+    crawler = Crawler([TestExtractor(), QuestionExtractor(fetcher)],
+                      store=CrawlStore(state_path("yds_questions", "yds_scraper")))
+    for test in YDS_TESTS:
+        crawler.add("test", test["url"], {"category": test["category"], "count": test["count"]})
+    results = await crawler.run()
+    questions = results["question"]
+"""
+
+import asyncio
+import inspect
+import os
+import re
+from datetime import datetime
+from html import unescape
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urljoin, urlsplit
+
+from scripts import jsonio
+from scripts.scrapers.checkpoint_log import read_events
+from scripts.scrapers.negative_cache import BROKEN, MISSING, NegativeCache
+from scripts.scrapers.question_page import AnswerFetcher, PageMissing, QuestionFetcher
+from scripts.scrapers.sources import QUESTION_URL_RE, question_index, question_url
+
+CRAWL_STATE_DIR = "_crawl"
+DEFAULT_WORKERS = 10
+DEFAULT_HOST_RATE = 20.0       # host başına istek/sn (0 = sınırsız)
+DEFAULT_HOST_CONCURRENCY = 5   # host başına aynı anda açık istek
+
+# Kategori sayfasındaki test linkleri: <a href="...test-sorular...">Ad ( 40 Soru)</a>
+TEST_LINK_RE = re.compile(r'<a\s[^>]*href="([^"]*test-sorular[^"]*)"[^>]*>(.*?)</a>', re.DOTALL | re.IGNORECASE)
+QUESTION_COUNT_RE = re.compile(r'\(\s*(\d+)\s*Soru\s*\)')
+TAG_RE = re.compile(r'<[^>]+>')
+
+
+def state_path(output_dir: str, name: str) -> str:
+    """Bir giriş noktasının crawl durum dosyası: <output_dir>/_crawl/<name>.jsonl"""
+    return os.path.join(output_dir, CRAWL_STATE_DIR, f"{name}.jsonl")
+
+
+def parse_test_links(html: str, page_url: str) -> List[Dict]:
+    """Kategori sayfası HTML'inden test linkleri (ad, tam URL, soru sayısı)"""
+    tests, seen = [], set()
+    for href, inner in TEST_LINK_RE.findall(html):
+        text = unescape(TAG_RE.sub("", inner)).strip()
+        url = urljoin(page_url, href)
+        if url in seen:
+            continue
+        seen.add(url)
+        count_match = QUESTION_COUNT_RE.search(text)
+        tests.append({
+            "name": text,
+            "url": url,
+            "count": int(count_match.group(1)) if count_match else 0,
+        })
+    return tests
+
+
+# ============================================================
+# KALICI DURUM
+# ============================================================
+
+class CrawlStore:
+    """
+    URL başına son durum: {"type": "done", "url", "kind", "record"} ya da
+    {"type": "failed", "url", "kind", "error"}. `path` None ise sadece bellekte tutulur.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self.done: Dict[str, Dict] = {}
+        self.failed: Dict[str, Dict] = {}
+        self._file = None
+        if path and os.path.exists(path):
+            for event in read_events(path):
+                self._apply(event)
+
+    def _apply(self, event: Dict):
+        url = event["url"]
+        if event["type"] == "done":
+            self.done[url] = event["record"]
+            self.failed.pop(url, None)
+        elif event["type"] == "failed":
+            self.failed[url] = event
+            self.done.pop(url, None)
+
+    def _append(self, event: Dict):
+        self._apply(event)
+        if not self.path:
+            return
+        if self._file is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            self._file = open(self.path, "ab")
+        self._file.write(jsonio.dumps(event, compact=True) + b"\n")
+        self._file.flush()
+
+    def mark_done(self, url: str, kind: str, record: Dict):
+        self._append({"type": "done", "url": url, "kind": kind, "record": record})
+
+    def mark_failed(self, url: str, kind: str, error: str):
+        self._append({"type": "failed", "url": url, "kind": kind, "error": error,
+                      "at": datetime.now().isoformat()})
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+# ============================================================
+# HIZ SINIRI
+# ============================================================
+
+class HostLimiter:
+    """Tek host için eşzamanlılık + istekler arası minimum aralık"""
+
+    def __init__(self, rate: float, concurrency: int):
+        self.interval = 1.0 / rate if rate else 0.0
+        self._slots = asyncio.Semaphore(concurrency)
+        self._next = 0.0
+
+    async def __aenter__(self):
+        await self._slots.acquire()
+        if self.interval:
+            now = asyncio.get_running_loop().time()
+            start = max(now, self._next)
+            self._next = start + self.interval
+            if start > now:
+                await asyncio.sleep(start - now)
+
+    async def __aexit__(self, *exc):
+        self._slots.release()
+
+
+# ============================================================
+# EXTRACTOR'LAR
+# ============================================================
+
+class Extractor:
+    """Bir URL türü için çıkarım (`extract`) ve alt URL üretimi (`expand`)"""
+
+    kind = ""
+    priority = 0  # Küçük olan önce işlenir
+
+    def needs_fetch(self, task: Dict) -> bool:
+        """False ise extract ağ isteği yapmaz (hız sınırı uygulanmaz)"""
+        return True
+
+    async def extract(self, task: Dict) -> Dict:
+        raise NotImplementedError
+
+    def is_complete(self, record: Dict) -> bool:
+        """False ise kayıt döndürülür ama URL başarısız sayılır (sonraki çalışmada tekrar denenir)"""
+        return True
+
+    def is_broken(self, record: Dict) -> bool:
+        """True ise eksik kayıt sayfanın kendisinden kaynaklanır (negatif önbelleğe BROKEN yazılır)"""
+        return not self.is_complete(record)
+
+    def expand(self, task: Dict, record: Dict) -> List[Tuple[str, str, Dict]]:
+        """Alt görevler: [(kind, url, meta), ...]"""
+        return []
+
+    def error_record(self, task: Dict, error: str) -> Optional[Dict]:
+        """Hata durumunda sonuçlara eklenecek kayıt (None: eklenmez)"""
+        return None
+
+
+class CategoryExtractor(Extractor):
+    """Kategori sayfası → test linkleri (statik HTTP, gerekirse tarayıcı fallback'i)"""
+
+    kind = "category"
+    priority = 2
+
+    def __init__(self, http, fallback: Optional[Callable] = None):
+        self.http = http
+        self.fallback = fallback  # async (url) -> [{"name", "url", "count"}]
+
+    async def extract(self, task: Dict) -> Dict:
+        url = task["url"]
+        status, html = await self.http.get(url)
+        tests = parse_test_links(html, url) if status == 200 else []
+        if not tests and self.fallback is not None:
+            tests = await self.fallback(url)
+        return {"name": task["meta"].get("category"), "url": url, "tests": tests}
+
+    def is_complete(self, record: Dict) -> bool:
+        return bool(record["tests"])
+
+    def expand(self, task: Dict, record: Dict) -> List[Tuple[str, str, Dict]]:
+        return [
+            ("test", test["url"], {**task["meta"], "test_name": test["name"], "count": test["count"]})
+            for test in record["tests"]
+        ]
+
+
+class TestExtractor(Extractor):
+    """Test → soru URL'leri; soru sayısı biliniyorsa sayfa çekilmez"""
+
+    kind = "test"
+    priority = 1
+
+    def __init__(self, http=None):
+        self.http = http
+
+    def needs_fetch(self, task: Dict) -> bool:
+        return not task["meta"].get("count")
+
+    async def extract(self, task: Dict) -> Dict:
+        count = task["meta"].get("count") or 0
+        if not count and self.http is not None:
+            # Sayı bilinmiyorsa test sayfasındaki aynı önekli soru linklerinden bul
+            status, html = await self.http.get(task["url"])
+            prefix = QUESTION_URL_RE.match(task["url"]).group(1)
+            for href in re.findall(r'href="([^"]+)"', html if status == 200 else ""):
+                url = urljoin(task["url"], href)
+                if url.startswith(prefix + "-"):
+                    count = max(count, question_index(url))
+        return {"count": count}
+
+    def is_complete(self, record: Dict) -> bool:
+        return record["count"] > 0
+
+    def expand(self, task: Dict, record: Dict) -> List[Tuple[str, str, Dict]]:
+        meta = {k: v for k, v in task["meta"].items() if k != "count"}
+        return [
+            ("question", question_url(task["url"], i), {**meta, "index": i, "test_url": task["url"]})
+            for i in range(1, record["count"] + 1)
+        ]
+
+
+class QuestionExtractor(Extractor):
+    """Soru sayfası → soru kaydı (QuestionFetcher; `answers` verilirse cevap aynı sayfanın formundan)"""
+
+    kind = "question"
+    priority = 0
+    META_FIELDS = ("category", "test_name", "test_url")
+
+    def __init__(self, fetcher: QuestionFetcher, answers: Optional[AnswerFetcher] = None):
+        self.fetcher = fetcher
+        self.answers = answers
+
+    def _annotate(self, task: Dict, record: Dict) -> Dict:
+        record["url"] = task["url"]
+        record["index"] = task["meta"].get("index", question_index(task["url"]))
+        for field in self.META_FIELDS:
+            if field in task["meta"]:
+                record[field] = task["meta"][field]
+        return record
+
+    async def extract(self, task: Dict) -> Dict:
+        if self.answers is None:
+            q = await self.fetcher.fetch(task["url"])
+        else:
+            q, html = await self.fetcher.fetch_page(task["url"])
+            # Cevap gönderimi hata verirse soru atılmaz; cevapsız kayıt eksik sayılıp tekrar denenir
+            try:
+                q["correct_answer"] = await self.answers.fetch(task["url"], html)
+            except Exception as e:
+                q["correct_answer"] = None
+                q["answer_error"] = str(e)
+        return self._annotate(task, q)
+
+    def is_complete(self, record: Dict) -> bool:
+        if self.is_broken(record):
+            return False
+        return self.answers is None or bool(record.get("correct_answer"))
+
+    def is_broken(self, record: Dict) -> bool:
+        return not (record.get("question_text") and record.get("options"))
+
+    def error_record(self, task: Dict, error: str) -> Optional[Dict]:
+        record = self._annotate(task, {})
+        record["error"] = error
+        return record
+
+
+# ============================================================
+# MOTOR
+# ============================================================
+
+class Crawler:
+    """URL frontier + worker'lar; `run()` türe göre kayıt listeleri döndürür"""
+
+    def __init__(self, extractors: Iterable[Extractor], store: Optional[CrawlStore] = None,
+                 workers: int = DEFAULT_WORKERS, host_rate: float = DEFAULT_HOST_RATE,
+                 host_concurrency: int = DEFAULT_HOST_CONCURRENCY,
+                 on_record: Optional[Callable[[str, Dict], None]] = None,
+                 label: str = "Crawl", negative: Optional[NegativeCache] = None,
+                 emit_cached: bool = False):
+        self.extractors = {e.kind: e for e in extractors}
+        self.store = store if store is not None else CrawlStore()
+        self.negative = negative
+        self.workers = workers
+        self.host_rate = host_rate
+        self.host_concurrency = host_concurrency
+        # Yeni çekilen her kayıt için (kind, record); emit_cached ise depodan gelenler için de.
+        # Coroutine döndürürse beklenir: tüketici yavaşsa worker'lar da yavaşlar (backpressure)
+        self.on_record = on_record
+        self.emit_cached = emit_cached
+        self.label = label
+
+        self._queue: asyncio.PriorityQueue = asyncio.PriorityQueue()
+        self._seen = set()
+        self._limiters: Dict[str, HostLimiter] = {}
+        self._records: Dict[str, List[Tuple[tuple, Dict]]] = {kind: [] for kind in self.extractors}
+        self.stats = {"queued": 0, "processed": 0, "fetched": 0, "cached": 0, "failed": 0, "skipped": 0}
+
+    def add(self, kind: str, url: str, meta: Optional[Dict] = None, order: tuple = None):
+        """Frontier'a URL ekle (aynı URL bir kez işlenir)"""
+        if url in self._seen:
+            return
+        self._seen.add(url)
+        if order is None:
+            order = (self.stats["queued"],)
+        task = {"kind": kind, "url": url, "meta": meta or {}, "order": order}
+        self.stats["queued"] += 1
+        self._queue.put_nowait((self.extractors[kind].priority, order, task))
+
+    def _limiter(self, url: str) -> HostLimiter:
+        host = urlsplit(url).netloc
+        limiter = self._limiters.get(host)
+        if limiter is None:
+            limiter = self._limiters[host] = HostLimiter(self.host_rate, self.host_concurrency)
+        return limiter
+
+    async def _emit(self, task: Dict, record: Dict, fresh: bool):
+        self._records[task["kind"]].append((task["order"], record))
+        if self.on_record is not None and (fresh or self.emit_cached):
+            result = self.on_record(task["kind"], record)
+            if inspect.isawaitable(result):
+                await result
+
+    async def _extract(self, extractor: Extractor, task: Dict) -> Dict:
+        if not extractor.needs_fetch(task):
+            return await extractor.extract(task)
+        async with self._limiter(task["url"]):
+            return await extractor.extract(task)
+
+    async def _process(self, task: Dict):
+        extractor = self.extractors[task["kind"]]
+        url = task["url"]
+
+        record = self.store.done.get(url)
+        negative = self.negative.get(url) if self.negative is not None and record is None else None
+        if record is not None:
+            self.stats["cached"] += 1
+            await self._emit(task, record, fresh=False)
+        elif negative is not None:
+            # Sitede olmadığı/bozuk olduğu biliniyor: istek atmadan hata kaydı
+            self.stats["skipped"] += 1
+            error_record = extractor.error_record(task, f"{negative['status']}: {negative.get('reason', '')}")
+            if error_record is not None:
+                await self._emit(task, error_record, fresh=True)
+            return
+        else:
+            try:
+                record = await self._extract(extractor, task)
+            except Exception as e:
+                self.store.mark_failed(url, task["kind"], str(e))
+                self.stats["failed"] += 1
+                if isinstance(e, PageMissing) and self.negative is not None:
+                    self.negative.mark(url, MISSING, str(e))
+                error_record = extractor.error_record(task, str(e))
+                if error_record is not None:
+                    await self._emit(task, error_record, fresh=True)
+                return
+
+            self.stats["fetched"] += 1
+            if extractor.is_complete(record):
+                self.store.mark_done(url, task["kind"], record)
+                if self.negative is not None:
+                    self.negative.clear(url)
+            else:
+                self.store.mark_failed(url, task["kind"], "eksik içerik")
+                self.stats["failed"] += 1
+                if self.negative is not None and extractor.is_broken(record):
+                    self.negative.mark(url, BROKEN, "eksik içerik")
+            await self._emit(task, record, fresh=True)
+
+        for i, (kind, child_url, meta) in enumerate(extractor.expand(task, record)):
+            self.add(kind, child_url, meta, order=task["order"] + (i,))
+
+    async def _worker(self):
+        while True:
+            _, _, task = await self._queue.get()
+            try:
+                await self._process(task)
+            except Exception as e:
+                print(f"\n⚠️  {task['url']}: {e}")
+            finally:
+                self.stats["processed"] += 1
+                self._queue.task_done()
+
+    async def _report(self, every: float):
+        start = datetime.now()
+        while True:
+            await asyncio.sleep(every)
+            s = self.stats
+            elapsed = (datetime.now() - start).total_seconds()
+            rate = s["fetched"] / elapsed if elapsed > 0 else 0
+            print(f"\r[{self.label}] {s['processed']}/{s['queued']} URL - {s['fetched']} çekildi, "
+                  f"{s['cached']} depodan, {s['skipped']} atlandı, {s['failed']} başarısız - {rate:.1f} URL/sn",
+                  end="", flush=True)
+
+    async def run(self, report_every: float = 2.0) -> Dict[str, List[Dict]]:
+        """Frontier boşalana kadar çalış; {kind: [kayıt, ...]} (keşif sırasıyla)"""
+        workers = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+        reporter = asyncio.create_task(self._report(report_every)) if report_every else None
+        try:
+            await self._queue.join()
+        finally:
+            for task in workers:
+                task.cancel()
+            if reporter is not None:
+                reporter.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            self.store.close()
+            if self.negative is not None:
+                self.negative.close()
+        if reporter is not None:
+            print()
+
+        return {
+            kind: [record for _, record in sorted(items, key=lambda item: item[0])]
+            for kind, items in self._records.items()
+        }
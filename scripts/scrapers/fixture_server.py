@@ -0,0 +1,356 @@
+"""
+Scraper Fixture Sunucusu (Yerel sorukurdu Aynası)
+
+yds_questions/*.json korpusundaki soruları sitenin soru sayfası işaretlemesiyle
+(`#commentForm fieldset`, `.custom-radio`) yeniden üretip yerel bir HTTP
+sunucusundan sunar. Scraper'ların fetch/ayrıştırma yolları ve benchmark'lar
+gerçek siteye gitmeden bu sunucuya karşı çalıştırılır.
+
+- Soru sayfaları orijinal URL yollarında sunulur (`/test-sorular/...-<n>.html`)
+- Sayfalar gerçek site gibi CSS/JS/görsel/reklam kaynaklarına referans verir
+- Bilinmeyen yollar sitedeki gibi 200 + "Hatalı Sayfa" döner
+- Korpustaki her kategori için kategori sayfası (`/sorular-kategori/...`,
+  test linkleri "Ad ( N Soru)" biçiminde) ve her test için test sayfası
+  (`...-0.html`, soru linkleri) üretilir
+- Soru formu sitedeki gibi hidden alanlar taşır ve sayfa oturum çerezi verir;
+  geçerli bir gönderim (radio seçili, hidden token doğru, çerez var) cevaplanmış
+  sayfayı döner: doğru şıkkın input'undan önce dogru.png, yanlış seçilen
+  şıktan önce yanlis.png. Geçersiz gönderim soruyu işaretsiz tekrar gösterir
+- `latency` / `asset_latency` ile ağ gecikmesi simüle edilir
+
+Kullanım:
+    python -m scripts.scrapers.fixture_server --port 8765
+
+    with FixtureServer() as server:
+        url = server.rebase("https://www.sorukurdu.com/test-sorular/YDS-MODALS---TEST-1407-1.html")
+"""
+
+import argparse
+import glob
+import hashlib
+import os
+import re
+import threading
+import time
+from html import escape
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Iterable, List, Optional
+from urllib.parse import parse_qs, urlsplit
+
+from scripts import jsonio
+from scripts.scrapers.sources import YDS_CATEGORIES, question_index
+
+CORPUS_DIRS = ["yds_questions"]
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html lang="tr">
+<head>
+<meta charset="utf-8">
+<title>{title} - Soru Kurdu</title>
+<link rel="stylesheet" href="/static/css/bootstrap.min.css">
+<link rel="stylesheet" href="/static/css/site.css">
+<link rel="stylesheet" href="/static/fonts/opensans.css">
+<script src="/static/js/jquery.min.js"></script>
+<script src="/static/js/site.js"></script>
+</head>
+<body>
+<div class="header"><img src="/static/img/logo.png" alt="Soru Kurdu"></div>
+<div class="container">
+<iframe class="ads" src="/static/ads/banner.html" width="728" height="90"></iframe>
+{content}
+<img src="/static/img/footer.png" alt="">
+</div>
+</body>
+</html>
+"""
+
+QUESTION_TEMPLATE = """<form id="commentForm" method="post" action="{action}">
+<input type="hidden" name="soru_id" value="{token}">
+<input type="hidden" name="islem" value="cevapla">
+<fieldset>
+<div style="font-weight: bold; ">{number}</div><div style="width: 590px;">{text}</div>
+{options}
+<input type="submit" id="submit" name="gonder" class="btn btn-primary" value="Cevapla">
+</fieldset>
+</form>"""
+
+OPTION_TEMPLATE = (
+    '<div class="custom-control custom-radio">{marker}'
+    '<input type="radio" id="radio-{n}" name="{field}" value="{letter}" class="custom-control-input">'
+    '<label class="custom-control-label" for="radio-{n}">{text}</label>'
+    '</div>'
+)
+
+ANSWER_FIELD = "secenek"
+SESSION_COOKIE = "PHPSESSID"
+
+LINK_TEMPLATE = '<li><a href="{href}">{text}</a></li>'
+
+CORRECT_MARKER = '<img src="/static/img/dogru.png" alt="">'
+WRONG_MARKER = '<img src="/static/img/yanlis.png" alt="">'
+
+ERROR_PAGE = PAGE_TEMPLATE.format(title="Hatalı Sayfa", content="<h1>Hatalı Sayfa</h1>")
+
+ASSET_TYPES = {
+    ".css": "text/css",
+    ".js": "application/javascript",
+    ".png": "image/png",
+    ".html": "text/html; charset=utf-8",
+}
+
+
+# Korpustaki metinler innerHTML'den geldiği için zaten escape edilmiş halde
+# (örn. "AT &amp; T"); tekrar escape edilmeden yazılır.
+def _html_text(text: str) -> str:
+    return (text or "").replace("\n", "<br>")
+
+
+def _html_label(text: str) -> str:
+    # Şık etiketlerinde scraper <br>'yi atıp satır sonunu korur
+    return (text or "").replace("\n", "<br>\n")
+
+
+def _option_marker(letter: str, correct: Optional[str], chosen: Optional[str]) -> str:
+    if chosen is None or not correct:
+        return ""
+    if letter == correct:
+        return CORRECT_MARKER
+    return WRONG_MARKER if letter == chosen else ""
+
+
+def form_token(path: str) -> str:
+    """Soru formunun hidden `soru_id` değeri (sayfa yolundan türetilir)"""
+    return hashlib.sha1(path.encode("utf-8")).hexdigest()[:12]
+
+
+def render_question_page(q: Dict, chosen: Optional[str] = None) -> str:
+    """Soru sayfası; `chosen` verilirse form gönderilmiş (cevaplanmış) hali"""
+    correct = q.get("correct_answer")
+    path = urlsplit(q.get("url") or "").path
+    options = "\n".join(
+        OPTION_TEMPLATE.format(n=n, field=ANSWER_FIELD, letter=escape(o.get("letter") or ""),
+                               text=_html_label(o.get("text")),
+                               marker=_option_marker(o.get("letter"), correct, chosen))
+        for n, o in enumerate(q.get("options") or [], start=1)
+    )
+    content = QUESTION_TEMPLATE.format(
+        action=escape(path),
+        token=form_token(path),
+        number=_html_text(q.get("question_number")),
+        text=_html_text(q.get("question_text")),
+        options=options,
+    )
+    return PAGE_TEMPLATE.format(title=escape(q.get("category") or "Soru"), content=content)
+
+
+def render_index_page(title: str, links: List[Dict]) -> str:
+    items = "\n".join(LINK_TEMPLATE.format(href=escape(link["href"]), text=escape(link["text"])) for link in links)
+    return PAGE_TEMPLATE.format(title=escape(title), content=f"<h1>{escape(title)}</h1>\n<ul class=\"tests\">\n{items}\n</ul>")
+
+
+def category_path(name: str) -> str:
+    """Kategori sayfası yolu: sitedeki URL biliniyorsa o, değilse addan türetilir"""
+    for category in YDS_CATEGORIES:
+        if category["name"] == name:
+            return urlsplit(category["url"]).path
+    slug = re.sub(r"[^A-Za-z0-9]+", "-", name).strip("-")
+    return f"/sorular-kategori/YDS-{slug}.html"
+
+
+def build_indexes(pages: Dict[str, Dict]) -> Dict[str, Dict]:
+    """Soru sayfalarından kategori ve test sayfalarını üret: {yol: {"title", "links"}}"""
+    tests: Dict[str, Dict] = {}
+    for path, q in sorted(pages.items(), key=lambda item: (item[0].rsplit("-", 1)[0], question_index(item[0]))):
+        test_path = urlsplit(q.get("test_url") or "").path
+        if not test_path:
+            continue
+        test = tests.setdefault(test_path, {
+            "category": q.get("category") or "",
+            # Kategori scraper'ının test_name'i link metninin kendisi ("Ad ( N Soru)")
+            "name": q.get("test_name"),
+            "questions": [],
+        })
+        test["questions"].append(path)
+
+    indexes: Dict[str, Dict] = {}
+    categories: Dict[str, List[Dict]] = {}
+    for test_path, test in tests.items():
+        name = test["name"]
+        if not name:
+            count = max(question_index(p) for p in test["questions"])
+            name = os.path.basename(test_path).rsplit("-", 1)[0].replace("-", " ").strip()
+            name = f"{name} ( {count} Soru)"
+        indexes[test_path] = {
+            "title": name,
+            "links": [{"href": p, "text": f"{question_index(p)}. Soru"} for p in test["questions"]],
+        }
+        categories.setdefault(test["category"], []).append({"href": test_path, "text": name})
+    for name, links in categories.items():
+        indexes[category_path(name)] = {"title": name, "links": links, "category": name}
+    return indexes
+
+
+def load_site(corpus_dirs: Iterable[str] = CORPUS_DIRS) -> Dict[str, Dict]:
+    """Korpustaki soruları {url yolu: soru} olarak yükle"""
+    pages = {}
+    for directory in corpus_dirs:
+        for filepath in sorted(glob.glob(os.path.join(directory, "*.json"))):
+            if os.path.basename(filepath).startswith("_"):
+                continue
+            data = jsonio.load(filepath)
+            if not isinstance(data, dict):
+                continue
+            for q in data.get("questions", []):
+                if q.get("url") and q.get("question_text") and q.get("options"):
+                    pages[urlsplit(q["url"]).path] = q
+    return pages
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+    disable_nagle_algorithm = True  # Başlık + gövde ayrı yazılıyor; delayed ACK beklemesin
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status: int, body: bytes, content_type: str, cookie: Optional[str] = None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        if cookie:
+            self.send_header("Set-Cookie", cookie)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        server = self.server
+        path = urlsplit(self.path).path
+
+        if path.startswith("/static/"):
+            server.count("asset")
+            if server.asset_latency:
+                time.sleep(server.asset_latency)
+            ext = os.path.splitext(path)[1]
+            self._send(200, b"/* fixture */\n" * 64, ASSET_TYPES.get(ext, "application/octet-stream"))
+            return
+
+        server.count("document")
+        if server.latency:
+            time.sleep(server.latency)
+        q = server.pages.get(path)
+        index = server.indexes.get(path)
+        cookie = None
+        if q:
+            body = render_question_page(q)
+            if SESSION_COOKIE not in (self.headers.get("Cookie") or ""):
+                cookie = f"{SESSION_COOKIE}={os.urandom(8).hex()}; path=/"
+        elif index:
+            body = render_index_page(index["title"], index["links"])
+        else:
+            body = ERROR_PAGE
+        self._send(200, body.encode("utf-8"), "text/html; charset=utf-8", cookie)
+
+    def do_POST(self):
+        server = self.server
+        path = urlsplit(self.path).path
+        length = int(self.headers.get("Content-Length") or 0)
+        fields = parse_qs(self.rfile.read(length).decode("ascii", errors="replace"))
+
+        server.count("form")
+        if server.latency:
+            time.sleep(server.latency)
+        q = server.pages.get(path)
+        chosen = (fields.get(ANSWER_FIELD) or [""])[0]
+        valid = (chosen and (fields.get("soru_id") or [""])[0] == form_token(path)
+                 and SESSION_COOKIE in (self.headers.get("Cookie") or ""))
+        if not q:
+            body = ERROR_PAGE
+        else:
+            # Geçersiz gönderimde site soruyu işaretsiz tekrar gösterir
+            body = render_question_page(q, chosen=chosen if valid else None)
+        self._send(200, body.encode("utf-8"), "text/html; charset=utf-8")
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, pages: Dict[str, Dict], latency: float, asset_latency: float):
+        super().__init__(address, _Handler)
+        self.pages = pages
+        self.indexes = build_indexes(pages)
+        self.latency = latency
+        self.asset_latency = asset_latency
+        self.hits = {"document": 0, "asset": 0, "form": 0}
+        self._hits_lock = threading.Lock()
+
+    def count(self, kind: str):
+        with self._hits_lock:
+            self.hits[kind] += 1
+
+
+class FixtureServer:
+    """Arka plan thread'inde çalışan fixture sunucusu (context manager)"""
+
+    def __init__(self, port: int = 0, corpus_dirs: Iterable[str] = CORPUS_DIRS,
+                 latency: float = 0.0, asset_latency: float = 0.0,
+                 pages: Optional[Dict[str, Dict]] = None):
+        self.pages = pages if pages is not None else load_site(corpus_dirs)
+        self.server = _Server(("127.0.0.1", port), self.pages, latency, asset_latency)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def hits(self) -> Dict[str, int]:
+        return self.server.hits
+
+    def rebase(self, url: str) -> str:
+        """Site URL'sini fixture sunucusuna yönlendir"""
+        parts = urlsplit(url)
+        return self.base_url + parts.path + (f"?{parts.query}" if parts.query else "")
+
+    def question_urls(self, limit: Optional[int] = None) -> List[str]:
+        paths = sorted(self.pages)
+        if limit:
+            paths = paths[:limit]
+        return [self.base_url + p for p in paths]
+
+    def category_urls(self) -> Dict[str, str]:
+        """{kategori adı: kategori sayfası URL'si}"""
+        return {
+            index["category"]: self.base_url + path
+            for path, index in self.server.indexes.items() if "category" in index
+        }
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Scraper'lar için yerel fixture sunucusu")
+    parser.add_argument("--port", type=int, default=8765, help="Port")
+    parser.add_argument("--latency", type=float, default=0.0, help="Sayfa başına gecikme (sn)")
+    parser.add_argument("--asset-latency", type=float, default=0.0, help="Kaynak (CSS/JS/görsel) gecikmesi (sn)")
+
+    args = parser.parse_args()
+
+    server = FixtureServer(port=args.port, latency=args.latency, asset_latency=args.asset_latency)
+    print(f"🧪 {len(server.pages)} soru sayfası: {server.base_url}/test-sorular/...")
+    try:
+        server.server.serve_forever()
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,223 @@
+"""
+Ham HTML Arşivi (İçerik Adresli, Sıkıştırılmış) + Çevrimdışı Yeniden Ayrıştırma
+
+Crawler'ın çektiği her sayfanın ham HTML'i arşive yazılır; bir selector ya da
+regex hatası sonradan fark edildiğinde binlerce sayfayı yeniden kazımak yerine
+extractor arşiv üzerinde yeniden çalıştırılır.
+
+Düzen:
+    <arşiv>/objects/<sha256[:2]>/<sha256>.html.gz   → gzip'li HTML (aynı içerik bir kez)
+    <arşiv>/index.jsonl                              → {"url", "sha", "at"} (URL başına son kayıt geçerli)
+
+`reparse` extractor'ı (varsayılan `parse_question_html`) süreç havuzunda
+çalıştırır; regex/HTML işi event loop'tan ve tek çekirdekten çıkar.
+
+Kullanım:
+    python -m scripts.scrapers.html_archive stats
+    python -m scripts.scrapers.html_archive reparse --workers 8
+    python -m scripts.scrapers.html_archive reparse --apply          # yds_questions/*.json güncelle
+    python -m scripts.scrapers.html_archive reparse --extractor paket.modul:fonksiyon
+"""
+
+import argparse
+import glob
+import gzip
+import hashlib
+import importlib
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from scripts import jsonio
+from scripts.scrapers.checkpoint_log import read_events
+
+OUTPUT_DIR = "yds_questions"
+ARCHIVE_SUBDIR = "_html"
+ARCHIVE_DIR = os.path.join(OUTPUT_DIR, ARCHIVE_SUBDIR)
+INDEX_FILE = "index.jsonl"
+OBJECTS_DIR = "objects"
+DEFAULT_EXTRACTOR = "scripts.scrapers.question_page:parse_question_html"
+COMPRESS_LEVEL = 6
+
+# Yeniden ayrıştırmada güncellenen alanlar (cevap ve zenginleştirme alanları korunur)
+REPARSED_FIELDS = ("question_number", "question_text", "options")
+
+
+def archive_path(output_dir: str) -> str:
+    """Bir çıktı klasörünün HTML arşivi: <output_dir>/_html"""
+    return os.path.join(output_dir, ARCHIVE_SUBDIR)
+
+
+def content_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+class HtmlArchive:
+    """URL → içerik adresli gzip'li HTML nesneleri"""
+
+    def __init__(self, root: str = ARCHIVE_DIR):
+        self.root = root
+        self.index_path = os.path.join(root, INDEX_FILE)
+        self._index: Optional[Dict[str, str]] = None
+        self._index_file = None
+        self.stats = {"written": 0, "deduplicated": 0}
+
+    def object_path(self, sha: str) -> str:
+        return os.path.join(self.root, OBJECTS_DIR, sha[:2], f"{sha}.html.gz")
+
+    @property
+    def index(self) -> Dict[str, str]:
+        """{url: sha} (index.jsonl'daki son kayıtlar)"""
+        if self._index is None:
+            self._index = {}
+            if os.path.exists(self.index_path):
+                for entry in read_events(self.index_path):
+                    self._index[entry["url"]] = entry["sha"]
+        return self._index
+
+    def put(self, url: str, html: str) -> str:
+        """HTML'i arşive yaz; aynı içerik zaten varsa nesne tekrar yazılmaz"""
+        data = html.encode("utf-8")
+        sha = content_hash(data)
+        path = self.object_path(sha)
+        if os.path.exists(path):
+            self.stats["deduplicated"] += 1
+        else:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(gzip.compress(data, COMPRESS_LEVEL, mtime=0))
+            os.replace(tmp_path, path)
+            self.stats["written"] += 1
+
+        if self.index.get(url) != sha:
+            self.index[url] = sha
+            if self._index_file is None:
+                os.makedirs(self.root, exist_ok=True)
+                self._index_file = open(self.index_path, "ab")
+            entry = {"url": url, "sha": sha, "at": datetime.now().isoformat()}
+            self._index_file.write(jsonio.dumps(entry, compact=True) + b"\n")
+            self._index_file.flush()
+        return sha
+
+    def read_object(self, sha: str) -> str:
+        with open(self.object_path(sha), "rb") as f:
+            return gzip.decompress(f.read()).decode("utf-8")
+
+    def get(self, url: str) -> Optional[str]:
+        sha = self.index.get(url)
+        return self.read_object(sha) if sha else None
+
+    def __iter__(self) -> Iterator[Tuple[str, str]]:
+        """(url, sha) çiftleri"""
+        return iter(self.index.items())
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def close(self):
+        if self._index_file is not None:
+            self._index_file.close()
+            self._index_file = None
+
+
+# ============================================================
+# REPARSE (SÜREÇ HAVUZU)
+# ============================================================
+
+def load_extractor(spec: str) -> Callable[[str], Optional[Dict]]:
+    """"paket.modul:fonksiyon" → fonksiyon"""
+    module_name, _, func_name = spec.partition(":")
+    return getattr(importlib.import_module(module_name), func_name)
+
+
+def _reparse_chunk(args: Tuple[str, str, List[Tuple[str, str]]]) -> List[Tuple[str, Optional[Dict]]]:
+    """Süreç havuzu işçisi: bir URL grubunu arşivden okuyup extractor'dan geçir"""
+    root, extractor_spec, items = args
+    archive = HtmlArchive(root)
+    extract = load_extractor(extractor_spec)
+    results = []
+    for url, sha in items:
+        try:
+            results.append((url, extract(archive.read_object(sha))))
+        except Exception as e:
+            results.append((url, {"error": str(e)}))
+    return results
+
+
+def reparse(root: str = ARCHIVE_DIR, extractor: str = DEFAULT_EXTRACTOR,
+            workers: Optional[int] = None, chunk_size: int = 200) -> Dict[str, Optional[Dict]]:
+    """Arşivdeki tüm sayfaları süreç havuzunda yeniden ayrıştır: {url: kayıt}"""
+    items = sorted(HtmlArchive(root))
+    chunks = [(root, extractor, items[i:i + chunk_size]) for i in range(0, len(items), chunk_size)]
+    results = {}
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for chunk in executor.map(_reparse_chunk, chunks):
+            results.update(chunk)
+    return results
+
+
+def apply_reparsed(results: Dict[str, Optional[Dict]], output_dir: str = OUTPUT_DIR) -> Dict[str, int]:
+    """Yeniden ayrıştırılan alanları kategori JSON dosyalarına yaz (sadece değişen dosyalar)"""
+    stats = {"files": 0, "questions": 0}
+    for filepath in sorted(glob.glob(os.path.join(output_dir, "*.json"))):
+        if os.path.basename(filepath).startswith("_"):
+            continue
+        data = jsonio.load(filepath)
+        if not isinstance(data, dict):
+            continue
+
+        changed = 0
+        for q in data.get("questions", []):
+            record = results.get(q.get("url"))
+            if not record or record.get("error"):
+                continue
+            updates = {field: record[field] for field in REPARSED_FIELDS
+                       if field in record and q.get(field) != record[field]}
+            if updates:
+                q.update(updates)
+                changed += 1
+
+        if changed:
+            data["updated_at"] = datetime.now().isoformat()
+            jsonio.dump(data, filepath)
+            stats["files"] += 1
+            stats["questions"] += changed
+            print(f"  ✓ {os.path.basename(filepath)}: {changed} soru güncellendi")
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Ham HTML arşivi ve çevrimdışı yeniden ayrıştırma")
+    parser.add_argument("command", choices=["stats", "reparse"], help="Komut")
+    parser.add_argument("--archive", default=ARCHIVE_DIR, help="Arşiv klasörü")
+    parser.add_argument("--extractor", default=DEFAULT_EXTRACTOR, help="paket.modul:fonksiyon (HTML → kayıt)")
+    parser.add_argument("--workers", type=int, default=None, help="Süreç sayısı (varsayılan: CPU sayısı)")
+    parser.add_argument("--apply", action="store_true", help="Sonuçları kategori JSON dosyalarına yaz")
+    parser.add_argument("--output-dir", default=OUTPUT_DIR, help="Kategori JSON klasörü (--apply için)")
+
+    args = parser.parse_args()
+    archive = HtmlArchive(args.archive)
+
+    if args.command == "stats":
+        shas = set(sha for _, sha in archive)
+        size = sum(os.path.getsize(archive.object_path(sha)) for sha in shas)
+        print(f"📦 {len(archive)} URL, {len(shas)} benzersiz sayfa, {size / 1024 / 1024:.1f} MB (gzip)")
+        return
+
+    print(f"🔁 {len(archive)} sayfa yeniden ayrıştırılıyor ({args.extractor})")
+    start = time.perf_counter()
+    results = reparse(args.archive, args.extractor, args.workers)
+    elapsed = time.perf_counter() - start
+    parsed = sum(1 for r in results.values() if r and not r.get("error"))
+    print(f"✓ {parsed}/{len(results)} sayfa ayrıştırıldı ({elapsed:.2f}sn, {len(results) / elapsed:.0f} sayfa/sn)")
+
+    if args.apply:
+        stats = apply_reparsed(results, args.output_dir)
+        print(f"💾 {stats['questions']} soru, {stats['files']} dosya güncellendi")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+"""
+Keep-Alive HTTP İstemcisi (Scraper'lar için)
+
+Soru sayfalarının işaretlemesi statik HTML'de mevcut; her sayfa için tam bir
+Chromium açmak yerine sayfalar düz HTTP ile çekilir. Host başına bir bağlantı
+havuzu tutulur (HTTP/1.1 keep-alive), istekler thread havuzunda çalışır ve
+event loop bloklanmaz. Sunucunun `Set-Cookie` ile verdiği çerezler host başına
+saklanıp sonraki isteklerde gönderilir (tarayıcı oturumu gibi; soru formu
+gönderimi sayfayı açan oturumla yapılır). Sadece stdlib (http.client) kullanır.
+
+Kullanım:
+    async with HttpClient(max_connections=10) as http:
+        status, html = await http.get("https://www.sorukurdu.com/test-sorular/...-1.html")
+        status, html = await http.post_form(form_action, fields, referer=url)
+"""
+
+import asyncio
+import gzip
+import http.client
+import queue
+import re
+import threading
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlencode, urlsplit
+
+DEFAULT_TIMEOUT = 30
+DEFAULT_MAX_CONNECTIONS = 10
+USER_AGENT = (
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/120.0 Safari/537.36"
+)
+
+# Sunucu keep-alive bağlantısını kapatmışsa istek yeni bağlantıyla bir kez tekrarlanır
+_STALE_ERRORS = (http.client.RemoteDisconnected, http.client.BadStatusLine,
+                 ConnectionResetError, BrokenPipeError)
+
+
+def _decode_body(body: bytes, headers) -> str:
+    encoding = (headers.get("Content-Encoding") or "").lower()
+    if encoding == "gzip":
+        body = gzip.decompress(body)
+    elif encoding == "deflate":
+        body = zlib.decompress(body)
+
+    charset = "utf-8"
+    match = re.search(r"charset=([\w-]+)", headers.get("Content-Type") or "", re.I)
+    if match:
+        charset = match.group(1)
+    return body.decode(charset, errors="replace")
+
+
+class _HostPool:
+    """Tek bir host için boşta bekleyen keep-alive bağlantıları"""
+
+    def __init__(self, scheme: str, netloc: str, timeout: float):
+        self.scheme = scheme
+        self.netloc = netloc
+        self.timeout = timeout
+        self.idle = queue.LifoQueue()
+
+    def acquire(self) -> http.client.HTTPConnection:
+        try:
+            return self.idle.get_nowait()
+        except queue.Empty:
+            cls = http.client.HTTPSConnection if self.scheme == "https" else http.client.HTTPConnection
+            return cls(self.netloc, timeout=self.timeout)
+
+    def release(self, conn: http.client.HTTPConnection):
+        self.idle.put(conn)
+
+    def close(self):
+        while True:
+            try:
+                self.idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+
+class HttpClient:
+    """Host başına bağlantı havuzlu, asenkron arayüzlü HTTP istemcisi"""
+
+    def __init__(self, max_connections: int = DEFAULT_MAX_CONNECTIONS,
+                 timeout: float = DEFAULT_TIMEOUT, headers: Optional[Dict[str, str]] = None):
+        self.timeout = timeout
+        self.headers = {
+            "User-Agent": USER_AGENT,
+            "Accept": "text/html,application/xhtml+xml",
+            "Accept-Encoding": "gzip, deflate",
+            "Connection": "keep-alive",
+            **(headers or {}),
+        }
+        self._pools: Dict[Tuple[str, str], _HostPool] = {}
+        self.cookies: Dict[str, Dict[str, str]] = {}  # host → {ad: değer}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_connections, thread_name_prefix="http")
+        self.stats = {"requests": 0, "connections": 0}
+
+    def _pool(self, scheme: str, netloc: str) -> _HostPool:
+        with self._lock:
+            pool = self._pools.get((scheme, netloc))
+            if pool is None:
+                pool = self._pools[(scheme, netloc)] = _HostPool(scheme, netloc, self.timeout)
+            return pool
+
+    def _cookie_header(self, netloc: str) -> Optional[str]:
+        with self._lock:
+            jar = self.cookies.get(netloc)
+            return "; ".join(f"{name}={value}" for name, value in jar.items()) if jar else None
+
+    def _store_cookies(self, netloc: str, set_cookies):
+        """Set-Cookie başlıklarından ad=değer çiftlerini sakla (path/süre yok sayılır)"""
+        with self._lock:
+            jar = self.cookies.setdefault(netloc, {})
+            for header in set_cookies:
+                name, sep, value = header.split(";", 1)[0].partition("=")
+                if sep and name.strip():
+                    jar[name.strip()] = value.strip()
+
+    def request_sync(self, method: str, url: str, body: Optional[bytes] = None,
+                     headers: Optional[Dict[str, str]] = None) -> Tuple[int, str, Dict[str, str]]:
+        """Senkron istek (thread havuzunda çalışır): (status, metin, başlıklar)"""
+        parts = urlsplit(url)
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+        pool = self._pool(parts.scheme, parts.netloc)
+        request_headers = {**self.headers, **(headers or {})}
+        cookie = self._cookie_header(parts.netloc)
+        if cookie and "Cookie" not in request_headers:
+            request_headers["Cookie"] = cookie
+
+        for attempt in range(2):
+            conn = pool.acquire()
+            fresh = conn.sock is None
+            try:
+                conn.request(method, path, body=body, headers=request_headers)
+                response = conn.getresponse()
+                data = response.read()
+            except _STALE_ERRORS:
+                conn.close()
+                if fresh or attempt:
+                    raise
+                continue
+            except Exception:
+                conn.close()
+                raise
+
+            set_cookies = response.headers.get_all("Set-Cookie")
+            if set_cookies:
+                self._store_cookies(parts.netloc, set_cookies)
+            with self._lock:
+                self.stats["requests"] += 1
+                self.stats["connections"] += fresh
+            if response.will_close:
+                conn.close()
+            else:
+                pool.release(conn)
+            return response.status, _decode_body(data, response.headers), dict(response.headers)
+
+    async def request(self, method: str, url: str, body: Optional[bytes] = None,
+                      headers: Optional[Dict[str, str]] = None) -> Tuple[int, str, Dict[str, str]]:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self.request_sync, method, url, body, headers)
+
+    async def get(self, url: str) -> Tuple[int, str]:
+        status, text, _ = await self.request("GET", url)
+        return status, text
+
+    async def post_form(self, url: str, fields: Dict[str, str],
+                        referer: Optional[str] = None) -> Tuple[int, str]:
+        """application/x-www-form-urlencoded form gönderimi (tarayıcı submit'inin karşılığı)"""
+        headers = {"Content-Type": "application/x-www-form-urlencoded", "Referer": referer or url}
+        status, text, _ = await self.request("POST", url, urlencode(fields).encode("ascii"), headers)
+        return status, text
+
+    def close(self):
+        self._executor.shutdown(wait=True)
+        for pool in self._pools.values():
+            pool.close()
+        self._pools.clear()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await asyncio.to_thread(self.close)
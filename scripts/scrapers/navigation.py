@@ -0,0 +1,67 @@
+"""
+Playwright Navigasyon Yardımcıları (Koşullu Bekleme)
+
+Navigasyondan sonra sabit `asyncio.sleep` (0.3 / 0.5 / 1 sn) ve `networkidle`
+beklemek yerine sayfanın hazır olduğu koşul beklenir: soru sayfasında
+`#commentForm fieldset` içindeki şıklar, cevap gönderiminden sonra da
+dogru.png işareti. Bekleme süreleri sınırlıdır; koşul gerçekleşmezse
+(örn. "Hatalı Sayfa") çağıran taraf False alır ve mevcut DOM'la devam eder.
+
+Kullanım:
+    if await goto_question(page, url):
+        q = await extract_question(page)
+"""
+
+from typing import Optional
+
+NAVIGATION_TIMEOUT = 30000  # ms
+READY_TIMEOUT = 5000        # ms
+
+QUESTION_READY_SELECTOR = "#commentForm fieldset .custom-radio input[type='radio']"
+ANSWER_READY_SELECTOR = "#commentForm fieldset img[src*='dogru']"
+SUBMIT_SELECTOR = "input#submit"
+
+
+async def wait_for(page, selector: str, timeout: int = READY_TIMEOUT) -> bool:
+    """Seçici DOM'a eklenene kadar bekle (en fazla `timeout` ms); zaman aşımında False"""
+    try:
+        await page.wait_for_selector(selector, state="attached", timeout=timeout)
+        return True
+    except Exception:
+        return False
+
+
+async def goto_question(page, url: str, wait_until: str = "domcontentloaded",
+                        timeout: int = NAVIGATION_TIMEOUT, ready_timeout: int = READY_TIMEOUT) -> bool:
+    """Soru sayfasına git ve fieldset + şıklar hazır olana kadar bekle"""
+    await page.goto(url, wait_until=wait_until, timeout=timeout)
+    return await wait_for(page, QUESTION_READY_SELECTOR, ready_timeout)
+
+
+async def goto_and_wait(page, url: str, selector: str, wait_until: str = "domcontentloaded",
+                        timeout: int = NAVIGATION_TIMEOUT, ready_timeout: int = READY_TIMEOUT) -> bool:
+    """Herhangi bir sayfaya git ve `selector` hazır olana kadar bekle"""
+    await page.goto(url, wait_until=wait_until, timeout=timeout)
+    return await wait_for(page, selector, ready_timeout)
+
+
+async def submit_answer(page, option_selector: str = "label[for='radio-1']",
+                        ready_timeout: int = READY_TIMEOUT) -> Optional[str]:
+    """
+    Bir şıkkı seçip formu gönder; cevap sayfasında dogru.png görünene kadar
+    bekle ve fieldset innerHTML'ini döndür (şık/buton yoksa None).
+    """
+    option = await page.query_selector(option_selector)
+    if option is None:
+        return None
+    await option.click()
+
+    submit_btn = await page.query_selector(SUBMIT_SELECTOR)
+    if submit_btn is None:
+        return None
+    async with page.expect_navigation(wait_until="domcontentloaded", timeout=NAVIGATION_TIMEOUT):
+        await submit_btn.click()
+
+    await wait_for(page, ANSWER_READY_SELECTOR, ready_timeout)
+    fieldset = await page.query_selector("#commentForm fieldset")
+    return await fieldset.inner_html() if fieldset else None
@@ -0,0 +1,100 @@
+"""
+Negatif Önbellek (Kalıcı, TTL'li)
+
+Sitede olmayan ("Hatalı Sayfa") ya da açılıp soru içermeyen URL'ler her
+çalıştırmada yeniden yüklenmesin diye kaydedilir. Kayıtlar durumlarına göre
+süreli tutulur; süresi dolan URL tekrar "bilinmiyor" sayılır ve denenir.
+
+    missing → sayfa yok (404 / "Hatalı Sayfa")          varsayılan 30 gün
+    broken  → sayfa açıldı ama soru/şık çıkarılamadı    varsayılan 1 gün
+
+Depo append-only JSONL'dir (`<output_dir>/_crawl/negative.jsonl`):
+    {"url", "status": "missing"|"broken", "reason", "at"}
+    {"url", "status": "ok", "at"}     → sayfa düzeldi, kayıt silinir
+
+Kullanım:
+    negative = NegativeCache(state_path("yds_questions", NEGATIVE_CACHE_NAME))
+    if negative.get(url) is None:
+        ...  # URL'nin durumu bilinmiyor, çek
+"""
+
+import os
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+
+from scripts import jsonio
+from scripts.scrapers.checkpoint_log import read_events
+
+NEGATIVE_CACHE_NAME = "negative"
+
+MISSING = "missing"
+BROKEN = "broken"
+OK = "ok"
+
+DEFAULT_TTL = {
+    MISSING: timedelta(days=30),
+    BROKEN: timedelta(days=1),
+}
+
+
+class NegativeCache:
+    """URL → {"status", "reason", "at"} (süresi dolmamış negatif kayıtlar)"""
+
+    def __init__(self, path: Optional[str] = None, ttl: Optional[Dict[str, timedelta]] = None):
+        self.path = path
+        self.ttl = dict(DEFAULT_TTL, **(ttl or {}))
+        self.entries: Dict[str, Dict] = {}
+        self._file = None
+        self.stats = {"hits": 0, "marked": 0, "cleared": 0}
+        if path and os.path.exists(path):
+            for event in read_events(path):
+                self._apply(event)
+
+    def _apply(self, event: Dict):
+        if event["status"] == OK:
+            self.entries.pop(event["url"], None)
+        else:
+            self.entries[event["url"]] = event
+
+    def _append(self, event: Dict):
+        self._apply(event)
+        if not self.path:
+            return
+        if self._file is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            self._file = open(self.path, "ab")
+        self._file.write(jsonio.dumps(event, compact=True) + b"\n")
+        self._file.flush()
+
+    def _expired(self, entry: Dict) -> bool:
+        ttl = self.ttl.get(entry["status"])
+        if ttl is None:
+            return False
+        return datetime.now() - datetime.fromisoformat(entry["at"]) > ttl
+
+    def get(self, url: str) -> Optional[Dict]:
+        """Süresi dolmamış negatif kayıt (yoksa None: URL'nin durumu bilinmiyor)"""
+        entry = self.entries.get(url)
+        if entry is None or self._expired(entry):
+            return None
+        self.stats["hits"] += 1
+        return entry
+
+    def mark(self, url: str, status: str, reason: str = ""):
+        self._append({"url": url, "status": status, "reason": reason,
+                      "at": datetime.now().isoformat()})
+        self.stats["marked"] += 1
+
+    def clear(self, url: str):
+        """URL artık çalışıyor; kayıt varsa sil"""
+        if url in self.entries:
+            self._append({"url": url, "status": OK, "at": datetime.now().isoformat()})
+            self.stats["cleared"] += 1
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
@@ -0,0 +1,137 @@
+"""
+Playwright Sayfa Havuzu (Kaynak Engellemeli)
+
+Her test için `browser.new_page()` açıp sayfayı görsel/CSS/font/reklam
+kaynaklarıyla birlikte yüklemek yerine, önceden açılmış browser context'leri
+ve sayfaları yeniden kullanılır:
+
+- Sayfalar test başına değil URL başına verilir (`async with pool.page(url)`)
+- Context seviyesinde request interception: ana belge dışındaki tüm istekler
+  (görsel, stylesheet, font, script, iframe/reklam belgeleri) iptal edilir
+- Havuz boyutu (aynı anda açık sayfa) ve host başına eşzamanlılık ayarlanabilir
+- Sayfalar ve context'ler ilk ihtiyaçta açılır; kapanan sayfa yenisiyle değişir
+
+Kullanım:
+    async with PagePool(browser, size=10, per_host=5) as pool:
+        async with pool.page(url) as page:
+            await page.goto(url, wait_until="domcontentloaded")
+            q = await extract_question(page)
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Dict, Iterable, List
+from urllib.parse import urlsplit
+
+DEFAULT_POOL_SIZE = 5
+DEFAULT_PER_HOST = 5
+DEFAULT_PAGES_PER_CONTEXT = 5
+
+# Soru işaretlemesi ana belgede; diğer kaynak türleri yüklenmez
+ALLOWED_RESOURCE_TYPES = ("document",)
+
+
+class PagePool:
+    """Browser context/sayfa havuzu; sayfalar URL başına ödünç verilir"""
+
+    def __init__(self, browser, size: int = DEFAULT_POOL_SIZE, per_host: int = DEFAULT_PER_HOST,
+                 pages_per_context: int = DEFAULT_PAGES_PER_CONTEXT, block_resources: bool = True,
+                 allowed_resource_types: Iterable[str] = ALLOWED_RESOURCE_TYPES):
+        self.browser = browser
+        self.size = size
+        self.per_host = per_host
+        self.pages_per_context = max(1, pages_per_context)
+        self.block_resources = block_resources
+        self.allowed_resource_types = set(allowed_resource_types)
+
+        self._slots = asyncio.Semaphore(size)
+        self._host_limits: Dict[str, asyncio.Semaphore] = {}
+        self._idle: List = []
+        self._contexts: List = []
+        self._context_pages: Dict[int, int] = {}  # context index → açık sayfa sayısı
+        self._page_context: Dict[int, int] = {}   # id(page) → context index
+        self._lock = asyncio.Lock()
+        self.stats = {"pages": 0, "blocked": 0, "served": 0}
+
+    # ------------------------------------------------------------
+    # Request interception
+    # ------------------------------------------------------------
+
+    def _is_allowed(self, request) -> bool:
+        if request.resource_type not in self.allowed_resource_types:
+            return False
+        if request.resource_type == "document":
+            # iframe (reklam) belgeleri de engellenir, sadece ana çerçeve yüklenir
+            try:
+                return request.frame.parent_frame is None
+            except Exception:
+                return True
+        return True
+
+    async def _route(self, route):
+        if self._is_allowed(route.request):
+            await route.continue_()
+        else:
+            self.stats["blocked"] += 1
+            await route.abort()
+
+    # ------------------------------------------------------------
+    # Sayfa yönetimi
+    # ------------------------------------------------------------
+
+    async def _new_page(self):
+        async with self._lock:
+            index = next((i for i in range(len(self._contexts))
+                          if self._context_pages[i] < self.pages_per_context), None)
+            if index is None:
+                context = await self.browser.new_context()
+                if self.block_resources:
+                    await context.route("**/*", self._route)
+                index = len(self._contexts)
+                self._contexts.append(context)
+                self._context_pages[index] = 0
+
+            page = await self._contexts[index].new_page()
+            self._page_context[id(page)] = index
+            self._context_pages[index] += 1
+            self.stats["pages"] += 1
+            return page
+
+    def _host_limit(self, url: str) -> asyncio.Semaphore:
+        host = urlsplit(url).netloc
+        limit = self._host_limits.get(host)
+        if limit is None:
+            limit = self._host_limits[host] = asyncio.Semaphore(self.per_host)
+        return limit
+
+    @asynccontextmanager
+    async def page(self, url: str):
+        """`url` için havuzdan bir sayfa ödünç al (host ve havuz limitleri uygulanır)"""
+        async with self._host_limit(url), self._slots:
+            page = self._idle.pop() if self._idle else await self._new_page()
+            try:
+                yield page
+            finally:
+                self.stats["served"] += 1
+                if page.is_closed():
+                    # Çöken/kapanan sayfanın yerine sonraki istekte yenisi açılır
+                    self._context_pages[self._page_context.pop(id(page))] -= 1
+                else:
+                    self._idle.append(page)
+
+    async def close(self):
+        for context in self._contexts:
+            try:
+                await context.close()
+            except Exception:
+                pass
+        self._contexts.clear()
+        self._context_pages.clear()
+        self._page_context.clear()
+        self._idle.clear()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
@@ -0,0 +1,492 @@
+"""
+Soru Sayfası Ayrıştırma (Statik HTML)
+
+Soru işaretlemesi (`#commentForm fieldset`, `.custom-radio`) sayfanın statik
+HTML'inde bulunduğu için tarayıcı açmadan ayrıştırılabilir.
+`parse_question_html` Playwright tabanlı `extract_question` ile aynı
+sözlüğü üretir: tarayıcının `innerHTML` serileştirmesi (küçük harf etiketler,
+çift tırnaklı attribute'lar, `<br>` biçimi, escape kuralları) taklit edilir
+ve aynı regex'ler aynı HTML parçalarına uygulanır.
+
+Tarayıcıda açık bir sayfa için `extract_question` aynı parçaları tek bir
+`page.evaluate` çağrısıyla alır (her şık için ayrı query_selector /
+get_attribute / inner_html round trip'i yapılmaz); tüm scraper'lar bunu
+kullanır.
+
+`QuestionFetcher` sayfayı HttpClient ile çeker; ayrıştırma başarısız olursa
+(fieldset ya da şık bulunamazsa) sayfayı PagePool'dan alınan bir Playwright
+sayfasında açar. `archive` verilirse çekilen ham HTML `HtmlArchive`'e yazılır
+(selector hatalarında `html_archive reparse` ile yeniden kazımadan düzeltme).
+Sitede olmayan sayfa (404 ya da "Hatalı Sayfa") statik yanıttan tanınır ve
+tarayıcı açılmadan `PageMissing` fırlatılır (negatif önbelleğe yazılması için).
+
+`AnswerFetcher` doğru cevabı tarayıcıda şık tıklayıp formu göndermek yerine
+sayfadaki `#commentForm`'u (action, method, radio adı, hidden input'lar)
+ayrıştırıp aynı gönderimi HTTP ile tekrarlar (oturum çerezleri HttpClient'ta)
+ve yanıttaki dogru.png işaretini ayrıştırır. Form bulunamaz ya da yanıtta
+işaret yoksa şık tarayıcıda seçilip form gönderilir (`submit_answer`).
+"""
+
+import re
+from html import escape
+from html.parser import HTMLParser
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlencode, urljoin, urlsplit, urlunsplit
+
+from scripts.scrapers.navigation import READY_TIMEOUT, goto_question, submit_answer
+
+QUESTION_NUMBER_RE = re.compile(r'<div[^>]*font-weight[^>]*bold[^>]*>([^<]+)</div>')
+QUESTION_TEXT_RE = re.compile(r'<div[^>]*width:\s*590px[^>]*>(.*?)</div>', re.DOTALL)
+TAG_RE = re.compile(r'<[^>]+>')
+# Cevaplanmış sayfada doğru şıkkın input'undan önce dogru.png gelir
+CORRECT_ANSWER_RE = re.compile(r'dogru\.png[^>]*>.*?<input[^>]*value="([A-E])"', re.DOTALL)
+
+# Sitede olmayan soru sayfaları için site 200 + "Hatalı Sayfa" döner
+MISSING_PAGE_MARKER = "Hatalı Sayfa"
+MISSING_STATUSES = (404, 410)
+
+VOID_TAGS = {
+    "area", "base", "br", "col", "embed", "hr", "img", "input", "link",
+    "meta", "param", "source", "track", "wbr",
+}
+RAW_TEXT_TAGS = {"script", "style"}
+
+# Fieldset innerHTML'i + her .custom-radio için ilk radio value'su ve ilk label innerHTML'i
+EXTRACT_QUESTION_JS = """
+() => {
+    const fieldset = document.querySelector("#commentForm fieldset");
+    const options = [];
+    for (const opt of document.querySelectorAll(".custom-radio")) {
+        const input = opt.querySelector("input[type='radio']");
+        const label = opt.querySelector("label");
+        if (input && label) {
+            options.push({letter: input.getAttribute("value"), html: label.innerHTML});
+        }
+    }
+    return {fieldset: fieldset ? fieldset.innerHTML : null, options};
+}
+"""
+
+
+class PageMissing(Exception):
+    """Soru sayfası sitede yok (404 / "Hatalı Sayfa")"""
+
+
+def is_missing_page(html: str) -> bool:
+    return MISSING_PAGE_MARKER in html
+
+
+def empty_question() -> Dict:
+    return {
+        "question_number": "",
+        "question_text": "",
+        "options": [],
+        "correct_answer": None
+    }
+
+
+def parse_fieldset_html(fieldset_html: str, result: Dict):
+    """Fieldset innerHTML'inden soru numarası ve metnini çıkar"""
+    num_match = QUESTION_NUMBER_RE.search(fieldset_html)
+    if num_match:
+        result["question_number"] = num_match.group(1).strip()
+
+    text_match = QUESTION_TEXT_RE.search(fieldset_html)
+    if text_match:
+        text = text_match.group(1)
+        text = text.replace("<br>", "\n").replace("<br/>", "\n")
+        text = TAG_RE.sub('', text)
+        result["question_text"] = text.strip()
+
+
+def option_label_text(label_html: str) -> str:
+    """Şık label innerHTML'ini düz metne çevir"""
+    label_text = label_html.replace("<br>", "").replace("<br/>", "").strip()
+    return TAG_RE.sub('', label_text).strip()
+
+
+def parse_correct_answer(html: str) -> Optional[str]:
+    """Cevaplanmış sayfa/fieldset HTML'inden dogru.png ile işaretli şıkkın harfi"""
+    match = CORRECT_ANSWER_RE.search(html)
+    return match.group(1) if match else None
+
+
+async def extract_question(page) -> Dict:
+    """Açık sayfadan soru bilgilerini tek page.evaluate çağrısıyla çıkar"""
+    result = empty_question()
+    try:
+        raw = await page.evaluate(EXTRACT_QUESTION_JS)
+    except Exception as e:
+        result["error"] = str(e)
+        return result
+
+    if raw["fieldset"] is not None:
+        parse_fieldset_html(raw["fieldset"], result)
+    result["options"] = [
+        {"letter": opt["letter"], "text": option_label_text(opt["html"])}
+        for opt in raw["options"]
+    ]
+    return result
+
+
+# ============================================================
+# innerHTML TAKLİDİ
+# ============================================================
+
+def _serialize_attr(value: Optional[str]) -> str:
+    value = value or ""
+    return value.replace("&", "&amp;").replace("\xa0", "&nbsp;").replace('"', "&quot;")
+
+
+def _serialize_text(text: str) -> str:
+    return escape(text, quote=False).replace("\xa0", "&nbsp;")
+
+
+class _Capture:
+    """innerHTML'i toplanan bir elementin açık derinliği ve tamponu"""
+
+    def __init__(self, depth: int):
+        self.depth = depth
+        self.parts: List[str] = []
+
+    @property
+    def html(self) -> str:
+        return "".join(self.parts)
+
+
+class _QuestionHTMLParser(HTMLParser):
+    """
+    `#commentForm fieldset` (ilk eşleşen) ve her `.custom-radio` içindeki ilk
+    radio input değeri + ilk label innerHTML'ini toplar.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.depth = 0
+        self.form_depth = None       # #commentForm içindeysek derinliği
+        self.fieldset: Optional[_Capture] = None
+        self.fieldset_done = False
+        self.fieldset_html: Optional[str] = None
+        self.radios: List[Dict] = []  # {"depth", "value", "label": _Capture|None, "label_done"}
+        self.raw_text_tag = None
+
+    # Açık tüm yakalamalara parça ekle
+    def _emit(self, text: str):
+        if self.fieldset is not None:
+            self.fieldset.parts.append(text)
+        for radio in self.radios:
+            if radio["depth"] is not None and radio["label"] is not None and not radio["label_done"]:
+                radio["label"].parts.append(text)
+
+    def handle_starttag(self, tag, attrs):
+        attrs_dict = dict(attrs)
+        serialized = "<" + tag + "".join(
+            f' {name}="{_serialize_attr(value)}"' for name, value in attrs
+        ) + ">"
+        self._emit(serialized)
+
+        if tag in VOID_TAGS:
+            self._on_element(tag, attrs_dict, self.depth + 1)
+            return
+
+        self.depth += 1
+        if tag in RAW_TEXT_TAGS:
+            self.raw_text_tag = tag
+        self._on_element(tag, attrs_dict, self.depth)
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        if tag not in VOID_TAGS:
+            self.handle_endtag(tag)
+
+    def _on_element(self, tag, attrs, depth):
+        if tag == "form" and attrs.get("id") == "commentForm" and self.form_depth is None:
+            self.form_depth = depth
+        elif (tag == "fieldset" and self.form_depth is not None and self.fieldset is None
+              and not self.fieldset_done):
+            self.fieldset = _Capture(depth)
+
+        classes = (attrs.get("class") or "").split()
+        if "custom-radio" in classes and tag not in VOID_TAGS:
+            self.radios.append({"depth": depth, "value": None, "has_input": False,
+                                "label": None, "label_done": False})
+
+        for radio in self.radios:
+            if radio["depth"] is None or depth <= radio["depth"]:
+                continue
+            if tag == "input" and (attrs.get("type") or "").lower() == "radio" and not radio["has_input"]:
+                radio["has_input"] = True
+                radio["value"] = attrs.get("value")
+            elif tag == "label" and radio["label"] is None:
+                radio["label"] = _Capture(depth)
+
+    def handle_endtag(self, tag):
+        if tag in VOID_TAGS:
+            return
+        if tag == self.raw_text_tag:
+            self.raw_text_tag = None
+
+        closing_depth = self.depth
+        for radio in self.radios:
+            label = radio["label"]
+            if label is not None and not radio["label_done"] and label.depth == closing_depth:
+                radio["label_done"] = True
+            if radio["depth"] == closing_depth:
+                radio["depth"] = None  # Element kapandı
+
+        if self.fieldset is not None and self.fieldset.depth == closing_depth:
+            self.fieldset_html = self.fieldset.html
+            self.fieldset = None
+            self.fieldset_done = True
+        if self.form_depth == closing_depth:
+            self.form_depth = None
+
+        self._emit(f"</{tag}>")
+        self.depth = max(self.depth - 1, 0)
+
+    def handle_data(self, data):
+        self._emit(data if self.raw_text_tag else _serialize_text(data))
+
+    def handle_comment(self, data):
+        self._emit(f"<!--{data}-->")
+
+
+def parse_question_html(html: str) -> Optional[Dict]:
+    """
+    Statik sayfa HTML'inden soru sözlüğünü çıkar.
+    Fieldset ya da şık bulunamazsa None döner (tarayıcı fallback'i için).
+    """
+    parser = _QuestionHTMLParser()
+    parser.feed(html)
+    parser.close()
+
+    fieldset_html = parser.fieldset_html
+    if fieldset_html is None and parser.fieldset is not None:
+        fieldset_html = parser.fieldset.html  # Kapanmamış fieldset
+
+    result = empty_question()
+    if fieldset_html is not None:
+        parse_fieldset_html(fieldset_html, result)
+
+    for radio in parser.radios:
+        if radio["has_input"] and radio["label"] is not None:
+            result["options"].append({
+                "letter": radio["value"],
+                "text": option_label_text(radio["label"].html),
+            })
+
+    if fieldset_html is None or not result["options"]:
+        return None
+    return result
+
+
+# ============================================================
+# CEVAP FORMU
+# ============================================================
+
+# Gönderimde değeri olduğu gibi taşınmayan input türleri
+_SKIPPED_INPUT_TYPES = {"checkbox", "button", "reset", "image", "file"}
+
+
+class _AnswerFormParser(HTMLParser):
+    """`#commentForm`'un attribute'ları, hidden/metin input'ları, ilk radio grubu ve submit butonu"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.form: Optional[Dict] = None
+        self.inside = False
+        self.fields: Dict[str, str] = {}
+        self.radio: Optional[str] = None
+        self.choices: List[str] = []
+        self.submit: Optional[Tuple[str, str]] = None
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if tag == "form":
+            if self.form is None and attrs.get("id") == "commentForm":
+                self.form = attrs
+                self.inside = True
+            return
+        if not self.inside or tag not in ("input", "button") or not attrs.get("name"):
+            return
+
+        name, value = attrs["name"], attrs.get("value") or ""
+        input_type = (attrs.get("type") or ("submit" if tag == "button" else "text")).lower()
+        if input_type == "radio":
+            if self.radio is None:
+                self.radio = name
+            if name == self.radio:
+                self.choices.append(value)
+        elif input_type == "submit":
+            if self.submit is None:
+                self.submit = (name, value)
+        elif input_type not in _SKIPPED_INPUT_TYPES:
+            self.fields[name] = value
+
+    def handle_endtag(self, tag):
+        if tag == "form":
+            self.inside = False
+
+
+def parse_answer_form(html: str, page_url: str) -> Optional[Dict]:
+    """
+    Soru sayfasındaki `#commentForm`: {"action", "method", "radio", "choices",
+    "fields"}. `fields` tarayıcının radio dışında göndereceği alanlardır
+    (hidden input'lar, adı olan submit butonu). Form ya da şık yoksa None.
+    """
+    parser = _AnswerFormParser()
+    parser.feed(html)
+    parser.close()
+    if parser.form is None or parser.radio is None:
+        return None
+
+    fields = dict(parser.fields)
+    if parser.submit is not None:
+        fields.setdefault(*parser.submit)
+    return {
+        "action": urljoin(page_url, parser.form.get("action") or ""),
+        "method": (parser.form.get("method") or "get").lower(),
+        "radio": parser.radio,
+        "choices": parser.choices,
+        "fields": fields,
+    }
+
+
+# ============================================================
+# FETCHER
+# ============================================================
+
+class QuestionFetcher:
+    """
+    Soru sayfalarını önce statik HTTP ile çeker, ayrıştırılamazsa PagePool'dan
+    URL başına ödünç alınan Playwright sayfasına düşer. Tüm testler tek bir
+    fetcher'ı paylaşabilir.
+    """
+
+    def __init__(self, http, pool=None,
+                 extract: Callable[..., Awaitable[Dict]] = extract_question,
+                 wait_until: str = "domcontentloaded", ready_timeout: int = READY_TIMEOUT,
+                 archive=None):
+        self.http = http
+        self.pool = pool
+        self.archive = archive
+        self.extract = extract
+        self.wait_until = wait_until
+        self.ready_timeout = ready_timeout
+        self.stats = {"static": 0, "browser": 0}
+
+    async def fetch(self, url: str) -> Dict:
+        """URL'deki soruyu döndür; sayfa yoksa PageMissing, diğer hatalarda exception"""
+        return (await self.fetch_page(url))[0]
+
+    async def fetch_page(self, url: str) -> Tuple[Dict, Optional[str]]:
+        """
+        (soru, statik HTML): HTML, soru statik sayfadan ayrıştırıldıysa dolu
+        (AnswerFetcher formu yeniden çekmeden kullanır), tarayıcıya düşüldüyse None
+        """
+        try:
+            status, html = await self.http.get(url)
+        except OSError:
+            status, html = None, ""
+
+        if status == 200:
+            if self.archive is not None:
+                self.archive.put(url, html)
+            result = parse_question_html(html)
+            if result is not None:
+                self.stats["static"] += 1
+                return result, html
+            if is_missing_page(html):
+                raise PageMissing(f"Sayfa mevcut değil: {url}")
+        elif status in MISSING_STATUSES:
+            raise PageMissing(f"Sayfa mevcut değil ({status}): {url}")
+
+        if self.pool is None or self.extract is None:
+            if status is None:
+                raise ConnectionError(f"Sayfa alınamadı: {url}")
+            # Tarayıcı yoksa boş sonuç (sayfa gerçekten soru içermiyor)
+            return empty_question(), None
+
+        return await self._fetch_with_browser(url), None
+
+    async def _fetch_with_browser(self, url: str) -> Dict:
+        async with self.pool.page(url) as page:
+            # Sabit bekleme yerine şıklar DOM'a gelene kadar (sınırlı süre) beklenir
+            ready = await goto_question(page, url, wait_until=self.wait_until, ready_timeout=self.ready_timeout)
+            self.stats["browser"] += 1
+            if self.archive is not None or not ready:
+                html = await page.content()
+                if self.archive is not None:
+                    self.archive.put(url, html)
+                if not ready and is_missing_page(html):
+                    raise PageMissing(f"Sayfa mevcut değil: {url}")
+            return await self.extract(page)
+
+
+class AnswerFetcher:
+    """
+    Soru formunu HTTP ile göndererek doğru cevabı alır. Form sayfadan
+    ayrıştırılır; HTTP gönderimi işaretsiz dönerse `pool` verilmişse şık
+    tarayıcıda seçilip form gönderilir.
+    """
+
+    def __init__(self, http, pool=None, guess: str = "A",
+                 wait_until: str = "domcontentloaded", ready_timeout: int = READY_TIMEOUT):
+        self.http = http
+        self.pool = pool
+        self.guess = guess  # Gönderilen şık; site hangisi seçilirse seçilsin doğruyu işaretler
+        self.wait_until = wait_until
+        self.ready_timeout = ready_timeout
+        self.stats = {"answered": 0, "missing": 0, "no_form": 0, "browser": 0}
+
+    async def fetch(self, url: str, html: Optional[str] = None) -> Optional[str]:
+        """
+        URL'deki sorunun doğru şıkkı (işaret yoksa None); ağ hatasında exception.
+        `html` verilirse (QuestionFetcher.fetch_page) sayfa tekrar çekilmez.
+        """
+        if html is None:
+            status, html = await self.http.get(url)
+            if status != 200:
+                html = ""
+
+        answer = None
+        form = parse_answer_form(html, url)
+        if form is None:
+            self.stats["no_form"] += 1
+        else:
+            answer = await self._submit_form(url, form)
+        if answer is None and self.pool is not None:
+            answer = await self._submit_with_browser(url)
+
+        self.stats["answered" if answer else "missing"] += 1
+        return answer
+
+    async def _submit_form(self, url: str, form: Dict) -> Optional[str]:
+        fields = dict(form["fields"])
+        choices = form["choices"]
+        fields[form["radio"]] = self.guess if self.guess in choices else choices[0]
+
+        if form["method"] == "post":
+            status, html = await self.http.post_form(form["action"], fields, referer=url)
+        else:
+            parts = urlsplit(form["action"])
+            status, html = await self.http.get(urlunsplit(parts._replace(query=urlencode(fields))))
+        return parse_correct_answer(html) if status == 200 else None
+
+    async def _submit_with_browser(self, url: str) -> Optional[str]:
+        async with self.pool.page(url) as page:
+            if not await goto_question(page, url, wait_until=self.wait_until, ready_timeout=self.ready_timeout):
+                return None
+            self.stats["browser"] += 1
+            fieldset_html = await submit_answer(page, ready_timeout=self.ready_timeout)
+        return parse_correct_answer(fieldset_html) if fieldset_html else None
+
+    def report(self) -> str:
+        """Özet satırı; hiç cevap alınamadıysa uyarı (form yapısı değişmiş olabilir)"""
+        s = self.stats
+        total = s["answered"] + s["missing"]
+        line = (f"Site cevabı: {s['answered']}/{total} (formsuz: {s['no_form']}, "
+                f"tarayıcıyla: {s['browser']})")
+        if total and not s["answered"]:
+            line = "⚠️  " + line + " — hiçbir soru için cevap alınamadı, form yapısını kontrol edin"
+        return line
@@ -0,0 +1,277 @@
+"""
+Scraper Benchmark'ı (Yerel Fixture Sunucusuna Karşı)
+
+Aynı soru sayfası kümesini farklı fetch yollarıyla kazır; sayfa/sn, sayfa
+başına gecikme (p50/p95) ve korpusla birebir eşleşme oranını raporlar.
+
+Modlar:
+    static    → HttpClient (keep-alive) + parse_question_html
+    answers   → static + AnswerFetcher (sayfadaki form, aynı oturum); cevaplar korpusla karşılaştırılır
+    selectors → Playwright: eski query_selector / get_attribute / inner_html çıkarımı
+    evaluate  → Playwright: tek page.evaluate ile extract_question
+    pool      → Playwright: PagePool (URL başına sayfa, ana belge dışı kaynaklar engelli)
+    ready     → pool + sabit 0.3 sn bekleme yerine goto_question (şıklar DOM'a gelince)
+
+selectors/evaluate/pool modları eski davranışı (goto + sabit bekleme) ölçer;
+ready ile pool arasındaki p50/p95 farkı koşullu beklemenin kazancıdır.
+
+Tarayıcı modlarında çıkarım sırasında yapılan tarayıcı round trip'leri
+(page / element handle üzerindeki her await edilen çağrı) sayılır.
+
+Kullanım:
+    python -m scripts.scrapers.scrape_benchmark --pages 300 --concurrency 5
+    python -m scripts.scrapers.scrape_benchmark --modes static --latency 0.05
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from typing import Dict, List
+from urllib.parse import urlsplit
+
+sys.stdout.reconfigure(line_buffering=True)
+
+from scripts.scrapers.fixture_server import FixtureServer
+from scripts.scrapers.http_client import HttpClient
+from scripts.scrapers.navigation import goto_question
+from scripts.scrapers.page_pool import PagePool
+from scripts.scrapers.question_page import (
+    AnswerFetcher,
+    empty_question,
+    extract_question,
+    option_label_text,
+    parse_fieldset_html,
+    parse_question_html,
+)
+
+COMPARED_FIELDS = ("question_number", "question_text", "options")
+
+
+def matches_corpus(result: Dict, expected: Dict) -> bool:
+    return all(result.get(field) == expected.get(field) for field in COMPARED_FIELDS)
+
+
+async def _run_concurrent(urls: List[str], concurrency: int, fetch_one) -> Dict:
+    """URL'leri `concurrency` işçiyle kazı; (sonuçlar, gecikmeler) topla"""
+    queue = asyncio.Queue()
+    for url in urls:
+        queue.put_nowait(url)
+    results, latencies = {}, []
+
+    async def worker(worker_id: int):
+        while True:
+            try:
+                url = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            start = time.perf_counter()
+            try:
+                results[url] = await fetch_one(worker_id, url)
+            except Exception as e:
+                results[url] = {"error": str(e)}
+            latencies.append(time.perf_counter() - start)
+
+    await asyncio.gather(*(worker(i) for i in range(concurrency)))
+    return {"results": results, "latencies": latencies}
+
+
+# ============================================================
+# MODLAR
+# ============================================================
+
+async def run_answers(server: FixtureServer, urls: List[str], concurrency: int) -> Dict:
+    # Her işçi sayfayı çeker, formunu aynı oturumla gönderir
+    async with HttpClient(max_connections=concurrency) as http:
+        answers = AnswerFetcher(http)
+
+        async def fetch_one(worker_id, url):
+            status, html = await http.get(url)
+            result = parse_question_html(html) or {}
+            result["correct_answer"] = await answers.fetch(url, html)
+            return result
+
+        run = await _run_concurrent(urls, concurrency, fetch_one)
+    correct = sum(
+        (run["results"].get(url) or {}).get("correct_answer") == server.pages[urlsplit(url).path].get("correct_answer")
+        for url in urls
+    )
+    run["extra"] = f"{correct}/{len(urls)} cevap doğru; {answers.report()}"
+    return run
+
+
+async def run_static(server: FixtureServer, urls: List[str], concurrency: int) -> Dict:
+    async with HttpClient(max_connections=concurrency) as http:
+        async def fetch_one(worker_id, url):
+            status, html = await http.get(url)
+            return parse_question_html(html) or {}
+
+        run = await _run_concurrent(urls, concurrency, fetch_one)
+        run["extra"] = f"{http.stats['connections']} bağlantı / {http.stats['requests']} istek"
+    return run
+
+
+class _RoundTripCounter:
+    """Page / ElementHandle vekili: await edilen her çağrıyı bir round trip sayar"""
+
+    def __init__(self, target, counter: Dict):
+        self._target = target
+        self._counter = counter
+
+    def __getattr__(self, name):
+        attr = getattr(self._target, name)
+        if not callable(attr):
+            return attr
+
+        async def call(*args, **kwargs):
+            self._counter["round_trips"] += 1
+            result = await attr(*args, **kwargs)
+            if isinstance(result, list):
+                return [_RoundTripCounter(r, self._counter) for r in result]
+            if result is not None and hasattr(result, "query_selector"):
+                return _RoundTripCounter(result, self._counter)
+            return result
+
+        return call
+
+
+async def extract_with_selectors(page) -> Dict:
+    """Eski çıkarım: fieldset + her şık için ayrı query_selector/get_attribute/inner_html"""
+    result = empty_question()
+    try:
+        fieldset = await page.query_selector("#commentForm fieldset")
+        if fieldset:
+            parse_fieldset_html(await fieldset.inner_html(), result)
+
+        for opt in await page.query_selector_all(".custom-radio"):
+            input_elem = await opt.query_selector("input[type='radio']")
+            label_elem = await opt.query_selector("label")
+            if input_elem and label_elem:
+                result["options"].append({
+                    "letter": await input_elem.get_attribute("value"),
+                    "text": option_label_text(await label_elem.inner_html()),
+                })
+    except Exception as e:
+        result["error"] = str(e)
+    return result
+
+
+async def _run_browser(urls: List[str], concurrency: int, extract) -> Dict:
+    from playwright.async_api import async_playwright
+
+    counter = {"round_trips": 0}
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True)
+        pages = [await browser.new_page() for _ in range(concurrency)]
+
+        async def fetch_one(worker_id, url):
+            page = pages[worker_id]
+            await page.goto(url, wait_until="domcontentloaded", timeout=30000)
+            await asyncio.sleep(0.3)
+            return await extract(_RoundTripCounter(page, counter))
+
+        run = await _run_concurrent(urls, concurrency, fetch_one)
+        await browser.close()
+    run["extra"] = f"{counter['round_trips'] / max(len(urls), 1):.1f} round trip/sayfa"
+    return run
+
+
+async def run_selectors(server: FixtureServer, urls: List[str], concurrency: int) -> Dict:
+    return await _run_browser(urls, concurrency, extract_with_selectors)
+
+
+async def run_evaluate(server: FixtureServer, urls: List[str], concurrency: int) -> Dict:
+    return await _run_browser(urls, concurrency, extract_question)
+
+
+async def _run_pool(urls: List[str], concurrency: int, fixed_wait: bool) -> Dict:
+    from playwright.async_api import async_playwright
+
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True)
+        async with PagePool(browser, size=concurrency, per_host=concurrency) as pool:
+            async def fetch_one(worker_id, url):
+                async with pool.page(url) as page:
+                    if fixed_wait:
+                        await page.goto(url, wait_until="domcontentloaded", timeout=30000)
+                        await asyncio.sleep(0.3)
+                    else:
+                        await goto_question(page, url)
+                    return await extract_question(page)
+
+            run = await _run_concurrent(urls, concurrency, fetch_one)
+            run["extra"] = f"{pool.stats['pages']} sayfa, {pool.stats['blocked']} engellenen istek"
+        await browser.close()
+    return run
+
+
+async def run_pool(server: FixtureServer, urls: List[str], concurrency: int) -> Dict:
+    return await _run_pool(urls, concurrency, fixed_wait=True)
+
+
+async def run_ready(server: FixtureServer, urls: List[str], concurrency: int) -> Dict:
+    return await _run_pool(urls, concurrency, fixed_wait=False)
+
+
+MODES = {
+    "static": run_static,
+    "answers": run_answers,
+    "selectors": run_selectors,
+    "evaluate": run_evaluate,
+    "pool": run_pool,
+    "ready": run_ready,
+}
+
+
+# ============================================================
+# RAPOR
+# ============================================================
+
+def _percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+async def benchmark(modes: List[str], page_count: int, concurrency: int,
+                    latency: float, asset_latency: float):
+    with FixtureServer(latency=latency, asset_latency=asset_latency) as server:
+        urls = server.question_urls(page_count)
+        expected = {server.base_url + path: q for path, q in server.pages.items()}
+        print(f"🧪 {len(urls)} sayfa, eşzamanlılık {concurrency}, gecikme {latency * 1000:.0f}ms\n")
+        print(f"{'Mod':<10} {'sayfa/sn':>9} {'p50 ms':>8} {'p95 ms':>8} {'eşleşme':>9}  not")
+        print("-" * 64)
+
+        for mode in modes:
+            hits_before = dict(server.hits)
+            start = time.perf_counter()
+            try:
+                run = await MODES[mode](server, urls, concurrency)
+            except ImportError as e:
+                print(f"{mode:<10} atlandı ({e})")
+                continue
+            elapsed = time.perf_counter() - start
+
+            latencies = run["latencies"]
+            matched = sum(matches_corpus(run["results"].get(u) or {}, expected[u]) for u in urls)
+            assets = server.hits["asset"] - hits_before["asset"]
+            note = run.get("extra", "")
+            if assets:
+                note = f"{note}, {assets} kaynak isteği".lstrip(", ")
+            print(f"{mode:<10} {len(urls) / elapsed:>9.1f} "
+                  f"{statistics.median(latencies) * 1000:>8.1f} {_percentile(latencies, 0.95) * 1000:>8.1f} "
+                  f"{matched:>4}/{len(urls):<4}  {note}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Scraper fetch yollarını fixture sunucusunda karşılaştır")
+    parser.add_argument("--modes", nargs="+", choices=list(MODES), default=list(MODES), help="Çalıştırılacak modlar")
+    parser.add_argument("--pages", type=int, default=300, help="Sayfa sayısı")
+    parser.add_argument("--concurrency", type=int, default=5, help="Eşzamanlı işçi sayısı")
+    parser.add_argument("--latency", type=float, default=0.02, help="Sayfa başına simüle gecikme (sn)")
+    parser.add_argument("--asset-latency", type=float, default=0.01, help="Kaynak başına simüle gecikme (sn)")
+
+    args = parser.parse_args()
+    asyncio.run(benchmark(args.modes, args.pages, args.concurrency, args.latency, args.asset_latency))
@@ -1,101 +1,38 @@
 import asyncio
 from playwright.async_api import async_playwright
-import json
-import re
 
-async def scrape_single_question(page) -> dict:
-    """Açık sayfadan soru bilgilerini çıkar"""
-    result = {
-        "question_number": "",
-        "question_text": "",
-        "options": [],
-        "correct_answer": None
-    }
-    
-    try:
-        # Soru numarası ve metni - fieldset içinde
-        fieldset = await page.query_selector("#commentForm fieldset")
-        if fieldset:
-            # Tüm fieldset içeriğini al
-            fieldset_html = await fieldset.inner_html()
-            
-            # Soru numarası ve metni regex ile çıkar
-            # Pattern: <div style="font-weight: bold; ">1.  </div><div style="width: 590px;">SORU METNİ</div>
-            
-            # Soru numarası
-            num_match = re.search(r'<div[^>]*font-weight[^>]*bold[^>]*>([^<]+)</div>', fieldset_html)
-            if num_match:
-                result["question_number"] = num_match.group(1).strip()
-            
-            # Soru metni - width: 590px olan div
-            text_match = re.search(r'<div[^>]*width:\s*590px[^>]*>(.*?)</div>', fieldset_html, re.DOTALL)
-            if text_match:
-                text = text_match.group(1)
-                text = text.replace("<br>", "\n").replace("<br/>", "\n")
-                text = re.sub(r'<[^>]+>', '', text)
-                result["question_text"] = text.strip()
-        
-        # Şıklar - .custom-radio label içinde
-        option_elems = await page.query_selector_all(".custom-radio")
-        for opt in option_elems:
-            input_elem = await opt.query_selector("input[type='radio']")
-            label_elem = await opt.query_selector("label")
-            if input_elem and label_elem:
-                value = await input_elem.get_attribute("value")
-                label_html = await label_elem.inner_html()
-                label_text = label_html.replace("<br>", "").replace("<br/>", "").strip()
-                label_text = re.sub(r'<[^>]+>', '', label_text).strip()
-                result["options"].append({
-                    "letter": value,
-                    "text": label_text
-                })
-    except Exception as e:
-        print(f"Soru parse hatası: {e}")
-    
-    return result
+from scripts import jsonio
+from scripts.scrapers.browser_service import open_browser
+from scripts.scrapers.crawler import Crawler, QuestionExtractor
+from scripts.scrapers.http_client import HttpClient
+from scripts.scrapers.page_pool import PagePool
+from scripts.scrapers.question_page import QuestionFetcher
+from scripts.scrapers.sources import QUESTION_URL_RE, question_url
 
 async def scrape_test(base_url: str, start: int = 1, end: int = 60) -> list:
-    """Bir testteki tüm soruları kazır"""
-    questions = []
-    
-    # URL pattern'i tespit et: YDS-TENSES---TEST-6442-1.html
-    # Son sayıyı değiştirerek diğer sorulara gideceğiz
-    import re
-    pattern = r'(.*-)\d+(\.html.*)'
-    match = re.match(pattern, base_url)
-    if not match:
+    """Bir testteki tüm soruları kazır (tek işçi, durum kaydı tutulmaz)"""
+    # URL pattern'i: YDS-TENSES---TEST-6442-1.html → son sayı soru sırası
+    if not QUESTION_URL_RE.match(base_url):
         print(f"URL pattern tanınamadı: {base_url}")
-        return questions
+        return []
     
-    url_prefix = match.group(1)
-    url_suffix = match.group(2)
+    def report(kind: str, q: dict):
+        status = "Hata" if q.get("error") else "Kazındı"
+        print(f"{status} [{q['index']}/{end}]: {q['url']}")
     
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
-        page = await browser.new_page()
+    async with async_playwright() as p, HttpClient(max_connections=1) as http:
+        browser = await open_browser(p)
+        pool = PagePool(browser, size=1, per_host=1)
         
+        crawler = Crawler([QuestionExtractor(QuestionFetcher(http, pool))], workers=1, on_record=report)
         for i in range(start, end + 1):
-            url = f"{url_prefix}{i}{url_suffix}"
-            print(f"Kazınıyor [{i}/{end}]: {url}")
-            
-            try:
-                await page.goto(url, wait_until="networkidle", timeout=30000)
-                await asyncio.sleep(0.5)
-                
-                q = await scrape_single_question(page)
-                q["url"] = url
-                q["index"] = i
-                questions.append(q)
-                
-            except Exception as e:
-                print(f"Hata ({url}): {e}")
-                questions.append({
-                    "index": i,
-                    "url": url,
-                    "error": str(e)
-                })
+            crawler.add("question", question_url(base_url, i), {"index": i})
         
-        await browser.close()
+        try:
+            questions = (await crawler.run(report_every=0))["question"]
+        finally:
+            await pool.close()
+            await browser.close()
     
     return questions
 
@@ -128,8 +65,7 @@ async def main():
     
     # JSON olarak kaydet
     output_file = "questions.json"
-    with open(output_file, "w", encoding="utf-8") as f:
-        json.dump(questions, f, indent=2, ensure_ascii=False)
+    jsonio.dump(questions, output_file)
     print(f"Kaydedildi: {output_file}")
     
     # Örnek çıktı
@@ -0,0 +1,143 @@
+"""
+Kazıma Kaynakları (Tek Kaynak)
+
+Scraper'ların ortak test/kategori listeleri ve soru URL kuralı:
+test sayfası `...-0.html`, sorular `...-1.html`, `...-2.html`, ...
+"""
+
+import re
+from typing import List
+
+BASE_URL = "https://www.sorukurdu.com"
+
+# Test/soru URL'si: <önek>-<sıra>.html
+QUESTION_URL_RE = re.compile(r'(.*)-(\d+)(\.html.*)')
+
+
+def question_url(test_url: str, index: int) -> str:
+    """Test URL'sinden `index`. sorunun URL'si"""
+    match = QUESTION_URL_RE.match(test_url)
+    if not match:
+        raise ValueError(f"URL pattern tanınamadı: {test_url}")
+    return f"{match.group(1)}-{index}{match.group(3)}"
+
+
+def question_urls(test_url: str, count: int, start: int = 1) -> List[str]:
+    return [question_url(test_url, i) for i in range(start, start + count)]
+
+
+def question_index(url: str) -> int:
+    """Soru URL'sindeki sıra numarası"""
+    match = QUESTION_URL_RE.match(url)
+    return int(match.group(2)) if match else 0
+
+
+# YDS Test URL'leri ve soru sayıları
+YDS_TESTS = [
+    # Tenses
+    {"category": "Tenses", "url": "https://www.sorukurdu.com/test-sorular/YDS-TENSES---TEST-1437-0.html", "count": 30},
+    {"category": "Tenses", "url": "https://www.sorukurdu.com/test-sorular/YDS-TENSES---TEST-2438-0.html", "count": 25},
+    {"category": "Tenses", "url": "https://www.sorukurdu.com/test-sorular/YDS-TENSES---TEST-3439-0.html", "count": 50},
+    {"category": "Tenses", "url": "https://www.sorukurdu.com/test-sorular/YDS-TENSES---TEST-4440-0.html", "count": 40},
+    {"category": "Tenses", "url": "https://www.sorukurdu.com/test-sorular/YDS-TENSES---TEST-5441-0.html", "count": 60},
+    {"category": "Tenses", "url": "https://www.sorukurdu.com/test-sorular/YDS-TENSES---TEST-6442-0.html", "count": 60},
+    {"category": "Tenses", "url": "https://www.sorukurdu.com/test-sorular/YDS-TENSES---TEST-7443-0.html", "count": 60},
+    
+    # Relative Clauses
+    {"category": "Relative Clauses", "url": "https://www.sorukurdu.com/test-sorular/YDS-RELATIVE-CLAUSES---TEST-1431-0.html", "count": 50},
+    {"category": "Relative Clauses", "url": "https://www.sorukurdu.com/test-sorular/YDS-RELATIVE-CLAUSES---TEST-2432-0.html", "count": 50},
+    {"category": "Relative Clauses", "url": "https://www.sorukurdu.com/test-sorular/YDS-RELATIVE-CLAUSES---TEST-3433-0.html", "count": 30},
+    {"category": "Relative Clauses", "url": "https://www.sorukurdu.com/test-sorular/YDS-RELATIVE-CLAUSES---TEST-4434-0.html", "count": 50},
+    {"category": "Relative Clauses", "url": "https://www.sorukurdu.com/test-sorular/YDS-RELATIVE-CLAUSES---TEST-5435-0.html", "count": 50},
+    {"category": "Relative Clauses", "url": "https://www.sorukurdu.com/test-sorular/YDS-RELATIVE-CLAUSES---TEST-6436-0.html", "count": 50},
+    
+    # Reductions
+    {"category": "Reductions", "url": "https://www.sorukurdu.com/test-sorular/YDS-REDUCTIONS---TEST-1427-0.html", "count": 15},
+    {"category": "Reductions", "url": "https://www.sorukurdu.com/test-sorular/YDS-REDUCTIONS---TEST-2428-0.html", "count": 15},
+    {"category": "Reductions", "url": "https://www.sorukurdu.com/test-sorular/YDS-REDUCTIONS---TEST-3429-0.html", "count": 40},
+    {"category": "Reductions", "url": "https://www.sorukurdu.com/test-sorular/YDS-REDUCTIONS---TEST-4430-0.html", "count": 50},
+    
+    # Passive
+    {"category": "Passive", "url": "https://www.sorukurdu.com/test-sorular/YDS-THE-PASSIVE---TEST-1419-0.html", "count": 43},
+    {"category": "Passive", "url": "https://www.sorukurdu.com/test-sorular/YDS-THE-PASSIVE---TEST-2420-0.html", "count": 35},
+    {"category": "Passive", "url": "https://www.sorukurdu.com/test-sorular/YDS-THE-PASSIVE---TEST-3421-0.html", "count": 45},
+    {"category": "Passive", "url": "https://www.sorukurdu.com/test-sorular/YDS-THE-PASSIVE---TEST-4422-0.html", "count": 50},
+    {"category": "Passive", "url": "https://www.sorukurdu.com/test-sorular/YDS-THE-PASSIVE---TEST-5423-0.html", "count": 35},
+    {"category": "Passive", "url": "https://www.sorukurdu.com/test-sorular/YDS-THE-PASSIVE---TEST-6424-0.html", "count": 35},
+    {"category": "Passive", "url": "https://www.sorukurdu.com/test-sorular/YDS-THE-PASSIVE---TEST-7425-0.html", "count": 45},
+    {"category": "Passive", "url": "https://www.sorukurdu.com/test-sorular/YDS-THE-PASSIVE---TEST-8426-0.html", "count": 50},
+    
+    # Nouns/Articles/Quantifiers/Pronouns
+    {"category": "Nouns", "url": "https://www.sorukurdu.com/test-sorular/YDS-NOUNS-ARTICLES-QUANTIFIERS-PRONOUNS---TEST-1414-0.html", "count": 20},
+    {"category": "Nouns", "url": "https://www.sorukurdu.com/test-sorular/YDS-NOUNS-ARTICLES-QUANTIFIERS-PRONOUNS---TEST-2415-0.html", "count": 55},
+    {"category": "Nouns", "url": "https://www.sorukurdu.com/test-sorular/YDS-NOUNS-ARTICLES-QUANTIFIERS-PRONOUNS---TEST-3416-0.html", "count": 40},
+    {"category": "Nouns", "url": "https://www.sorukurdu.com/test-sorular/YDS-NOUNS-ARTICLES-QUANTIFIERS-PRONOUNS---TEST-4417-0.html", "count": 40},
+    {"category": "Nouns", "url": "https://www.sorukurdu.com/test-sorular/YDS-NOUNS-ARTICLES-QUANTIFIERS-PRONOUNS---TEST-5418-0.html", "count": 60},
+    
+    # Noun Clauses
+    {"category": "Noun Clauses", "url": "https://www.sorukurdu.com/test-sorular/YDS-NOUN-CLAUSES---TEST-1410-0.html", "count": 45},
+    {"category": "Noun Clauses", "url": "https://www.sorukurdu.com/test-sorular/YDS-NOUN-CLAUSES---TEST-2411-0.html", "count": 50},
+    {"category": "Noun Clauses", "url": "https://www.sorukurdu.com/test-sorular/YDS-NOUN-CLAUSES---TEST-3412-0.html", "count": 55},
+    {"category": "Noun Clauses", "url": "https://www.sorukurdu.com/test-sorular/YDS-NOUN-CLAUSES---TEST-4413-0.html", "count": 72},
+    
+    # Modals
+    {"category": "Modals", "url": "https://www.sorukurdu.com/test-sorular/YDS-MODALS---TEST-1407-0.html", "count": 71},
+    {"category": "Modals", "url": "https://www.sorukurdu.com/test-sorular/YDS-MODALS---TEST-2408-0.html", "count": 50},
+    {"category": "Modals", "url": "https://www.sorukurdu.com/test-sorular/YDS-MODALS---TEST-3409-0.html", "count": 50},
+    
+    # Adjectives/Adverbs
+    {"category": "Adjectives Adverbs", "url": "https://www.sorukurdu.com/test-sorular/YDS-Gramer-Sorulari372-0.html", "count": 20},
+    {"category": "Adjectives Adverbs", "url": "https://www.sorukurdu.com/test-sorular/YDS-Adjectives-Adverbs-TEST2373-0.html", "count": 36},
+    {"category": "Adjectives Adverbs", "url": "https://www.sorukurdu.com/test-sorular/YDS-Adjectives-Adverbs-TEST3374-0.html", "count": 60},
+    {"category": "Adjectives Adverbs", "url": "https://www.sorukurdu.com/test-sorular/YDS-Adjectives-Adverbs-TEST4375-0.html", "count": 20},
+    {"category": "Adjectives Adverbs", "url": "https://www.sorukurdu.com/test-sorular/YDS-Adjectives-Adverbs-TEST5376-0.html", "count": 70},
+    
+    # Conjunctions/Transitions
+    {"category": "Conjunctions", "url": "https://www.sorukurdu.com/test-sorular/Conjunctions-Transitions-TEST1377-0.html", "count": 55},
+    {"category": "Conjunctions", "url": "https://www.sorukurdu.com/test-sorular/Conjunctions-Transitions-TEST2378-0.html", "count": 30},
+    {"category": "Conjunctions", "url": "https://www.sorukurdu.com/test-sorular/Conjunctions-Transitions-TEST3379-0.html", "count": 28},
+    {"category": "Conjunctions", "url": "https://www.sorukurdu.com/test-sorular/Conjunctions-Transitions-TEST4380-0.html", "count": 55},
+    {"category": "Conjunctions", "url": "https://www.sorukurdu.com/test-sorular/Conjunctions-Transitions-TEST5381-0.html", "count": 40},
+    {"category": "Conjunctions", "url": "https://www.sorukurdu.com/test-sorular/Conjunctions-Transitions-TEST6382-0.html", "count": 40},
+    
+    # Gerunds and Infinitives
+    {"category": "Gerunds Infinitives", "url": "https://www.sorukurdu.com/test-sorular/GERUNDS-AND-INFINITIVES---TEST-1383-0.html", "count": 42},
+    {"category": "Gerunds Infinitives", "url": "https://www.sorukurdu.com/test-sorular/GERUNDS-AND-INFINITIVES---TEST-2384-0.html", "count": 40},
+    {"category": "Gerunds Infinitives", "url": "https://www.sorukurdu.com/test-sorular/GERUNDS-AND-INFINITIVES---TEST-3385-0.html", "count": 40},
+    {"category": "Gerunds Infinitives", "url": "https://www.sorukurdu.com/test-sorular/GERUNDS-AND-INFINITIVES---TEST-4386-0.html", "count": 35},
+    {"category": "Gerunds Infinitives", "url": "https://www.sorukurdu.com/test-sorular/GERUNDS-AND-INFINITIVES---TEST-5387-0.html", "count": 40},
+    {"category": "Gerunds Infinitives", "url": "https://www.sorukurdu.com/test-sorular/GERUNDS-AND-INFINITIVES---TEST-6388-0.html", "count": 40},
+    
+    # Grammar Revision
+    {"category": "Grammar Revision", "url": "https://www.sorukurdu.com/test-sorular/YDS-GRAMMAR-REVISION-TEST-1389-0.html", "count": 100},
+    {"category": "Grammar Revision", "url": "https://www.sorukurdu.com/test-sorular/YDS-GRAMMAR-REVISION-TEST-2390-0.html", "count": 100},
+    {"category": "Grammar Revision", "url": "https://www.sorukurdu.com/test-sorular/YDS-GRAMMAR-REVISION-TEST-3391-0.html", "count": 100},
+    {"category": "Grammar Revision", "url": "https://www.sorukurdu.com/test-sorular/YDS-GRAMMAR-REVISION-TEST-4392-0.html", "count": 100},
+    {"category": "Grammar Revision", "url": "https://www.sorukurdu.com/test-sorular/YDS-GRAMMAR-REVISION-TEST-5393-0.html", "count": 100},
+    {"category": "Grammar Revision", "url": "https://www.sorukurdu.com/test-sorular/YDS-GRAMMAR-REVISION-TEST-6394-0.html", "count": 100},
+    {"category": "Grammar Revision", "url": "https://www.sorukurdu.com/test-sorular/YDS-GRAMMAR-REVISION-TEST-7395-0.html", "count": 100},
+    {"category": "Grammar Revision", "url": "https://www.sorukurdu.com/test-sorular/YDS-GRAMMAR-REVISION-TEST-8398-0.html", "count": 100},
+    {"category": "Grammar Revision", "url": "https://www.sorukurdu.com/test-sorular/YDS-GRAMMAR-REVISION-TEST-9399-0.html", "count": 100},
+    {"category": "Grammar Revision", "url": "https://www.sorukurdu.com/test-sorular/YDS-GRAMMAR-REVISION-TEST-10400-0.html", "count": 100},
+    {"category": "Grammar Revision", "url": "https://www.sorukurdu.com/test-sorular/YDS-GRAMMAR-REVISION-TEST-11401-0.html", "count": 100},
+    
+    # If Clauses
+    {"category": "If Clauses", "url": "https://www.sorukurdu.com/test-sorular/YDS-IF-CLAUSES---TEST-1402-0.html", "count": 50},
+    {"category": "If Clauses", "url": "https://www.sorukurdu.com/test-sorular/YDS-IF-CLAUSES---TEST-2403-0.html", "count": 55},
+    {"category": "If Clauses", "url": "https://www.sorukurdu.com/test-sorular/YDS-IF-CLAUSES---TEST-3404-0.html", "count": 70},
+    {"category": "If Clauses", "url": "https://www.sorukurdu.com/test-sorular/YDS-IF-CLAUSES---TEST-4405-0.html", "count": 65},
+]
+
+# YDS Kategori URL'leri
+YDS_CATEGORIES = [
+    {"name": "İlgisiz Cümleyi Bulma", "url": "https://www.sorukurdu.com/sorular-kategori/YDS-Ilgisiz-Cumleyi-Bulma140.html"},
+    {"name": "Çeviri Soruları", "url": "https://www.sorukurdu.com/sorular-kategori/YDS-Ceviri-Sorulari141.html"},
+    {"name": "Cümle Tamamlama", "url": "https://www.sorukurdu.com/sorular-kategori/YDS-Cumle-Tamamlama-Sorulari142.html"},
+    {"name": "Diyalog", "url": "https://www.sorukurdu.com/sorular-kategori/YDS-DIYALOG143.html"},
+    {"name": "Durum", "url": "https://www.sorukurdu.com/sorular-kategori/YDS-Durum144.html"},
+    {"name": "Eş Anlam", "url": "https://www.sorukurdu.com/sorular-kategori/YDS-Es-Anlam145.html"},
+    {"name": "Paragraf Doldurma", "url": "https://www.sorukurdu.com/sorular-kategori/YDS-Paragraf-Doldurma146.html"},
+    {"name": "Phrasal Verbs Prepositions", "url": "https://www.sorukurdu.com/sorular-kategori/YDS-Phrasal-Verbs-Prepositions.html"},
+    {"name": "Kelime Soruları", "url": "https://www.sorukurdu.com/sorular-kategori/YDS-Kelime-Sorulari148.html"},
+    {"name": "Okuma Soruları", "url": "https://www.sorukurdu.com/sorular-kategori/YDS-Okuma-Sorulari149.html"},
+]
@@ -1,22 +1,25 @@
 import asyncio
 from playwright.async_api import async_playwright
-import json
 import re
 from datetime import datetime
 
-# YDS Kategori URL'leri
-YDS_CATEGORIES = [
-    {"name": "İlgisiz Cümleyi Bulma", "url": "https://www.sorukurdu.com/sorular-kategori/YDS-Ilgisiz-Cumleyi-Bulma140.html"},
-    {"name": "Çeviri Soruları", "url": "https://www.sorukurdu.com/sorular-kategori/YDS-Ceviri-Sorulari141.html"},
-    {"name": "Cümle Tamamlama", "url": "https://www.sorukurdu.com/sorular-kategori/YDS-Cumle-Tamamlama-Sorulari142.html"},
-    {"name": "Diyalog", "url": "https://www.sorukurdu.com/sorular-kategori/YDS-DIYALOG143.html"},
-    {"name": "Durum", "url": "https://www.sorukurdu.com/sorular-kategori/YDS-Durum144.html"},
-    {"name": "Eş Anlam", "url": "https://www.sorukurdu.com/sorular-kategori/YDS-Es-Anlam145.html"},
-    {"name": "Paragraf Doldurma", "url": "https://www.sorukurdu.com/sorular-kategori/YDS-Paragraf-Doldurma146.html"},
-    {"name": "Phrasal Verbs Prepositions", "url": "https://www.sorukurdu.com/sorular-kategori/YDS-Phrasal-Verbs-Prepositions.html"},
-    {"name": "Kelime Soruları", "url": "https://www.sorukurdu.com/sorular-kategori/YDS-Kelime-Sorulari148.html"},
-    {"name": "Okuma Soruları", "url": "https://www.sorukurdu.com/sorular-kategori/YDS-Okuma-Sorulari149.html"},
-]
+from scripts import jsonio
+from scripts.scrapers.browser_service import open_browser
+from scripts.scrapers.crawler import (
+    CategoryExtractor,
+    Crawler,
+    CrawlStore,
+    QuestionExtractor,
+    TestExtractor,
+    state_path,
+)
+from scripts.scrapers.html_archive import HtmlArchive, archive_path
+from scripts.scrapers.http_client import HttpClient
+from scripts.scrapers.navigation import goto_and_wait
+from scripts.scrapers.negative_cache import NEGATIVE_CACHE_NAME, NegativeCache
+from scripts.scrapers.page_pool import DEFAULT_PER_HOST, PagePool
+from scripts.scrapers.question_page import QuestionFetcher
+from scripts.scrapers.sources import BASE_URL, YDS_CATEGORIES
 
 CONCURRENT_LIMIT = 5
 
@@ -25,8 +28,7 @@ async def get_test_links_from_category(page, category_url: str) -> list:
     """Kategori sayfasından test linklerini çıkar"""
     tests = []
     try:
-        await page.goto(category_url, wait_until="networkidle", timeout=30000)
-        await asyncio.sleep(1)
+        await goto_and_wait(page, category_url, "a[href*='test-sorular']")
         
         # Test linklerini bul (test-sorular içeren linkler)
         links = await page.query_selector_all("a[href*='test-sorular']")
@@ -42,7 +44,7 @@ async def get_test_links_from_category(page, category_url: str) -> list:
                 
                 # URL'yi tam hale getir
                 if not href.startswith("http"):
-                    href = "https://www.sorukurdu.com" + href
+                    href = BASE_URL + href
                 
                 # Duplicate kontrolü
                 if not any(t["url"] == href for t in tests):
@@ -60,170 +62,13 @@ async def get_test_links_from_category(page, category_url: str) -> list:
     return tests
 
 
-async def scrape_single_question(page, get_answer: bool = False) -> dict:
-    """Açık sayfadan soru bilgilerini çıkar"""
-    result = {
-        "question_number": "",
-        "question_text": "",
-        "options": [],
-        "correct_answer": None
-    }
-    
-    try:
-        fieldset = await page.query_selector("#commentForm fieldset")
-        if fieldset:
-            fieldset_html = await fieldset.inner_html()
-            
-            # Soru numarası
-            num_match = re.search(r'<div[^>]*font-weight[^>]*bold[^>]*>([^<]+)</div>', fieldset_html)
-            if num_match:
-                result["question_number"] = num_match.group(1).strip()
-            
-            # Soru metni
-            text_match = re.search(r'<div[^>]*width:\s*590px[^>]*>(.*?)</div>', fieldset_html, re.DOTALL)
-            if text_match:
-                text = text_match.group(1)
-                text = text.replace("<br>", "\n").replace("<br/>", "\n")
-                text = re.sub(r'<[^>]+>', '', text)
-                result["question_text"] = text.strip()
-        
-        # Şıklar
-        option_elems = await page.query_selector_all(".custom-radio")
-        for opt in option_elems:
-            input_elem = await opt.query_selector("input[type='radio']")
-            label_elem = await opt.query_selector("label")
-            if input_elem and label_elem:
-                value = await input_elem.get_attribute("value")
-                label_html = await label_elem.inner_html()
-                label_text = label_html.replace("<br>", "").replace("<br/>", "").strip()
-                label_text = re.sub(r'<[^>]+>', '', label_text).strip()
-                result["options"].append({
-                    "letter": value,
-                    "text": label_text
-                })
-                
-    except Exception as e:
-        pass
-    
-    return result
-
-
-async def scrape_test_questions(browser, test_info: dict, category: str, semaphore: asyncio.Semaphore, progress: dict) -> list:
-    """Bir testteki tüm soruları kazır"""
-    questions = []
-    base_url = test_info["url"]
-    count = test_info["count"]
-    
-    if count == 0:
-        return questions
-    
-    # URL pattern: xxx-0.html -> xxx-1.html, xxx-2.html, ...
-    pattern = r'(.*-)(\d+)(\.html.*)'
-    match = re.match(pattern, base_url)
-    if not match:
-        return questions
-    
-    url_prefix = match.group(1)
-    url_suffix = match.group(3)
-    
-    async with semaphore:
-        page = await browser.new_page()
-        try:
-            for i in range(1, count + 1):
-                url = f"{url_prefix}{i}{url_suffix}"
-                
-                try:
-                    await page.goto(url, wait_until="networkidle", timeout=30000)
-                    await asyncio.sleep(0.3)
-                    
-                    q = await scrape_single_question(page)
-                    q["url"] = url
-                    q["index"] = i
-                    q["category"] = category
-                    q["test_name"] = test_info["name"]
-                    q["test_url"] = base_url
-                    questions.append(q)
-                    
-                    progress["done"] += 1
-                    
-                except Exception as e:
-                    questions.append({
-                        "index": i,
-                        "url": url,
-                        "category": category,
-                        "test_name": test_info["name"],
-                        "error": str(e)
-                    })
-                    progress["done"] += 1
-        finally:
-            await page.close()
-    
-    return questions
-
-
-async def scrape_category(browser, category_info: dict, semaphore: asyncio.Semaphore) -> dict:
-    """Bir kategorideki tüm testleri kazır"""
-    category_name = category_info["name"]
-    category_url = category_info["url"]
-    
-    print(f"\n{'='*60}")
-    print(f"Kategori: {category_name}")
-    print(f"URL: {category_url}")
-    
-    # Önce test linklerini al
-    page = await browser.new_page()
-    tests = await get_test_links_from_category(page, category_url)
-    await page.close()
-    
-    if not tests:
-        return {"category": category_name, "tests": [], "questions": []}
-    
-    total_questions = sum(t["count"] for t in tests)
-    print(f"  Toplam {total_questions} soru kazınacak")
-    
-    progress = {"done": 0, "total": total_questions}
-    start_time = datetime.now()
-    
-    # Progress reporter
-    async def report_progress():
-        while progress["done"] < progress["total"]:
-            pct = (progress["done"] / progress["total"]) * 100 if progress["total"] > 0 else 0
-            print(f"\r  İlerleme: {progress['done']}/{progress['total']} ({pct:.1f}%)", end="", flush=True)
-            await asyncio.sleep(2)
-        print()
-    
-    # Tüm testleri paralel kazı
-    progress_task = asyncio.create_task(report_progress())
-    
-    tasks = [
-        scrape_test_questions(browser, test, category_name, semaphore, progress)
-        for test in tests
-    ]
-    
-    results = await asyncio.gather(*tasks, return_exceptions=True)
-    progress_task.cancel()
-    
-    all_questions = []
-    for result in results:
-        if isinstance(result, list):
-            all_questions.extend(result)
-    
-    elapsed = (datetime.now() - start_time).total_seconds()
-    success = len([q for q in all_questions if q.get('question_text')])
-    print(f"  Tamamlandı: {success}/{len(all_questions)} soru ({elapsed:.1f}sn)")
-    
-    return {
-        "category": category_name,
-        "category_url": category_url,
-        "tests": tests,
-        "questions": all_questions,
-        "success_count": success,
-        "total_count": len(all_questions)
-    }
-
-
-async def scrape_all_categories(categories: list = None, concurrent: int = CONCURRENT_LIMIT):
-    """Tüm kategorileri kazır"""
+async def scrape_all_categories(categories: list = None, concurrent: int = CONCURRENT_LIMIT,
+                                per_host: int = DEFAULT_PER_HOST, state_file: str = None, archive_dir: str = None,
+                                negative_file: str = None):
+    """
+    Tüm kategorileri tek crawl'da kazır: kategori sayfaları, testler ve sorular
+    aynı URL frontier'ında (kategoriler sırayla değil eşzamanlı işlenir).
+    """
     if categories is None:
         categories = YDS_CATEGORIES
     
@@ -234,17 +79,58 @@ async def scrape_all_categories(categories: list = None, concurrent: int = CONCU
     print("="*60)
     
     start_time = datetime.now()
-    all_results = []
     
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
-        semaphore = asyncio.Semaphore(concurrent)
+    async with async_playwright() as p, HttpClient(max_connections=concurrent) as http:
+        browser = await open_browser(p)
+        pool = PagePool(browser, size=concurrent, per_host=per_host)
+        archive = HtmlArchive(archive_dir) if archive_dir else None
         
+        async def links_with_browser(category_url: str) -> list:
+            """Statik HTML'de test linki bulunamazsa kategori sayfasını tarayıcıda aç"""
+            async with pool.page(category_url) as page:
+                return await get_test_links_from_category(page, category_url)
+        
+        crawler = Crawler(
+            [
+                CategoryExtractor(http, fallback=links_with_browser),
+                TestExtractor(http),
+                QuestionExtractor(QuestionFetcher(http, pool, archive=archive)),
+            ],
+            store=CrawlStore(state_file),
+            negative=NegativeCache(negative_file) if negative_file else None,
+            workers=concurrent,
+            host_concurrency=per_host,
+        )
         for category in categories:
-            result = await scrape_category(browser, category, semaphore)
-            all_results.append(result)
+            crawler.add("category", category["url"], {"category": category["name"]})
         
-        await browser.close()
+        try:
+            records = await crawler.run()
+        finally:
+            if archive:
+                archive.close()
+            await pool.close()
+            await browser.close()
+    
+    # Kategori bazında sonuçları birleştir
+    tests_by_category = {r["name"]: r["tests"] for r in records["category"]}
+    questions_by_category = {}
+    for q in records["question"]:
+        questions_by_category.setdefault(q["category"], []).append(q)
+    
+    all_results = []
+    for category in categories:
+        questions = questions_by_category.get(category["name"], [])
+        success = len([q for q in questions if q.get('question_text')])
+        print(f"  {category['name']}: {success}/{len(questions)} soru")
+        all_results.append({
+            "category": category["name"],
+            "category_url": category["url"],
+            "tests": tests_by_category.get(category["name"], []),
+            "questions": questions,
+            "success_count": success,
+            "total_count": len(questions)
+        })
     
     elapsed = (datetime.now() - start_time).total_seconds()
     
@@ -265,7 +151,9 @@ async def main():
     output_dir = "yds_questions"
     os.makedirs(output_dir, exist_ok=True)
     
-    results = await scrape_all_categories()
+    results = await scrape_all_categories(state_file=state_path(output_dir, "yds_category_scraper"),
+                                          archive_dir=archive_path(output_dir),
+                                          negative_file=state_path(output_dir, NEGATIVE_CACHE_NAME))
     
     # Her kategori için ayrı dosya
     all_questions = []
@@ -286,8 +174,7 @@ async def main():
             "questions": result["questions"]
         }
         
-        with open(filename, "w", encoding="utf-8") as f:
-            json.dump(output, f, indent=2, ensure_ascii=False)
+        jsonio.dump(output, filename)
         
         print(f"✓ {filename} ({result['success_count']}/{result['total_count']} soru)")
         all_questions.extend(result["questions"])
@@ -302,8 +189,7 @@ async def main():
         "questions": all_questions
     }
     
-    with open(combined_file, "w", encoding="utf-8") as f:
-        json.dump(combined, f, indent=2, ensure_ascii=False)
+    jsonio.dump(combined, combined_file)
     
     print(f"\n✓ Birleşik dosya: {combined_file}")
     print(f"TOPLAM: {combined['success_count']}/{combined['total_questions']} soru")
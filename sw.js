@@ -2,6 +2,11 @@
 const CACHE_VERSION = 'v5';
 const STATIC_CACHE = `yds-static-${CACHE_VERSION}`;
 const API_CACHE = `yds-api-${CACHE_VERSION}`;
+// İçerik hash'li soru paketleri (scripts/export/static_bundles.py) — dosya adı
+// içerikle değiştiği için sürümden bağımsız, süresiz cache'lenir
+const BUNDLE_CACHE = 'yds-bundles';
+const BUNDLE_IMMUTABLE_PREFIXES = ['/bundles/shards/', '/bundles/patches/'];
+const BUNDLE_MANIFESTS = ['/bundles/manifest.json', '/bundles/versions.json'];
 
 // Statik asset'ler — Stale-While-Revalidate
 const STATIC_ASSETS = [
@@ -28,22 +33,53 @@ self.addEventListener('install', event => {
   );
 });
 
-// Activate — eski cache versiyonlarını temizle
+// Activate — eski cache versiyonlarını ve güncel manifest'te olmayan paketleri temizle
 self.addEventListener('activate', event => {
   event.waitUntil(
     caches.keys().then(cacheNames => {
       return Promise.all(
         cacheNames
-          .filter(name => name !== STATIC_CACHE && name !== API_CACHE)
+          .filter(name => name !== STATIC_CACHE && name !== API_CACHE && name !== BUNDLE_CACHE)
           .map(name => {
             console.log('SW: Deleting old cache:', name);
             return caches.delete(name);
           })
       );
-    }).then(() => self.clients.claim())
+    })
+      .then(() => pruneBundleCache().catch(error => console.log('SW: Bundle prune skipped:', error)))
+      .then(() => self.clients.claim())
   );
 });
 
+// BUNDLE_CACHE'ten manifest.json / versions.json'da listelenmeyen parça ve yamaları sil.
+// Manifest'lerden biri alınamazsa (çevrimdışı) neyin güncel olduğu bilinmediği için silinmez.
+async function pruneBundleCache() {
+  const cache = await caches.open(BUNDLE_CACHE);
+  const live = new Set();
+
+  for (const path of BUNDLE_MANIFESTS) {
+    const response = await fetch(path, { cache: 'no-cache' });
+    if (response.status === 404) continue; // Bu manifest hiç üretilmemiş
+    if (!response.ok) return;
+    await cache.put(path, response.clone());
+
+    const manifest = await response.json();
+    for (const group of [manifest.categories, manifest.presets, manifest.patches]) {
+      for (const entry of Object.values(group || {})) {
+        live.add(`/bundles/${entry.file}`);
+      }
+    }
+  }
+
+  const requests = await cache.keys();
+  const stale = requests.filter(request => {
+    const path = new URL(request.url).pathname;
+    return BUNDLE_IMMUTABLE_PREFIXES.some(prefix => path.startsWith(prefix)) && !live.has(path);
+  });
+  if (stale.length) console.log(`SW: Deleting ${stale.length} stale bundle(s)`);
+  await Promise.all(stale.map(request => cache.delete(request)));
+}
+
 // Fetch — strateji seçimi
 self.addEventListener('fetch', event => {
   const url = new URL(event.request.url);
@@ -60,6 +96,16 @@ self.addEventListener('fetch', event => {
     return;
   }
   
+  // Soru paketleri — içerik hash'li parçalar/yamalar Cache-First, manifest'ler Network-First
+  if (BUNDLE_IMMUTABLE_PREFIXES.some(prefix => url.pathname.startsWith(prefix))) {
+    event.respondWith(cacheFirstWithNetwork(event.request, BUNDLE_CACHE));
+    return;
+  }
+  if (BUNDLE_MANIFESTS.includes(url.pathname)) {
+    event.respondWith(networkFirstWithCache(event.request, BUNDLE_CACHE));
+    return;
+  }
+  
   // Harici kaynaklar (Google Fonts, CDN) — Cache-First
   if (url.origin !== self.location.origin) {
     event.respondWith(cacheFirstWithNetwork(event.request, STATIC_CACHE));